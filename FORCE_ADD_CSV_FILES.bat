@@ -43,11 +43,8 @@ echo.
 echo [4] Force adding ALL CSV files to git:
 echo ------------------------------------------------------------
 git add -f data\influenceurs_recommendation_ready.csv
-git add -f data\influenceurs_clean.csv
 git add -f data\Top_Influencers_Full_1500.csv
 git add -f api\data\influenceurs_recommendation_ready.csv
-git add -f data\*.json
-git add -f data\*.npy
 git add -f api\data\*.npy
 echo Done
 echo.
@@ -67,7 +64,6 @@ echo ------------------------------------------------------------
 git commit -m "PRODUCTION FIX: Add CSV data files required for recommender API
 
 - influenceurs_recommendation_ready.csv
-- influenceurs_clean.csv  
 - Top_Influencers_Full_1500.csv
 - Required for /api/recommend/ endpoint to work
 - Without these files, API returns 503 errors"
@@ -8,6 +8,8 @@ from typing import List, Dict, Any, Optional
 from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.preprocessing import StandardScaler, LabelEncoder
 
+# Matrice produite par: python manage.py prepare_recommender_data --stage features
+FEATURE_MATRIX_PATH = 'data/generated/feature_matrix.npy'
 
 
 class CosineSimilarityRecommender:
@@ -49,9 +51,9 @@ class RecommandationSystem:
         self.countries = self.df['country'].dropna().unique().tolist()
     
     def _load_or_create_features(self) -> np.ndarray:
-        """Charge ou crée la matrice de features"""
-        if os.path.exists('data/feature_matrix.npy'):
-            return np.load('data/feature_matrix.npy')
+        """Charge la matrice du pipeline (prepare_recommender_data) ou en crée une"""
+        if os.path.exists(FEATURE_MATRIX_PATH):
+            return np.load(FEATURE_MATRIX_PATH)
         else:
             print("⚠️  Création de la matrice de features...")
             return self._create_features()
@@ -90,10 +92,7 @@ class RecommandationSystem:
             
             X = np.random.randn(len(self.df), 5)
         
-       
-        os.makedirs('data', exist_ok=True)
-        np.save('data/feature_matrix.npy', X)
-        
+        # Pas de sauvegarde : data/generated/ ne contient que les sorties du pipeline
         return X
     
     def recommend_for_brand(self, category: str, country: str, n: int = 5) -> Dict[str, Any]:
@@ -420,7 +419,7 @@ if __name__ == "__main__":
     print("="*60)
     print("\n Fichiers utilisés:")
     print("   • data/influenceurs_recommendation_ready.csv")
-    print("   • data/feature_matrix.npy")
+    print(f"   • {FEATURE_MATRIX_PATH}")
     print("\n Prochaines étapes:")
     print("   1. Tester avec différentes catégories/pays")
     print("   2. Intégrer dans une API Flask/FastAPI")
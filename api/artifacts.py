@@ -0,0 +1,316 @@
+"""
+Artefact binaire du recommandeur Brandfluence.
+
+Un artefact est un répertoire versionné contenant :
+    - features.npy : vecteurs de features normalisés L2 (float32)
+    - <colonne>.npy : colonnes de métadonnées (noms, catégorie, pays, followers...)
+    - vocab.json : vocabulaires catégorie/pays
+    - manifest.json : version, source, dimensions et liste des fichiers
+
+Il est produit hors ligne (`python manage.py build_recommender_artifact`) puis
+ouvert par les workers avec np.load(mmap_mode='r') : toutes les pages sont
+partagées via le page cache de l'OS au lieu d'être dupliquées par worker.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler, LabelEncoder
+
+from .similarity import normalize_rows
+
+# Incrémenter si la structure des fichiers change
+ARTIFACT_FORMAT = 1
+
+CURRENT_FILE = 'CURRENT'
+MANIFEST_FILE = 'manifest.json'
+VOCAB_FILE = 'vocab.json'
+
+# Colonnes stockées chacune dans un fichier <nom>.npy
+COLUMN_NAMES = [
+    'features',
+    'names',
+    'category',
+    'country',
+    'category_codes',
+    'country_codes',
+    'followers',
+    'engagement_rate',
+    'global_score',
+]
+
+# Colonnes écrites seulement si présentes dans le CSV préparé (score pondéré)
+OPTIONAL_COLUMN_NAMES = [
+    'engagement_rate_normalized',
+    'followers_normalized',
+]
+
+
+class ArtifactNotFound(Exception):
+    """Aucun artefact exploitable dans le répertoire demandé"""
+
+
+class ArtifactMismatch(ArtifactNotFound):
+    """Artefact présent mais incohérent avec son manifeste ou avec le CSV source actuel"""
+
+
+def candidate_data_paths(base_dir):
+    """Emplacements possibles du CSV préparé, par ordre de priorité"""
+    return [
+        os.path.join(base_dir, 'data', 'influenceurs_recommendation_ready.csv'),
+        os.path.join(base_dir, 'data', 'generated', 'influenceurs_clean.csv'),
+        os.path.join(base_dir, 'api', 'data', 'influenceurs_recommendation_ready.csv'),
+        'data/influenceurs_recommendation_ready.csv',
+        'api/data/influenceurs_recommendation_ready.csv',
+        '../data/influenceurs_recommendation_ready.csv',
+        '/app/data/influenceurs_recommendation_ready.csv',
+        '/app/api/data/influenceurs_recommendation_ready.csv'
+    ]
+
+
+def create_feature_matrix(df):
+    """Crée la matrice de features"""
+    scaler = StandardScaler()
+    features_list = []
+
+    # Normaliser les features numériques
+    for col in ['followers', 'engagement_rate', 'global_score']:
+        if col in df.columns:
+            normalized = scaler.fit_transform(df[[col]].fillna(0))
+            features_list.append(normalized)
+
+    # Encoder la catégorie
+    if 'category' in df.columns:
+        le = LabelEncoder()
+        category_encoded = le.fit_transform(df['category'].fillna('Unknown')).reshape(-1, 1)
+        features_list.append(category_encoded)
+
+    # Encoder le pays
+    if 'country' in df.columns:
+        le = LabelEncoder()
+        country_encoded = le.fit_transform(df['country'].fillna('Unknown')).reshape(-1, 1)
+        features_list.append(country_encoded)
+
+    return np.hstack(features_list) if features_list else np.random.randn(len(df), 5)
+
+
+def _encode(series):
+    """Codes entiers sur les valeurs normalisées en .title(); -1 pour les manquantes"""
+    codes, uniques = pd.factorize(series.str.title())
+    return codes.astype(np.int32), [str(value) for value in uniques]
+
+
+def build_columns(df):
+    """
+    Transforme le DataFrame préparé en colonnes NumPy prêtes à servir.
+
+    Returns:
+        Tuple (columns, vocab) : dict nom -> np.ndarray, et dict des vocabulaires
+    """
+    df = df.reset_index(drop=True)
+    category_codes, category_vocab = _encode(df['category'])
+    country_codes, country_vocab = _encode(df['country'])
+
+    if 'global_score' in df.columns:
+        global_score = df['global_score'].to_numpy(dtype=np.float64)
+    else:
+        global_score = np.zeros(len(df), dtype=np.float64)
+
+    columns = {
+        'features': normalize_rows(create_feature_matrix(df)),
+        'names': df['influencer_name'].astype(str).to_numpy(dtype=str),
+        'category': df['category'].astype(str).to_numpy(dtype=str),
+        'country': df['country'].astype(str).to_numpy(dtype=str),
+        'category_codes': category_codes,
+        'country_codes': country_codes,
+        'followers': df['followers'].to_numpy(dtype=np.int64),
+        'engagement_rate': df['engagement_rate'].to_numpy(dtype=np.float64),
+        'global_score': global_score,
+    }
+    for name in OPTIONAL_COLUMN_NAMES:
+        if name in df.columns:
+            columns[name] = df[name].to_numpy(dtype=np.float64)
+    vocab = {
+        'category': category_vocab,
+        'country': country_vocab,
+        'categories': sorted(df['category'].dropna().unique().tolist()),
+        'countries': sorted(df['country'].dropna().unique().tolist()),
+    }
+    return columns, vocab
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """Empreinte SHA-256 d'un fichier"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_artifact(root, columns, vocab, source=None, keep=3, indexes=None):
+    """
+    Écrit un nouvel artefact versionné sous `root` et le rend courant.
+
+    L'écriture se fait dans un répertoire temporaire renommé à la fin, puis
+    le fichier CURRENT est remplacé atomiquement : un worker ne voit jamais
+    d'artefact à moitié écrit. `indexes` ({backend: index construit}) est
+    sauvegardé sous index/<backend> avant la bascule, avec le reste.
+
+    Returns:
+        Chemin du répertoire de la nouvelle version
+    """
+    os.makedirs(root, exist_ok=True)
+
+    column_names = COLUMN_NAMES + [name for name in OPTIONAL_COLUMN_NAMES if name in columns]
+
+    digest = hashlib.sha256()
+    for name in column_names:
+        digest.update(np.ascontiguousarray(columns[name]).tobytes())
+    content_hash = digest.hexdigest()
+    version = f"{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}-{content_hash[:8]}"
+
+    tmp_dir = os.path.join(root, f'.tmp-{version}')
+    version_dir = os.path.join(root, version)
+    os.makedirs(tmp_dir)
+
+    files = {}
+    for name in column_names:
+        array = np.ascontiguousarray(columns[name])
+        np.save(os.path.join(tmp_dir, f'{name}.npy'), array, allow_pickle=False)
+        files[name] = {'dtype': array.dtype.str, 'shape': list(array.shape)}
+
+    with open(os.path.join(tmp_dir, VOCAB_FILE), 'w', encoding='utf-8') as f:
+        json.dump(vocab, f, ensure_ascii=False, indent=2)
+
+    for backend, index in (indexes or {}).items():
+        index.save(os.path.join(tmp_dir, 'index', backend))
+
+    manifest = {
+        'format': ARTIFACT_FORMAT,
+        'version': version,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'content_sha256': content_hash,
+        'rows': int(len(columns['names'])),
+        'n_features': int(columns['features'].shape[1]),
+        'source': source,
+        'files': files,
+    }
+    with open(os.path.join(tmp_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    os.replace(tmp_dir, version_dir)
+
+    current_tmp = os.path.join(root, f'.{CURRENT_FILE}.tmp')
+    with open(current_tmp, 'w', encoding='utf-8') as f:
+        f.write(version)
+    os.replace(current_tmp, os.path.join(root, CURRENT_FILE))
+
+    prune_artifacts(root, keep=keep)
+    return version_dir
+
+
+def list_versions(root):
+    """Versions présentes sous `root`, de la plus ancienne à la plus récente"""
+    if not os.path.isdir(root):
+        return []
+    return sorted(
+        name for name in os.listdir(root)
+        if not name.startswith('.') and os.path.isfile(os.path.join(root, name, MANIFEST_FILE))
+    )
+
+
+def prune_artifacts(root, keep=3):
+    """Supprime les anciennes versions en gardant les `keep` plus récentes (et la courante)"""
+    current = current_version(root)
+    versions = list_versions(root)
+    for version in versions[:max(len(versions) - keep, 0)]:
+        if version != current:
+            shutil.rmtree(os.path.join(root, version), ignore_errors=True)
+
+
+def current_version(root):
+    """Version pointée par le fichier CURRENT, ou None"""
+    try:
+        with open(os.path.join(root, CURRENT_FILE), encoding='utf-8') as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def check_source(manifest):
+    """
+    Vérifie que le CSV source de l'artefact n'a pas changé depuis sa construction.
+
+    Un source absent (artefact construit sur une autre machine) n'est pas vérifié.
+
+    Raises:
+        ArtifactMismatch: si l'empreinte du CSV source a changé
+    """
+    source = manifest.get('source') or {}
+    path = source.get('path')
+    if not path or not source.get('sha256') or not os.path.exists(path):
+        return
+    if file_sha256(path) != source['sha256']:
+        raise ArtifactMismatch(
+            f"Artifact {manifest['version']} is stale: {path} changed since it was built"
+        )
+
+
+def load_artifact(root, version=None, verify_source=True):
+    """
+    Ouvre un artefact en mémoire partagée (np.load mmap_mode='r').
+
+    Les colonnes doivent avoir le dtype et la forme annoncés par le manifeste
+    et, avec `verify_source`, le CSV source ne doit pas avoir changé.
+
+    Returns:
+        Tuple (columns, vocab, manifest)
+
+    Raises:
+        ArtifactNotFound: si aucun artefact valide n'est disponible
+        ArtifactMismatch: si l'artefact ne correspond pas à son manifeste ou à son source
+    """
+    version = version or current_version(root)
+    if version is None:
+        raise ArtifactNotFound(f'No recommender artifact in {root}')
+
+    version_dir = os.path.join(root, version)
+    try:
+        with open(os.path.join(version_dir, MANIFEST_FILE), encoding='utf-8') as f:
+            manifest = json.load(f)
+        with open(os.path.join(version_dir, VOCAB_FILE), encoding='utf-8') as f:
+            vocab = json.load(f)
+    except FileNotFoundError as e:
+        raise ArtifactNotFound(f'Incomplete recommender artifact {version_dir}: {e}')
+
+    if manifest.get('format') != ARTIFACT_FORMAT:
+        raise ArtifactNotFound(
+            f"Unsupported artifact format {manifest.get('format')} (expected {ARTIFACT_FORMAT})"
+        )
+
+    columns = {}
+    for name in COLUMN_NAMES + OPTIONAL_COLUMN_NAMES:
+        path = os.path.join(version_dir, f'{name}.npy')
+        if not os.path.exists(path):
+            if name in OPTIONAL_COLUMN_NAMES:
+                continue
+            raise ArtifactNotFound(f'Missing column {name} in {version_dir}')
+        columns[name] = np.load(path, mmap_mode='r', allow_pickle=False)
+        expected = manifest.get('files', {}).get(name)
+        if expected and (columns[name].dtype.str != expected['dtype']
+                         or list(columns[name].shape) != expected['shape']):
+            raise ArtifactMismatch(
+                f"Column {name} of {version_dir} does not match the manifest "
+                f"({columns[name].dtype.str} {list(columns[name].shape)}, "
+                f"expected {expected['dtype']} {expected['shape']})"
+            )
+
+    if verify_source:
+        check_source(manifest)
+    return columns, vocab, manifest
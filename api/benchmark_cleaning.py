@@ -0,0 +1,130 @@
+"""
+Parité et vitesse du nettoyage vectorisé (clean_frame) face aux fonctions
+ligne à ligne de clean_and_import (clean_followers, clean_numeric_k,
+clean_engagement, clean_category, extract_name_from_channel).
+
+Chaque colonne de l'export brut, complétée de valeurs limites, est nettoyée
+des deux façons et comparée valeur par valeur. Le mode par lots de
+clean_csv doit donner exactement le même DataFrame que la lecture entière.
+Le script sort avec le code 1 à la première différence.
+
+Usage (depuis la racine du projet) :
+    python -m api.benchmark_cleaning
+    python -m api.benchmark_cleaning --scale 100 --chunksize 20000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from api.clean_and_import import (
+    RAW_TEXT_COLUMNS,
+    choose_engagement_column,
+    clean_category,
+    clean_csv,
+    clean_engagement,
+    clean_followers,
+    clean_numeric_k,
+    extract_name_from_channel,
+    names_from_channels,
+    normalize_categories,
+    parse_counts,
+    parse_engagement,
+)
+
+# Valeurs limites ajoutées aux colonnes de l'export
+EDGE_CASES = {
+    'counts': ['1.2m', '540k', '1,234', ' 2.3K ', '1.0b', '2.3k', '-3k', '12', '0.29k',
+               'abc', '', 'nan', 'inf', '1.2km', 'k5', '1 000', None],
+    'engagement': ['8.5%', ' 12.345 %', '101', '-1', 'x', '0', '100', '2.675', '', None],
+    'category': [' technology ', 'FASHION', 'tech', 'beauty & care', '', None],
+    'channel': ['style11910_vlog', 'MUSIC_TV', 'city', 'a-b_c_hd', '433', 'x_vlogs',
+                'daily12_Official', '12345', 'ab', '_tv', None],
+}
+
+
+def same_values(vectorised, reference):
+    """Positions où les deux séries diffèrent (NaN/None considérés égaux)"""
+    reference = pd.Series(list(reference), index=vectorised.index, dtype=object)
+    missing = vectorised.isna().to_numpy()
+    reference_missing = reference.isna().to_numpy()
+    equal = np.array([
+        a == b for a, b, skip in zip(vectorised.astype(object), reference, missing | reference_missing) if not skip
+    ], dtype=bool)
+    different = np.ones(len(vectorised), dtype=bool)
+    different[missing & reference_missing] = False
+    different[~(missing | reference_missing)] = ~equal
+    return np.flatnonzero(different)
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--csv', default='data/Top_Influencers_Full_1500.csv')
+    parser.add_argument('--scale', type=int, default=20, help="Nombre de copies de l'export")
+    parser.add_argument('--chunksize', type=int, default=5_000)
+    args = parser.parse_args()
+
+    raw = pd.read_csv(args.csv, dtype={column: str for column in RAW_TEXT_COLUMNS})
+    raw = pd.concat([raw] * args.scale, ignore_index=True)
+    engagement_column = choose_engagement_column(raw)
+
+    def with_edges(series, kind):
+        return pd.concat([series, pd.Series(EDGE_CASES[kind], dtype=object)], ignore_index=True)
+
+    checks = [
+        ('Followers', with_edges(raw['Followers'], 'counts'), clean_followers, parse_counts),
+        ('Posts', with_edges(raw['Posts'], 'counts'), clean_numeric_k, parse_counts),
+        ('Avg. Likes', with_edges(raw['Avg. Likes'], 'counts'), clean_numeric_k, parse_counts),
+        ('Avg Comments', with_edges(raw['Avg Comments'], 'counts'), clean_numeric_k, parse_counts),
+        (engagement_column, with_edges(raw[engagement_column], 'engagement'), clean_engagement, parse_engagement),
+        ('Category', with_edges(raw['Category'], 'category'), clean_category, normalize_categories),
+        ('Channel Info', with_edges(raw['Channel Info'], 'channel'), extract_name_from_channel, names_from_channels),
+    ]
+
+    print(f" Parité du nettoyage ({len(raw):,} lignes brutes + valeurs limites)")
+    print(f"{'colonne':>20} | {'apply':>9} | {'vectorisé':>9} | {'speedup':>7} | différences")
+    print("-" * 70)
+    failures = 0
+    for column, series, row_function, vectorised_function in checks:
+        reference, apply_ms = timed(series.apply, row_function)
+        vectorised, vectorised_ms = timed(vectorised_function, series)
+        different = same_values(vectorised, reference)
+        failures += len(different)
+        print(f"{column:>20} | {apply_ms:>6.1f} ms | {vectorised_ms:>6.1f} ms | "
+              f"x{apply_ms / vectorised_ms:>6.1f} | {len(different)}")
+        for position in different[:5]:
+            print(f"{'':>22} {series.iloc[position]!r}: {reference.iloc[position]!r} != {vectorised.iloc[position]!r}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'raw.csv')
+        raw.to_csv(path, index=False)
+        whole, whole_ms = timed(clean_csv, path)
+        chunked, chunked_ms = timed(clean_csv, path, args.chunksize)
+    try:
+        pd.testing.assert_frame_equal(whole, chunked)
+        same = 'oui'
+    except AssertionError:
+        failures += 1
+        same = 'NON'
+    print(f"\n clean_csv entier : {whole_ms:.0f} ms, par lots de {args.chunksize:,} : {chunked_ms:.0f} ms "
+          f"(identiques : {same})")
+
+    if failures:
+        print(f"\n {failures} différence(s)")
+        sys.exit(1)
+    print("\n ✓ Nettoyage vectorisé identique aux fonctions ligne à ligne")
+
+
+if __name__ == '__main__':
+    main()
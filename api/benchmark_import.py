@@ -0,0 +1,138 @@
+"""
+Benchmark du chargement de influenceurs_clean.csv : INSERT ligne par ligne
+(comportement de DataFrame.to_sql) contre le chargeur par lots de
+import_to_postgres (COPY + fusion ON CONFLICT sur PostgreSQL, executemany
+sur SQLite).
+
+Le CSV est répliqué --scale fois (clés distinctes) dans un fichier
+temporaire. Sans --dsn, ou si PostgreSQL est injoignable, le benchmark
+utilise une base SQLite temporaire. Une seconde passe du chargeur vérifie
+que la relance est idempotente (même nombre de lignes).
+
+Usage (depuis la racine du projet) :
+    python -m api.benchmark_import
+    python -m api.benchmark_import --scale 60 --chunk-size 20000
+    python -m api.benchmark_import --dsn "dbname=brandfluence user=postgres password=0000 host=localhost"
+"""
+
+import argparse
+import logging
+import os
+import sqlite3
+import tempfile
+import time
+
+import pandas as pd
+
+from api.import_to_postgres import INFLUENCER_COLUMNS, get_loader
+
+BENCH_SCHEMA = 'bench_import'
+
+
+def scaled_csv(csv_path, scale, directory):
+    """CSV répliqué `scale` fois, les noms suffixés pour garder des clés distinctes"""
+    df = pd.read_csv(csv_path)
+    copies = []
+    for copy in range(scale):
+        part = df.copy()
+        part['influencer_name'] = part['influencer_name'].astype(str) + f'_{copy}'
+        copies.append(part)
+    path = os.path.join(directory, 'influenceurs_bench.csv')
+    pd.concat(copies, ignore_index=True).to_csv(path, index=False)
+    return path
+
+
+def connect(dsn, directory):
+    """(connexion, schéma) : PostgreSQL si joignable, sinon SQLite temporaire"""
+    if dsn:
+        try:
+            import psycopg2
+            connection = psycopg2.connect(dsn)
+            with connection.cursor() as cursor:
+                cursor.execute(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE; CREATE SCHEMA {BENCH_SCHEMA}")
+            connection.commit()
+            return connection, BENCH_SCHEMA
+        except Exception as e:
+            print(f" PostgreSQL indisponible ({e}), repli sur SQLite")
+    return sqlite3.connect(os.path.join(directory, 'bench.sqlite3')), 'main'
+
+
+def row_by_row(loader, csv_path):
+    """Référence : catégories/pays relus en entier, un INSERT par influenceur"""
+    start = time.perf_counter()
+    df = pd.read_csv(csv_path)
+    cursor = loader.connection.cursor()
+    ph = loader.placeholder
+    for table, column, values in (('categories', 'category_name', df['category']),
+                                  ('countries', 'country_name', df['country'])):
+        for name in values.dropna().unique():
+            cursor.execute(
+                f"INSERT INTO {loader.table(table)} ({column}) VALUES ({ph}) ON CONFLICT ({column}) DO NOTHING",
+                (name,)
+            )
+    cursor.execute(f"SELECT category_name, category_id FROM {loader.table('categories')}")
+    category_ids = dict(cursor.fetchall())
+    cursor.execute(f"SELECT country_name, country_id FROM {loader.table('countries')}")
+    country_ids = dict(cursor.fetchall())
+    frame = loader.prepare(df, category_ids, country_ids).drop(columns='source_key')
+    frame = frame.astype(object).where(frame.notna(), None)
+    sql = (
+        f"INSERT INTO {loader.table('influenceurs_baseline')} ({', '.join(INFLUENCER_COLUMNS.values())}) "
+        f"VALUES ({', '.join([ph] * len(frame.columns))})"
+    )
+    for row in frame.itertuples(index=False, name=None):
+        cursor.execute(sql, row)
+    loader.connection.commit()
+    return len(frame), time.perf_counter() - start
+
+
+def count_rows(loader):
+    cursor = loader.connection.cursor()
+    cursor.execute(f"SELECT COUNT(*) FROM {loader.table('influenceurs')}")
+    return cursor.fetchone()[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--csv', default='data/generated/influenceurs_clean.csv')
+    parser.add_argument('--scale', type=int, default=20)
+    parser.add_argument('--chunk-size', type=int, default=10_000)
+    parser.add_argument('--dsn', default=None, help='Chaîne de connexion psycopg2 (défaut : SQLite temporaire)')
+    args = parser.parse_args()
+    # Progression par lot inutile ici
+    logging.getLogger('api.import_to_postgres').setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = scaled_csv(args.csv, args.scale, directory)
+        connection, schema = connect(args.dsn, directory)
+        try:
+            loader = get_loader(connection, schema, args.chunk_size)
+            loader.create_tables()
+            cursor = connection.cursor()
+            cursor.execute(
+                f"CREATE TABLE {loader.table('influenceurs_baseline')} AS "
+                f"SELECT * FROM {loader.table('influenceurs')} WHERE 1 = 0"
+            )
+            # Mêmes index que la table cible (hors source_key, absent de l'ancien import)
+            for column in ('followers', 'category_id', 'country_id', 'engagement_rate', 'influencer_name'):
+                cursor.execute(
+                    f"CREATE INDEX idx_baseline_{column} ON {loader.table('influenceurs_baseline')}({column})"
+                )
+            connection.commit()
+
+            vendor = 'sqlite' if isinstance(connection, sqlite3.Connection) else 'postgresql'
+            print(f" Benchmark import ({vendor}, {args.scale} x {args.csv}, lots de {args.chunk_size:,})")
+            print(f"{'méthode':>16} | {'lignes':>9} | {'durée':>9} | {'lignes/s':>10}")
+            print("-" * 54)
+            rows, seconds = row_by_row(loader, csv_path)
+            print(f"{'ligne par ligne':>16} | {rows:>9,} | {seconds:>7.2f} s | {rows / seconds:>10,.0f}")
+            for label in ('par lots', 'relance'):
+                stats = get_loader(connection, schema, args.chunk_size).load_csv(csv_path)
+                print(f"{label:>16} | {stats.rows:>9,} | {stats.seconds:>7.2f} s | {stats.rows / stats.seconds:>10,.0f}")
+            print(f"\n Idempotent : {'oui' if count_rows(loader) == rows else 'NON'} ({count_rows(loader):,} lignes)")
+        finally:
+            connection.close()
+
+
+if __name__ == '__main__':
+    main()
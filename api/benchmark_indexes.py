@@ -0,0 +1,76 @@
+"""
+Benchmark des index de similarité : recall@k et requêtes/seconde (QPS).
+
+La référence est l'index exact 'brute'. Chaque backend est mesuré sans
+filtre puis avec un masque (≈ un segment catégorie/pays).
+
+Usage (depuis la racine du projet) :
+    python -m api.benchmark_indexes
+    python -m api.benchmark_indexes --rows 100000 --features 5 --k 10 --queries 200
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from api.similarity import normalize_rows
+from api.similarity_index import INDEX_BACKENDS, get_index_class
+
+
+def run_queries(index, vectors, query_ids, k, mask):
+    """Exécute les requêtes et retourne (résultats, QPS)"""
+    results = []
+    start = time.perf_counter()
+    for idx in query_ids:
+        indices, _ = index.query(vectors[idx], k, mask)
+        results.append(indices)
+    elapsed = time.perf_counter() - start
+    return results, len(query_ids) / elapsed
+
+
+def recall_at_k(results, reference):
+    """Part moyenne des k voisins exacts retrouvés"""
+    hits = [
+        len(np.intersect1d(found, expected)) / max(len(expected), 1)
+        for found, expected in zip(results, reference)
+    ]
+    return float(np.mean(hits))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--features', type=int, default=5)
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--mask-ratio', type=float, default=0.1, help='Fraction of rows allowed by the filter mask')
+    parser.add_argument('--backends', nargs='+', default=sorted(INDEX_BACKENDS))
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    vectors = normalize_rows(rng.standard_normal((args.rows, args.features)))
+    query_ids = rng.integers(0, args.rows, size=args.queries)
+    mask = rng.random(args.rows) < args.mask_ratio
+
+    print(f" Benchmark index (rows={args.rows}, features={args.features}, k={args.k}, queries={args.queries})")
+    print(f"{'backend':>9} | {'build':>9} | {'recall':>7} | {'QPS':>9} | {'recall (mask)':>13} | {'QPS (mask)':>10}")
+    print("-" * 74)
+
+    exact = get_index_class('brute').build(vectors)
+    reference, _ = run_queries(exact, vectors, query_ids, args.k, None)
+    reference_masked, _ = run_queries(exact, vectors, query_ids, args.k, mask)
+
+    for backend in args.backends:
+        start = time.perf_counter()
+        index = get_index_class(backend).build(vectors)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        results, qps = run_queries(index, vectors, query_ids, args.k, None)
+        results_masked, qps_masked = run_queries(index, vectors, query_ids, args.k, mask)
+        print(f"{backend:>9} | {build_ms:>6.0f} ms | {recall_at_k(results, reference):>7.3f} | {qps:>9.0f} | "
+              f"{recall_at_k(results_masked, reference_masked):>13.3f} | {qps_masked:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""
+Micro-benchmark de latence par requête pour BrandfluenceRecommender.recommend.
+
+Compare l'ancienne implémentation (argsort complet + boucles df.iloc) à la
+version vectorisée (codes entiers + masques booléens + argpartition), sur le
+jeu de données réel (~1 700 lignes) et sur un jeu synthétique.
+
+Usage (depuis la racine du projet) :
+    python -m api.benchmark_recommend
+    python -m api.benchmark_recommend --synthetic-rows 100000 --repeats 20
+"""
+
+import argparse
+import os
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'brandfluence.settings')
+django.setup()
+
+import numpy as np
+import pandas as pd
+
+from api.views import BrandfluenceRecommender
+
+DATA_PATH = 'data/influenceurs_recommendation_ready.csv'
+
+
+def legacy_recommend(df, engine, category, country, n=5):
+    """Ancienne logique de recommend() : argsort complet et boucles df.iloc"""
+    category = str(category).strip().title()
+    country = str(country).strip().title()
+
+    mask = (df['category'].str.title() == category) & \
+           (df['country'].str.title() == country)
+    if not mask.any():
+        mask = df['category'].str.title() == category
+        if not mask.any():
+            return []
+    idx = df[mask]['global_score'].idxmax()
+
+    scores = engine.scores(idx)
+    similar_indices = np.argsort(scores)[::-1]
+    similar_indices = similar_indices[similar_indices != idx]
+    similarity_scores = scores[similar_indices]
+
+    filtered_indices = []
+    for inf_idx, score in zip(similar_indices, similarity_scores):
+        inf = df.iloc[inf_idx]
+        if str(inf['category']).title() == category and str(inf['country']).title() == country:
+            filtered_indices.append(inf_idx)
+            if len(filtered_indices) >= n:
+                break
+    if len(filtered_indices) < n:
+        for inf_idx, score in zip(similar_indices, similarity_scores):
+            if inf_idx in filtered_indices:
+                continue
+            inf = df.iloc[inf_idx]
+            if str(inf['category']).title() == category:
+                filtered_indices.append(inf_idx)
+                if len(filtered_indices) >= n:
+                    break
+    if len(filtered_indices) < n:
+        for inf_idx, score in zip(similar_indices, similarity_scores):
+            if inf_idx in filtered_indices:
+                continue
+            filtered_indices.append(inf_idx)
+            if len(filtered_indices) >= n:
+                break
+
+    return [
+        {
+            'id': int(i),
+            'name': str(df.iloc[i]['influencer_name']),
+            'followers': int(df.iloc[i]['followers']),
+        }
+        for i in filtered_indices[:n]
+    ]
+
+
+def synthetic_dataframe(n_rows, seed=42):
+    """Jeu de données synthétique avec les colonnes utilisées par le recommandeur"""
+    rng = np.random.default_rng(seed)
+    categories = ['Music', 'Travel', 'Fashion', 'Gaming', 'Fitness', 'Beauty', 'Tech', 'Unknown']
+    countries = ['France', 'Tunisia', 'United States', 'Brazil', 'India', 'Japan', 'Germany', 'Egypt',
+                 'Mexico', 'Turkey', 'Spain', 'Italy']
+    return pd.DataFrame({
+        'influencer_name': [f'Influencer_{i}' for i in range(n_rows)],
+        'category': rng.choice(categories, n_rows),
+        'country': rng.choice(countries, n_rows),
+        'followers': rng.integers(10_000, 50_000_000, n_rows),
+        'engagement_rate': rng.uniform(0.1, 15.0, n_rows),
+        'global_score': rng.random(n_rows),
+    })
+
+
+def time_per_request(fn, queries, repeats):
+    """Latence moyenne par requête (ms)"""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for category, country in queries:
+            fn(category, country)
+    return (time.perf_counter() - start) * 1000 / (repeats * len(queries))
+
+
+def run(label, df, repeats, n):
+    rec = BrandfluenceRecommender.from_dataframe(df)
+    # Mélange de requêtes : filtrage strict, catégorie seule (pays absent)
+    queries = [
+        (rec.categories[i % len(rec.categories)], rec.countries[i % len(rec.countries)])
+        for i in range(8)
+    ] + [(rec.categories[0], 'Atlantis')]
+
+    before = time_per_request(lambda c, p: legacy_recommend(df, rec.engine, c, p, n), queries, repeats)
+    after = time_per_request(lambda c, p: rec.recommend(c, p, n), queries, repeats)
+    print(f"{label:>22} | {len(df):>8} | {before:>10.3f} ms | {after:>9.3f} ms | x{before / after:>6.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--synthetic-rows', type=int, default=100_000)
+    parser.add_argument('--repeats', type=int, default=10)
+    parser.add_argument('--n', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f" Benchmark recommend() (n={args.n}, repeats={args.repeats})")
+    print(f"{'dataset':>22} | {'rows':>8} | {'before':>13} | {'after':>12} | {'speedup':>7}")
+    print("-" * 76)
+    if os.path.exists(DATA_PATH):
+        run('recommendation_ready', pd.read_csv(DATA_PATH), args.repeats, args.n)
+    run('synthetic', synthetic_dataframe(args.synthetic_rows), args.repeats, args.n)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark mémoire / latence : matrice de similarité dense vs moteur top-k.
+
+Usage (depuis la racine du projet) :
+    python -m api.benchmark_similarity
+    python -m api.benchmark_similarity --sizes 1700 10000 50000 --k 5
+"""
+
+import argparse
+import time
+
+import numpy as np
+from sklearn.metrics.pairwise import cosine_similarity
+
+from api.similarity import CosineTopKEngine
+
+# Au-delà, la matrice dense ne tient plus raisonnablement en mémoire
+DENSE_MAX_ROWS = 20_000
+
+
+def format_bytes(num):
+    """Formate une taille en octets"""
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if num < 1024:
+            return f"{num:.1f} {unit}"
+        num /= 1024
+    return f"{num:.1f} TB"
+
+
+def time_queries(fn, n_rows, repeats):
+    """Latence moyenne (ms) d'une requête top-k sur des lignes aléatoires"""
+    rng = np.random.default_rng(0)
+    queries = rng.integers(0, n_rows, size=repeats)
+    start = time.perf_counter()
+    for idx in queries:
+        fn(int(idx))
+    return (time.perf_counter() - start) * 1000 / repeats
+
+
+def benchmark(n_rows, n_features, k, repeats):
+    rng = np.random.default_rng(42)
+    X = rng.standard_normal((n_rows, n_features))
+
+    result = {'rows': n_rows}
+
+    # Moteur à la demande
+    start = time.perf_counter()
+    engine = CosineTopKEngine(X)
+    result['engine_build_ms'] = (time.perf_counter() - start) * 1000
+    result['engine_bytes'] = engine.nbytes
+    result['engine_query_ms'] = time_queries(lambda i: engine.top_k(i, k), n_rows, repeats)
+
+    # Matrice dense (comportement historique)
+    result['dense_bytes'] = n_rows * n_rows * 8
+    if n_rows <= DENSE_MAX_ROWS:
+        start = time.perf_counter()
+        dense = cosine_similarity(X)
+        result['dense_build_ms'] = (time.perf_counter() - start) * 1000
+        result['dense_query_ms'] = time_queries(
+            lambda i: np.argsort(dense[i])[::-1][1:k + 1], n_rows, repeats
+        )
+        del dense
+    else:
+        result['dense_build_ms'] = None
+        result['dense_query_ms'] = None
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_700, 10_000, 50_000, 100_000])
+    parser.add_argument('--features', type=int, default=5)
+    parser.add_argument('--k', type=int, default=5)
+    parser.add_argument('--repeats', type=int, default=200)
+    args = parser.parse_args()
+
+    print(f" Benchmark similarité (features={args.features}, k={args.k}, repeats={args.repeats})")
+    print(f"{'rows':>8} | {'dense mem':>10} | {'engine mem':>10} | {'dense build':>11} | "
+          f"{'dense q':>9} | {'engine build':>12} | {'engine q':>9}")
+    print("-" * 88)
+
+    for n_rows in args.sizes:
+        r = benchmark(n_rows, args.features, args.k, args.repeats)
+        dense_build = f"{r['dense_build_ms']:.1f} ms" if r['dense_build_ms'] is not None else 'skipped'
+        dense_query = f"{r['dense_query_ms']:.3f} ms" if r['dense_query_ms'] is not None else 'skipped'
+        print(f"{r['rows']:>8} | {format_bytes(r['dense_bytes']):>10} | {format_bytes(r['engine_bytes']):>10} | "
+              f"{dense_build:>11} | {dense_query:>9} | {r['engine_build_ms']:>9.1f} ms | "
+              f"{r['engine_query_ms']:>6.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Index catégoriel du catalogue d'influenceurs.
+
+Construit une seule fois au chargement : pour chaque catégorie et chaque pays
+(normalisés en .title()), la liste triée des rangs des influenceurs dans
+l'ordre décroissant de global_score. Une recherche devient alors un accès
+dictionnaire suivi d'une intersection de tableaux triés, sans parcourir le
+catalogue.
+"""
+
+import numpy as np
+
+
+class CatalogIndex:
+    """
+    Index {valeur normalisée: rangs triés} pour la catégorie et le pays.
+
+    Les rangs sont des positions dans `order` (row ids triés par global_score
+    décroissant) : une intersection de rangs reste donc triée par score.
+
+    Example:
+        index = CatalogIndex(category_codes, category_vocab,
+                             country_codes, country_vocab, global_score)
+        rows = index.lookup(category='Music', country='France')
+    """
+
+    def __init__(self, category_codes, category_vocab, country_codes, country_vocab, global_score):
+        scores = np.nan_to_num(np.asarray(global_score, dtype=np.float64), nan=-np.inf)
+        self.order = np.argsort(-scores, kind='stable')
+
+        self.by_category = self._build(np.asarray(category_codes)[self.order], category_vocab)
+        self.by_country = self._build(np.asarray(country_codes)[self.order], country_vocab)
+
+    @staticmethod
+    def _build(codes_by_rank, vocab):
+        """Groupe les rangs par valeur; flatnonzero les rend déjà triés"""
+        return {
+            value: np.flatnonzero(codes_by_rank == code)
+            for code, value in enumerate(vocab)
+        }
+
+    def ranks(self, category=None, country=None):
+        """Rangs correspondant aux filtres (None = pas de filtre sur ce champ)"""
+        result = None
+        for lookup, value in ((self.by_category, category), (self.by_country, country)):
+            if value is None:
+                continue
+            found = lookup.get(str(value).title())
+            if found is None:
+                return np.empty(0, dtype=np.intp)
+            result = found if result is None else np.intersect1d(result, found, assume_unique=True)
+        if result is None:
+            return np.arange(len(self.order))
+        return result
+
+    def lookup(self, category=None, country=None):
+        """Row ids correspondant aux filtres, triés par global_score décroissant"""
+        if category is None and country is None:
+            return self.order
+        return self.order[self.ranks(category, country)]
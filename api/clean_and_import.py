@@ -1,7 +1,6 @@
 
 import pandas as pd
 import numpy as np
-from sqlalchemy import create_engine
 import logging
 import sys
 import os
@@ -53,6 +52,33 @@ def clean_engagement(value):
     except:
         return None
 
+# Table de correspondance des catégories (après strip().title())
+CATEGORY_MAPPING = {
+    'Fashion': 'Fashion',
+    'Tech': 'Tech',
+    'Technology': 'Tech',
+    'Lifestyle': 'Lifestyle',
+    'Food': 'Food',
+    'Travel': 'Travel',
+    'Beauty': 'Beauty',
+    'Fitness': 'Fitness',
+    'Music': 'Music',
+    'Gaming': 'Gaming',
+    'Sports': 'Sports',
+    'Entertainment': 'Entertainment',
+    'Education': 'Education',
+    'Business': 'Business'
+}
+
+# Suffixes retirés de Channel Info pour en déduire un nom
+CHANNEL_SUFFIXES = [
+    '_vlog', '_tv', '_world', '_zone', '_lab', '_official',
+    '_vlogs', '_channel', '_show', '_network', '_media', '_hd'
+]
+
+# Noms extraits trop génériques pour être gardés
+GENERIC_CHANNEL_NAMES = ['', 'style', 'music', 'city', 'shop', 'eco', 'daily']
+
 def clean_category(cat):
     """Uniformise les catégories"""
     if pd.isna(cat):
@@ -60,25 +86,7 @@ def clean_category(cat):
     
     cat = str(cat).strip().title()
     
-   
-    mapping = {
-        'Fashion': 'Fashion',
-        'Tech': 'Tech',
-        'Technology': 'Tech',
-        'Lifestyle': 'Lifestyle',
-        'Food': 'Food',
-        'Travel': 'Travel',
-        'Beauty': 'Beauty',
-        'Fitness': 'Fitness',
-        'Music': 'Music',
-        'Gaming': 'Gaming',
-        'Sports': 'Sports',
-        'Entertainment': 'Entertainment',
-        'Education': 'Education',
-        'Business': 'Business'
-    }
-    
-    return mapping.get(cat, cat)
+    return CATEGORY_MAPPING.get(cat, cat)
 
 def extract_name_from_channel(channel_info):
     """Essaye d'extraire un nom depuis Channel Info"""
@@ -87,17 +95,11 @@ def extract_name_from_channel(channel_info):
     
     channel_str = str(channel_info)
     
-  
-    suffixes = [
-        '_vlog', '_tv', '_world', '_zone', '_lab', '_official', 
-        '_vlogs', '_channel', '_show', '_network', '_media', '_hd'
-    ]
-    
    
     channel_lower = channel_str.lower()
     
    
-    for suffix in suffixes:
+    for suffix in CHANNEL_SUFFIXES:
         if channel_lower.endswith(suffix):
           
             channel_str = channel_str[:len(channel_str)-len(suffix)]
@@ -115,7 +117,7 @@ def extract_name_from_channel(channel_info):
     channel_str = channel_str.strip().title()
     
   
-    if len(channel_str) < 2 or channel_str.lower() in ['', 'style', 'music', 'city', 'shop', 'eco', 'daily']:
+    if len(channel_str) < 2 or channel_str.lower() in GENERIC_CHANNEL_NAMES:
         return None
     
     return channel_str
@@ -144,6 +146,244 @@ def clean_numeric_k(value):
     except:
         return None
 
+# ---------------------------------------------------------------------------
+# Nettoyage vectorisé (mêmes règles que les fonctions ligne à ligne ci-dessus)
+# ---------------------------------------------------------------------------
+
+# Colonnes du CSV brut -> colonnes de travail
+RAW_COLUMNS = {
+    'Influencer Name': 'influencer_name',
+    'Followers': 'followers',
+    'Engagement Rate (%)': 'engagement_rate',
+    '60-Day Eng Rate': 'engagement_rate_60day',
+    'Category': 'category',
+    'Posts': 'posts',
+    'Country Or Region': 'country',
+    'Country': 'country_alt',
+    'Avg. Likes': 'avg_likes',
+    'Avg Comments': 'avg_comments',
+    'Influence Score': 'influence_score',
+    'Rank': 'rank',
+    'Username': 'username'
+}
+
+# Colonnes de influenceurs_clean.csv, dans l'ordre
+CLEAN_COLUMNS = [
+    'influencer_name', 'category', 'followers', 'posts', 'avg_likes', 'avg_comments',
+    'engagement_rate', 'country', 'influence_score', 'rank', 'username', 'Channel Info'
+]
+
+# Colonnes brutes lues comme texte : l'inférence de type de read_csv varie d'un lot à l'autre
+RAW_TEXT_COLUMNS = ['Influencer Name', 'Username', 'Channel Info', 'Category', 'Country Or Region', 'Country']
+
+# Multiplicateurs testés dans cet ordre (une valeur contenant 'k' et 'm' est traitée comme 'k')
+COUNT_SUFFIXES = [('k', 1_000), ('m', 1_000_000), ('b', 1_000_000_000)]
+
+# En dessous de ce nombre de taux renseignés, le taux sur 60 jours est utilisé
+MIN_ENGAGEMENT_VALUES = 500
+
+_CHANNEL_SUFFIX_RE = '(?i)(?:' + '|'.join(CHANNEL_SUFFIXES) + ')$'
+
+
+def _integers_like_apply(values):
+    """int64 si aucune valeur manquante, float64 sinon (comme Series.apply renvoyant int/None)"""
+    values = values.where(np.isfinite(values))
+    if values.notna().all():
+        return values.astype('int64')
+    return values.astype('float64')
+
+
+def _by_unique(series, transform):
+    """
+    Applique `transform` (vectorisé) aux seules valeurs distinctes de `series`.
+
+    Les exports répètent beaucoup les mêmes chaînes ('1.2m', 'Fashion') :
+    pd.factorize les regroupe en C, puis le résultat est redistribué par
+    index. Les valeurs manquantes donnent NaN.
+    """
+    codes, uniques = pd.factorize(series)
+    cleaned = transform(pd.Series(uniques, dtype=object)).astype(object).to_numpy()
+    # Code -1 (valeur manquante) -> dernier élément, NaN
+    cleaned = np.append(cleaned, np.nan)
+    return pd.Series(cleaned[codes], index=series.index, dtype=object)
+
+
+def _text_to_numbers(text):
+    """Comme float(), NaN si la chaîne n'est pas un nombre"""
+    return pd.to_numeric(text, errors='coerce').astype('float64')
+
+
+def _parse_count_strings(strings):
+    text = strings.astype(str).str.strip().str.lower().str.replace(r'[, ]', '', regex=True)
+    multiplier = pd.Series(1.0, index=text.index)
+    pending = pd.Series(True, index=text.index)
+    for letter, factor in COUNT_SUFFIXES:
+        # Comme str.replace(letter, '') : toutes les occurrences de la lettre retenue
+        matched = pending & text.str.contains(letter, regex=False)
+        text = text.mask(matched, text.str.replace(letter, '', regex=False))
+        multiplier = multiplier.mask(matched, float(factor))
+        pending &= ~matched
+    return np.trunc(_text_to_numbers(text) * multiplier)
+
+
+def parse_counts(series):
+    """Version vectorisée de clean_followers / clean_numeric_k ('1.2m' -> 1200000)"""
+    if pd.api.types.is_numeric_dtype(series):
+        return _integers_like_apply(np.trunc(series.astype('float64')))
+    return _integers_like_apply(_by_unique(series, _parse_count_strings).astype('float64'))
+
+
+def _round_like_python(values, digits):
+    """
+    round(value, digits) de Python : numpy arrondit value * 10**digits, ce
+    qui diffère près des demis (12.345) ; ces valeurs sont arrondies une à une.
+    """
+    rounded = values.round(digits)
+    scaled = values * 10 ** digits
+    near_half = (scaled - np.floor(scaled) - 0.5).abs() < 1e-6
+    if near_half.any():
+        rounded[near_half] = [round(value, digits) for value in values[near_half]]
+    return rounded
+
+
+def _parse_engagement_strings(strings):
+    return _text_to_numbers(strings.astype(str).str.replace('%', '', regex=False).str.strip())
+
+
+def parse_engagement(series):
+    """Version vectorisée de clean_engagement ('8.5%' -> 8.5, hors [0, 100] -> NaN)"""
+    if pd.api.types.is_numeric_dtype(series):
+        values = series.astype('float64')
+    else:
+        values = _by_unique(series, _parse_engagement_strings).astype('float64')
+    return _round_like_python(values.where(values.between(0, 100)), 2)
+
+
+def _normalize_category_strings(strings):
+    return strings.astype(str).str.strip().str.title().replace(CATEGORY_MAPPING)
+
+
+def normalize_categories(series):
+    """Version vectorisée de clean_category (table CATEGORY_MAPPING, 'Unknown' si absente)"""
+    return _by_unique(series, _normalize_category_strings).fillna('Unknown')
+
+
+def _channel_name_strings(strings):
+    names = (
+        strings.astype(str)
+        .str.replace(_CHANNEL_SUFFIX_RE, '', regex=True)
+        .str.replace(r'[_-]', ' ', regex=True)
+        .str.replace(r'\d+$', '', regex=True)
+        .str.strip()
+        .str.title()
+    )
+    return names.mask((names.str.len() < 2) | names.str.lower().isin(GENERIC_CHANNEL_NAMES))
+
+
+def names_from_channels(series):
+    """Version vectorisée de extract_name_from_channel (NaN quand aucun nom n'est déduit)"""
+    return _by_unique(series, _channel_name_strings)
+
+
+def choose_engagement_column(df):
+    """Colonne brute du taux d'engagement : 'Engagement Rate (%)' si assez renseignée, sinon le taux 60 jours"""
+    if 'Engagement Rate (%)' in df.columns and df['Engagement Rate (%)'].notna().sum() >= MIN_ENGAGEMENT_VALUES:
+        return 'Engagement Rate (%)'
+    if '60-Day Eng Rate' in df.columns:
+        return '60-Day Eng Rate'
+    return 'Engagement Rate (%)' if 'Engagement Rate (%)' in df.columns else None
+
+
+def clean_frame(df, engagement_column=None):
+    """
+    Nettoie un DataFrame brut (export Top_Influencers) ligne par ligne, sans apply.
+
+    Retourne les colonnes CLEAN_COLUMNS présentes ; les valeurs manquantes
+    qui dépendent de tout le jeu de données (médianes, moyennes par
+    catégorie) sont remplies ensuite par fill_missing. `engagement_column`
+    fixe la colonne du taux d'engagement (choisie sur `df` par défaut, à
+    fixer pour traiter un fichier par lots).
+    """
+    engagement_column = engagement_column or choose_engagement_column(df)
+    raw = df.rename(columns=RAW_COLUMNS)
+    clean = pd.DataFrame(index=df.index)
+
+    # Textes en object : un lot sans aucune valeur ne doit pas changer de type
+    if 'influencer_name' in raw.columns:
+        clean['influencer_name'] = raw['influencer_name'].astype(object)
+    if 'category' in raw.columns:
+        clean['category'] = normalize_categories(raw['category'])
+    for column in ['followers', 'posts', 'avg_likes', 'avg_comments']:
+        if column in raw.columns:
+            clean[column] = parse_counts(raw[column])
+    if engagement_column:
+        clean['engagement_rate'] = parse_engagement(df[engagement_column])
+    if 'country' in raw.columns and 'country_alt' in raw.columns:
+        clean['country'] = raw['country'].combine_first(raw['country_alt']).astype(object)
+    for column in ['influence_score', 'rank']:
+        if column in raw.columns:
+            clean[column] = raw[column]
+    for column in ['username', 'Channel Info']:
+        if column in raw.columns:
+            clean[column] = raw[column].astype(object)
+
+    # Nom manquant : username, puis nom déduit de Channel Info, puis 'Influenceur'
+    if 'influencer_name' in clean.columns:
+        if 'username' in clean.columns:
+            clean['influencer_name'] = clean['influencer_name'].fillna(clean['username'])
+        if 'Channel Info' in clean.columns:
+            missing = clean['influencer_name'].isna()
+            clean.loc[missing, 'influencer_name'] = names_from_channels(clean.loc[missing, 'Channel Info'])
+        clean['influencer_name'] = clean['influencer_name'].fillna('Influenceur')
+    return clean
+
+
+def fill_missing(clean_df):
+    """
+    Remplit les valeurs manquantes qui dépendent de tout le jeu de données :
+    followers (médiane de la catégorie), engagement (moyenne de la
+    catégorie), colonnes numériques (médiane), textes ('Unknown').
+    """
+    clean_df = clean_df.copy()
+    if 'category' in clean_df.columns:
+        for column, statistic in [('followers', 'median'), ('engagement_rate', 'mean')]:
+            if column in clean_df.columns and clean_df[column].isna().any():
+                by_category = clean_df.groupby('category')[column].transform(statistic)
+                global_value = getattr(clean_df[column], statistic)()
+                clean_df[column] = clean_df[column].fillna(by_category).fillna(global_value)
+        clean_df['category'] = clean_df['category'].fillna('General')
+    if 'country' in clean_df.columns:
+        clean_df['country'] = clean_df['country'].fillna('Unknown')
+    for column in ['posts', 'avg_likes', 'avg_comments', 'influence_score', 'rank']:
+        if column in clean_df.columns and clean_df[column].isna().any():
+            clean_df[column] = clean_df[column].fillna(clean_df[column].median())
+    for column in clean_df.select_dtypes(include=['object', 'string']).columns:
+        if column not in ['influencer_name', 'category', 'country']:
+            clean_df[column] = clean_df[column].fillna('Unknown')
+    return clean_df
+
+
+def clean_csv(csv_path, chunksize=None):
+    """
+    clean_frame + fill_missing sur un export CSV.
+
+    Avec `chunksize`, le fichier brut est lu et nettoyé par lots (seules les
+    colonnes nettoyées restent en mémoire) ; la colonne d'engagement est
+    choisie sur une première lecture de cette seule colonne.
+    """
+    dtype = {column: str for column in RAW_TEXT_COLUMNS}
+    if not chunksize:
+        return fill_missing(clean_frame(pd.read_csv(csv_path, dtype=dtype)))
+    header = pd.read_csv(csv_path, nrows=0).columns
+    engagement_probe = [column for column in ['Engagement Rate (%)', '60-Day Eng Rate'] if column in header]
+    engagement_column = choose_engagement_column(pd.read_csv(csv_path, usecols=engagement_probe))
+    chunks = [
+        clean_frame(chunk, engagement_column)
+        for chunk in pd.read_csv(csv_path, dtype=dtype, chunksize=chunksize)
+    ]
+    return fill_missing(pd.concat(chunks, ignore_index=True))
+
+
 def main():
  
     logger.info("Recherche du fichier CSV...")
@@ -168,7 +408,7 @@ def main():
     
    
     try:
-        df = pd.read_csv(csv_path)
+        df = pd.read_csv(csv_path, dtype={column: str for column in RAW_TEXT_COLUMNS})
         logger.info(f"Fichier chargé: {len(df)} lignes, {len(df.columns)} colonnes")
         print(f"Colonnes trouvées: {list(df.columns)}")
         print(f"\nAperçu des données:")
@@ -196,140 +436,15 @@ def main():
             print(f"  Non-null: {df[col].notna().sum()}/{len(df)}")
     
    
-    col_mapping = {
-        'Influencer Name': 'influencer_name',
-        'Followers': 'followers',
-        'Engagement Rate (%)': 'engagement_rate',
-        '60-Day Eng Rate': 'engagement_rate_60day',
-        'Category': 'category',
-        'Posts': 'posts',
-        'Country Or Region': 'country',
-        'Country': 'country_alt',
-        'Avg. Likes': 'avg_likes',
-        'Avg Comments': 'avg_comments',
-        'Influence Score': 'influence_score',
-        'Rank': 'rank',
-        'Username': 'username'
-    }
-    
-  
-    df_renamed = df.copy()
-    for old_col, new_col in col_mapping.items():
-        if old_col in df_renamed.columns:
-            df_renamed.rename(columns={old_col: new_col}, inplace=True)
-            logger.info(f"Colonne renommée: '{old_col}' -> '{new_col}'")
-    
-
-    if 'country' in df_renamed.columns and 'country_alt' in df_renamed.columns:
-       
-        df_renamed['country_final'] = df_renamed['country'].combine_first(df_renamed['country_alt'])
-        logger.info("Colonnes 'country' et 'country_alt' fusionnées en 'country_final'")
-    
-
     logger.info("\nNettoyage des données...")
-    
-   
-    if 'followers' in df_renamed.columns:
-        logger.info(f"Avant nettoyage - Exemple de followers: {df_renamed['followers'].head(3).tolist()}")
-        df_renamed['followers_clean'] = df_renamed['followers'].apply(clean_followers)
-        logger.info(f"Followers nettoyés: {df_renamed['followers_clean'].notna().sum()}/{len(df_renamed)}")
-        logger.info(f"Après nettoyage - Exemple: {df_renamed['followers_clean'].head(3).tolist()}")
-    
-   
-    for col in ['posts', 'avg_likes', 'avg_comments']:
-        if col in df_renamed.columns:
-            logger.info(f"\n{col} - Avant nettoyage: {df_renamed[col].head(3).tolist()}")
-            df_renamed[f'{col}_clean'] = df_renamed[col].apply(clean_numeric_k)
-            logger.info(f"{col} nettoyés: {df_renamed[f'{col}_clean'].notna().sum()}/{len(df_renamed)}")
-            logger.info(f"Après nettoyage - Exemple: {df_renamed[f'{col}_clean'].head(3).tolist()}")
-    
-  
-    engagement_col = None
-    if 'engagement_rate' in df_renamed.columns:
-        logger.info(f"\nEngagement Rate - Non-null values: {df_renamed['engagement_rate'].notna().sum()}")
-        engagement_col = 'engagement_rate'
-    
-  
-    if not engagement_col or df_renamed['engagement_rate'].notna().sum() < 500:
-        if 'engagement_rate_60day' in df_renamed.columns:
-            logger.info(f"\nUtilisation de 60-Day Eng Rate - Non-null: {df_renamed['engagement_rate_60day'].notna().sum()}")
-            engagement_col = 'engagement_rate_60day'
-    
-    if engagement_col:
-        df_renamed['engagement_rate_clean'] = df_renamed[engagement_col].apply(clean_engagement)
-        logger.info(f"Engagement Rate nettoyé: {df_renamed['engagement_rate_clean'].notna().sum()}/{len(df_renamed)}")
-    
-  
-    if 'category' in df_renamed.columns:
-        logger.info(f"\nCatégories - Avant nettoyage: {df_renamed['category'].dropna().unique()[:10]}")
-        logger.info(f"Valeurs nulles dans category: {df_renamed['category'].isna().sum()}")
-        df_renamed['category_clean'] = df_renamed['category'].apply(clean_category)
-        logger.info(f"Catégories nettoyées - Exemples: {df_renamed['category_clean'].dropna().unique()[:10]}")
-    
-  
-    logger.info("\nCréation du DataFrame final...")
-    
-  
-    columns_to_keep = []
-    
-  
-    if 'influencer_name' in df_renamed.columns:
-        columns_to_keep.append('influencer_name')
-    
-    if 'category_clean' in df_renamed.columns:
-        columns_to_keep.append('category_clean')
-    elif 'category' in df_renamed.columns:
-        columns_to_keep.append('category')
-    
-    if 'followers_clean' in df_renamed.columns:
-        columns_to_keep.append('followers_clean')
-    elif 'followers' in df_renamed.columns:
-        columns_to_keep.append('followers')
-    
-  
-    for col in ['posts', 'avg_likes', 'avg_comments']:
-        if f'{col}_clean' in df_renamed.columns:
-            columns_to_keep.append(f'{col}_clean')
-        elif col in df_renamed.columns:
-            columns_to_keep.append(col)
-    
-    if 'engagement_rate_clean' in df_renamed.columns:
-        columns_to_keep.append('engagement_rate_clean')
-    elif 'engagement_rate' in df_renamed.columns:
-        columns_to_keep.append('engagement_rate')
-    elif 'engagement_rate_60day' in df_renamed.columns:
-        columns_to_keep.append('engagement_rate_60day')
-    
- 
-    optional_cols_order = [
-        'country_final', 
-        'influence_score', 
-        'rank', 
-        'username',
-        'Channel Info'
-    ]
-    
-    for col in optional_cols_order:
-        if col in df_renamed.columns and col not in columns_to_keep:
-            columns_to_keep.append(col)
-    
-   
-    clean_df = df_renamed[columns_to_keep].copy()
-    
-   
-    rename_dict = {
-        'category_clean': 'category',
-        'followers_clean': 'followers',
-        'engagement_rate_clean': 'engagement_rate',
-        'country_final': 'country',
-        'posts_clean': 'posts',
-        'avg_likes_clean': 'avg_likes',
-        'avg_comments_clean': 'avg_comments'
-    }
-    
-    for old_name, new_name in rename_dict.items():
-        if old_name in clean_df.columns:
-            clean_df.rename(columns={old_name: new_name}, inplace=True)
+    engagement_column = choose_engagement_column(df)
+    logger.info(f"Colonne d'engagement utilisée: '{engagement_column}'")
+    clean_df = clean_frame(df, engagement_column)
+    for col in ['followers', 'posts', 'avg_likes', 'avg_comments', 'engagement_rate']:
+        if col in clean_df.columns:
+            logger.info(f"{col} nettoyés: {clean_df[col].notna().sum()}/{len(clean_df)}")
+    if 'category' in clean_df.columns:
+        logger.info(f"Catégories nettoyées - Exemples: {clean_df['category'].dropna().unique()[:10]}")
     
     logger.info("\nTraitement des valeurs manquantes...")
     
@@ -343,102 +458,7 @@ def main():
             percentage = (count / len(clean_df)) * 100
             print(f"  {col}: {count} manquants ({percentage:.1f}%)")
     
- 
-    
-  
-    if 'influencer_name' in clean_df.columns:
-        missing_names = clean_df['influencer_name'].isna().sum()
-        if missing_names > 0:
-         
-            if 'username' in clean_df.columns:
-                mask = clean_df['influencer_name'].isna() & clean_df['username'].notna()
-                clean_df.loc[mask, 'influencer_name'] = clean_df.loc[mask, 'username']
-                logger.info(f"Noms remplacés par username: {mask.sum()}")
-            
-           
-            if 'Channel Info' in clean_df.columns:
-                for idx, row in clean_df[clean_df['influencer_name'].isna()].iterrows():
-                    channel_info = row['Channel Info']
-                    extracted_name = extract_name_from_channel(channel_info)
-                    if extracted_name:
-                        clean_df.at[idx, 'influencer_name'] = extracted_name
-                
-                extracted_count = clean_df['influencer_name'].notna().sum() - (len(clean_df) - missing_names)
-                logger.info(f"Noms extraits depuis Channel Info: {extracted_count}")
-            
-           
-            remaining = clean_df['influencer_name'].isna().sum()
-            if remaining > 0:
-                clean_df.loc[clean_df['influencer_name'].isna(), 'influencer_name'] = 'Influenceur'
-                logger.info(f"Noms inconnus marqués comme 'Influenceur': {remaining}")
-    
- 
-    if 'followers' in clean_df.columns and 'category' in clean_df.columns:
-        missing_followers = clean_df['followers'].isna().sum()
-        if missing_followers > 0:
-          
-            median_by_category = clean_df.groupby('category')['followers'].median()
-            
-            for idx, row in clean_df[clean_df['followers'].isna()].iterrows():
-                category = row['category']
-                if category in median_by_category and not pd.isna(median_by_category[category]):
-                    clean_df.at[idx, 'followers'] = median_by_category[category]
-                else:
-                    
-                    global_median = clean_df['followers'].median()
-                    if not pd.isna(global_median):
-                        clean_df.at[idx, 'followers'] = global_median
-            
-            logger.info(f"Followers manquants remplis: {missing_followers}")
-    
-    
-    if 'engagement_rate' in clean_df.columns and 'category' in clean_df.columns:
-        missing_engagement = clean_df['engagement_rate'].isna().sum()
-        if missing_engagement > 0:
-          
-            mean_by_category = clean_df.groupby('category')['engagement_rate'].mean()
-            
-            for idx, row in clean_df[clean_df['engagement_rate'].isna()].iterrows():
-                category = row['category']
-                if category in mean_by_category and not pd.isna(mean_by_category[category]):
-                    clean_df.at[idx, 'engagement_rate'] = mean_by_category[category]
-                else:
-                  
-                    global_mean = clean_df['engagement_rate'].mean()
-                    if not pd.isna(global_mean):
-                        clean_df.at[idx, 'engagement_rate'] = global_mean
-            
-            logger.info(f"Engagement rates manquants remplis: {missing_engagement}")
-    
-   
-    if 'category' in clean_df.columns:
-        missing_category = clean_df['category'].isna().sum()
-        if missing_category > 0:
-          
-            clean_df.loc[clean_df['category'].isna(), 'category'] = 'General'
-            logger.info(f"Catégories manquantes marquées comme 'General': {missing_category}")
-    
-   
-    if 'country' in clean_df.columns:
-        missing_country = clean_df['country'].isna().sum()
-        if missing_country > 0:
-            clean_df.loc[clean_df['country'].isna(), 'country'] = 'Unknown'
-            logger.info(f"Pays inconnus marqués: {missing_country}")
-    
-   
-    numeric_cols_to_fill = ['posts', 'avg_likes', 'avg_comments', 'influence_score', 'rank']
-    for col in numeric_cols_to_fill:
-        if col in clean_df.columns and clean_df[col].isna().sum() > 0:
-            median_val = clean_df[col].median()
-            if not pd.isna(median_val):
-                clean_df.loc[clean_df[col].isna(), col] = median_val
-                logger.info(f"{col}: valeurs manquantes remplacées par médiane {median_val}")
-    
-    
-    text_cols = clean_df.select_dtypes(include=['object']).columns
-    for col in text_cols:
-        if col in clean_df.columns and col not in ['influencer_name', 'category', 'country'] and clean_df[col].isna().sum() > 0:
-            clean_df.loc[clean_df[col].isna(), col] = 'Unknown'
+    clean_df = fill_missing(clean_df)
     
     after = len(clean_df)
     print(f"\nAPRÈS traitement des valeurs manquantes: {after} lignes")
@@ -3,124 +3,53 @@ import pandas as pd
 import numpy as np
 import pickle
 import os  
+import sys
 from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.neighbors import NearestNeighbors
-from sklearn.preprocessing import StandardScaler, LabelEncoder 
 import matplotlib.pyplot as plt
 import seaborn as sns
 from sklearn.metrics import pairwise_distances
 import warnings
 warnings.filterwarnings('ignore')
 
+# Racine du projet sur le chemin d'import : le script marche depuis api/ comme
+# depuis la racine, et tout le code passe par le paquet api (une seule copie)
+API_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(API_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from api.pipeline import FEATURE_COLUMNS_FILE, FEATURE_MATRIX, READY_CSV, StaleOutputs, verify_stage
+from api.weighted_scoring import DEFAULT_WEIGHTS, build_weighted_features, top_n, weighted_scores
+
 
 plt.style.use('seaborn-v0_8')
 sns.set_palette("husl")
 
 def load_prepared_data():
-    """Charge les données préparées - VERSION COMPLÈTEMENT CORRIGÉE"""
+    """
+    Charge les données préparées par le pipeline (manage.py prepare_recommender_data).
+
+    Les fichiers sont vérifiés contre data/pipeline_manifest.json : des
+    sorties absentes ou calculées sur un autre CSV arrêtent le script au lieu
+    d'être régénérées (ou remplacées par des données de test) en silence.
+    """
     print(" Chargement des données préparées...")
     
     try:
-        df = pd.read_csv('data/influenceurs_recommendation_ready.csv')
-        print(f" Fichier CSV chargé: {len(df)} influenceurs")
-    except FileNotFoundError:
-        print(" Fichier data/influenceurs_recommendation_ready.csv non trouvé")
-        print("   Création de données de test...")
-        
-      
-        os.makedirs('data', exist_ok=True)
-        
-       
-        np.random.seed(42)
-        n_samples = 1500
-        
-        data = {
-            'influencer_name': [f'Influenceur_{i}' for i in range(n_samples)],
-            'category': np.random.choice(['Fashion', 'Tech', 'Lifestyle', 'Food', 'Travel'], n_samples),
-            'country': np.random.choice(['France', 'USA', 'UK', 'Germany', 'Spain', 'Italy'], n_samples),
-            'followers': np.random.randint(10000, 10000000, n_samples),
-            'engagement_rate': np.random.uniform(1.0, 15.0, n_samples),
-            'global_score': np.random.rand(n_samples)
-        }
-        
-        df = pd.DataFrame(data)
-        df.to_csv('data/influenceurs_recommendation_ready.csv', index=False)
-        print(f"    Fichier de test créé avec {len(df)} influenceurs")
+        verify_stage(PROJECT_ROOT, 'features')
+    except StaleOutputs as e:
+        raise SystemExit(f" Données préparées non à jour : {e}")
     
-    try:
-        X = np.load('data/feature_matrix.npy')
-        print(f" Matrice de features chargée: {X.shape}")
-        
-        
-        try:
-            with open('models/feature_columns.pkl', 'rb') as f:
-                feature_columns = pickle.load(f)
-            print(f" Features chargées: {len(feature_columns)} colonnes")
-        except FileNotFoundError:
-            print("  models/feature_columns.pkl non trouvé")
-            print("   Création automatique...")
-            
-            
-            feature_columns = []
-            for col in df.columns:
-                if 'normalized' in col or 'encoded' in col:
-                    feature_columns.append(col)
-            
-            if len(feature_columns) < 3:
-                feature_columns.extend(['followers', 'engagement_rate', 'global_score'])
-            
-            os.makedirs('models', exist_ok=True)
-            with open('models/feature_columns.pkl', 'wb') as f:
-                pickle.dump(feature_columns, f)
-            print(f"    Features créées: {len(feature_columns)} colonnes")
-            
-    except FileNotFoundError:
-        print(" Fichier data/feature_matrix.npy non trouvé")
-        print("   Création de la matrice de features...")
-        
-        
-        scaler = StandardScaler()
-        
-        
-        for col in ['followers', 'engagement_rate']:
-            if col in df.columns:
-                df[f'{col}_normalized'] = scaler.fit_transform(df[[col]].fillna(0))
-                print(f"   Normalisé: {col}")
-        
-        
-        le_category = LabelEncoder()
-        le_country = LabelEncoder()
-        
-        if 'category' in df.columns:
-            df['category_encoded'] = le_category.fit_transform(df['category'].fillna('Unknown'))
-            print(f"   Encodé: category")
-        
-        if 'country' in df.columns:
-            df['country_encoded'] = le_country.fit_transform(df['country'].fillna('Unknown'))
-            print(f"   Encodé: country")
-        
-       
-        feature_columns = []
-        for col in df.columns:
-            if 'normalized' in col or 'encoded' in col:
-                feature_columns.append(col)
-        
-        
-        if len(feature_columns) < 3:
-            for col in ['followers', 'engagement_rate', 'global_score']:
-                if col in df.columns and col not in feature_columns:
-                    feature_columns.append(col)
-        
-     
-        X = df[feature_columns].fillna(0).values
-        np.save('data/feature_matrix.npy', X)
-        print(f"    Matrice créée: {X.shape}")
-        
-        
-        os.makedirs('models', exist_ok=True)
-        with open('models/feature_columns.pkl', 'wb') as f:
-            pickle.dump(feature_columns, f)
-        print(f"    Features sauvegardées: {len(feature_columns)} colonnes")
+    df = pd.read_csv(os.path.join(PROJECT_ROOT, READY_CSV))
+    print(f" Fichier CSV chargé: {len(df)} influenceurs")
+    
+    X = np.load(os.path.join(PROJECT_ROOT, FEATURE_MATRIX))
+    print(f" Matrice de features chargée: {X.shape}")
+    
+    with open(os.path.join(PROJECT_ROOT, FEATURE_COLUMNS_FILE), 'rb') as f:
+        feature_columns = pickle.load(f)
+    print(f" Features chargées: {len(feature_columns)} colonnes")
     
     print(f" Données prêtes: {len(df)} influenceurs, {len(feature_columns)} features")
     return df, X, feature_columns
@@ -217,13 +146,8 @@ class Model3_ContentBasedFiltering:
         self.name = "Content-Based Filtering"
         
         
-        self.weights = {
-            'engagement': 0.3,
-            'followers': 0.25,
-            'category': 0.2,
-            'popularity': 0.15,
-            'diversity': 0.1
-        }
+        self.weights = dict(DEFAULT_WEIGHTS)
+        self.features = None
     
     def calculate_similarity(self, query_idx, candidate_idx):
         """Calcule un score de similarité personnalisé"""
@@ -263,26 +187,32 @@ class Model3_ContentBasedFiltering:
     def fit(self):
         """Prépare le modèle"""
         print(" Préparation du modèle Content-Based...")
-        
+        self.features = build_weighted_features(self.df)
         return self
     
+    def score_all(self, query_idx):
+        """Scores pondérés de tous les candidats (équivalent vectorisé de calculate_similarity)"""
+        # Les modèles picklés avant la vectorisation n'ont pas encore de features
+        if getattr(self, 'features', None) is None:
+            self.fit()
+        return weighted_scores(self.features, query_idx, self.weights)
+    
     def recommend(self, query_idx, n=5):
         """Recommande des influenceurs"""
-        scores = []
-        
-        for i in range(len(self.df)):
-            if i != query_idx:
-                score = self.calculate_similarity(query_idx, i)
-                scores.append((i, score))
-        
-        
-        scores.sort(key=lambda x: x[1], reverse=True)
+        scores = self.score_all(query_idx)
+        similar_indices = top_n(scores, n, exclude=query_idx)
         
-        
-        similar_indices = [idx for idx, _ in scores[:n]]
-        similarity_scores = [score for _, score in scores[:n]]
-        
-        return similar_indices, similarity_scores
+        return similar_indices.tolist(), scores[similar_indices].tolist()
+    
+    def recommend_batch(self, query_indices, n=5):
+        """Recommande pour plusieurs requêtes en un seul calcul matriciel (Q × N)"""
+        query_indices = np.asarray(query_indices)
+        scores = self.score_all(query_indices)
+        results = []
+        for row, query_idx in zip(scores, query_indices):
+            similar_indices = top_n(row, n, exclude=query_idx)
+            results.append((similar_indices.tolist(), row[similar_indices].tolist()))
+        return results
     
     def get_model_info(self):
         """Retourne les informations du modèle"""
@@ -290,7 +220,7 @@ class Model3_ContentBasedFiltering:
             'name': self.name,
             'type': 'Filtrage basé sur contenu avec pondération',
             'complexity': 'Personnalisable',
-            'speed': 'Lent (calcul à la volée)',
+            'speed': 'Rapide (calcul vectorisé à la volée)',
             'memory': 'Faible',
             'params': f'weights={self.weights}'
         }
@@ -675,7 +605,8 @@ def main():
     print("  VERSION CORRIGÉE - Gère les fichiers manquants")
     print("="*60)
     
-    
+    # Modèles et graphiques sont écrits dans api/models et api/visualizations, quel que soit le dossier courant
+    os.chdir(API_DIR)
     os.makedirs('visualizations', exist_ok=True)
     
 
@@ -9,7 +9,8 @@ print(" Création du modèle Cosine Similarity...")
 
 
 df = pd.read_csv('data/influenceurs_recommendation_ready.csv')
-X = np.load('data/feature_matrix.npy')
+# Produit par: python manage.py prepare_recommender_data --stage features
+X = np.load('data/generated/feature_matrix.npy')
 
 print(f" Données chargées: {len(df)} influenceurs, {X.shape[1]} features")
 
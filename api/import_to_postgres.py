@@ -1,9 +1,18 @@
 # import_to_postgres.py
+import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine, text
+import hashlib
+import io
 import logging
 import os
-import sys
+import sqlite3
+import time
+from collections import namedtuple
+
+try:
+    from sqlalchemy import create_engine, text
+except ImportError:  # Le chargeur par lots n'utilise que psycopg2 / sqlite3
+    create_engine = text = None
 
 # Configuration du logging
 logging.basicConfig(
@@ -64,58 +73,73 @@ def test_connection(engine):
         logger.info("   3. Les identifiants sont corrects")
         return False
 
-def create_tables(engine, schema='public'):
-    """Crée les tables dans PostgreSQL"""
-    
-    logger.info("Création des tables dans PostgreSQL...")
-    
+# Colonnes du CSV nettoyé -> colonnes de la table influenceurs
+INFLUENCER_COLUMNS = {
+    'influencer_name': 'influencer_name',
+    'username': 'username',
+    'category_id': 'category_id',
+    'followers': 'followers',
+    'posts': 'posts',
+    'avg_likes': 'avg_likes',
+    'avg_comments': 'avg_comments',
+    'engagement_rate': 'engagement_rate',
+    'country_id': 'country_id',
+    'influence_score': 'influence_score',
+    'rank': 'rank_position',
+    'Channel Info': 'channel_info'
+}
 
-    sql_commands = [
-   
+# Colonnes INTEGER/BIGINT : COPY refuse '3400.0', les valeurs sont arrondies avant
+INTEGER_COLUMNS = ['category_id', 'followers', 'posts', 'avg_likes', 'avg_comments', 'country_id', 'rank_position']
+
+# Identité d'un influenceur pour la fusion (le CSV n'a pas de clé naturelle unique)
+SOURCE_KEY_COLUMNS = ['influencer_name', 'username', 'channel_info']
+
+LoadStats = namedtuple('LoadStats', 'rows seconds')
+
+
+def table_ddl(prefix='', serial='SERIAL PRIMARY KEY'):
+    """Tables et index de la structure normalisée (prefix: 'schema.' pour PostgreSQL)"""
+    tables = [
         f"""
-        CREATE TABLE IF NOT EXISTS {schema}.categories (
-            category_id SERIAL PRIMARY KEY,
+        CREATE TABLE IF NOT EXISTS {prefix}categories (
+            category_id {serial},
             category_name VARCHAR(100) UNIQUE NOT NULL,
             description TEXT,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
         """,
-        
-      
         f"""
-        CREATE TABLE IF NOT EXISTS {schema}.countries (
-            country_id SERIAL PRIMARY KEY,
+        CREATE TABLE IF NOT EXISTS {prefix}countries (
+            country_id {serial},
             country_name VARCHAR(100) UNIQUE NOT NULL,
             region VARCHAR(100),
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
         """,
-        
-       
         f"""
-        CREATE TABLE IF NOT EXISTS {schema}.influenceurs (
-            influencer_id SERIAL PRIMARY KEY,
+        CREATE TABLE IF NOT EXISTS {prefix}influenceurs (
+            influencer_id {serial},
             influencer_name VARCHAR(255) NOT NULL,
             username VARCHAR(100),
-            category_id INTEGER REFERENCES {schema}.categories(category_id),
+            category_id INTEGER REFERENCES {prefix}categories(category_id),
             followers BIGINT NOT NULL,
             posts INTEGER,
             avg_likes INTEGER,
             avg_comments INTEGER,
             engagement_rate DECIMAL(5,2),
-            country_id INTEGER REFERENCES {schema}.countries(country_id),
+            country_id INTEGER REFERENCES {prefix}countries(country_id),
             influence_score DECIMAL(5,2),
             rank_position INTEGER,
             channel_info TEXT,
+            source_key VARCHAR(32),
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
         """,
-        
-
         f"""
-        CREATE TABLE IF NOT EXISTS {schema}.statistiques (
-            stat_id SERIAL PRIMARY KEY,
-            influencer_id INTEGER REFERENCES {schema}.influenceurs(influencer_id),
+        CREATE TABLE IF NOT EXISTS {prefix}statistiques (
+            stat_id {serial},
+            influencer_id INTEGER REFERENCES {prefix}influenceurs(influencer_id),
             date_stat DATE DEFAULT CURRENT_DATE,
             nouveaux_followers INTEGER,
             nouveaux_likes INTEGER,
@@ -124,173 +148,336 @@ def create_tables(engine, schema='public'):
         );
         """
     ]
-    
+    indexes = [
+        f"CREATE INDEX IF NOT EXISTS idx_influenceurs_followers ON {prefix}influenceurs(followers);",
+        f"CREATE INDEX IF NOT EXISTS idx_influenceurs_category ON {prefix}influenceurs(category_id);",
+        f"CREATE INDEX IF NOT EXISTS idx_influenceurs_country ON {prefix}influenceurs(country_id);",
+        f"CREATE INDEX IF NOT EXISTS idx_influenceurs_engagement ON {prefix}influenceurs(engagement_rate);",
+        f"CREATE INDEX IF NOT EXISTS idx_influenceurs_name ON {prefix}influenceurs(influencer_name);",
+        # Cible du ON CONFLICT : une relance met à jour au lieu de dupliquer
+        f"CREATE UNIQUE INDEX IF NOT EXISTS idx_influenceurs_source_key ON {prefix}influenceurs(source_key);"
+    ]
+    return tables, indexes
+
 
-    index_commands = [
-        f"CREATE INDEX IF NOT EXISTS idx_influenceurs_followers ON {schema}.influenceurs(followers);",
-        f"CREATE INDEX IF NOT EXISTS idx_influenceurs_category ON {schema}.influenceurs(category_id);",
-        f"CREATE INDEX IF NOT EXISTS idx_influenceurs_country ON {schema}.influenceurs(country_id);",
-        f"CREATE INDEX IF NOT EXISTS idx_influenceurs_engagement ON {schema}.influenceurs(engagement_rate);",
-        f"CREATE INDEX IF NOT EXISTS idx_influenceurs_name ON {schema}.influenceurs(influencer_name);"
+def source_keys(frame):
+    """Clé stable (md5) de chaque ligne, calculée sur SOURCE_KEY_COLUMNS"""
+    values = frame[SOURCE_KEY_COLUMNS].astype(object).where(frame[SOURCE_KEY_COLUMNS].notna(), '')
+    return [
+        hashlib.md5('\x1f'.join(map(str, row)).encode('utf-8')).hexdigest()
+        for row in values.itertuples(index=False, name=None)
     ]
+
+
+def _round_integers(series):
+    """Arrondi comme PostgreSQL (demi -> loin de zéro), en entier nullable"""
+    values = pd.to_numeric(series, errors='coerce')
+    return (np.sign(values) * np.floor(values.abs() + 0.5)).astype('Int64')
+
+
+class InfluencerLoader:
+    """
+    Chargement par lots du CSV nettoyé dans la structure normalisée.
+
+    Chaque lot est écrit dans une transaction : les catégories et pays
+    inconnus sont insérés (ON CONFLICT DO NOTHING), puis les influenceurs
+    sont fusionnés sur source_key (INSERT ... ON CONFLICT DO UPDATE), ce qui
+    rend les relances idempotentes. Les identifiants de catégories et de pays
+    sont gardés en mémoire : seuls les noms nouveaux sont relus.
+
+    Sous-classes : PostgresInfluencerLoader (COPY + table de staging) et
+    SQLiteInfluencerLoader (executemany).
+    """
+
+    placeholder = '%s'
+    serial = 'SERIAL PRIMARY KEY'
+
+    def __init__(self, connection, schema='public', chunk_size=50_000):
+        self.connection = connection
+        self.schema = schema
+        self.chunk_size = chunk_size
+        self.lookups = {'categories': {}, 'countries': {}}
+
+    def table(self, name):
+        return f"{self.schema}.{name}"
+
+    def table_prefix(self):
+        return f"{self.schema}."
+
+    def create_tables(self):
+        tables, indexes = table_ddl(self.table_prefix(), self.serial)
+        cursor = self.connection.cursor()
+        for sql in tables + self.migrations() + indexes:
+            cursor.execute(sql)
+        self.connection.commit()
+
+    def migrations(self):
+        """Mise à niveau des tables créées par une version précédente"""
+        return []
+
+    def load_csv(self, csv_path):
+        """Charge le CSV lot par lot (jamais entièrement en mémoire)"""
+        start = time.perf_counter()
+        rows = 0
+        for chunk in pd.read_csv(csv_path, chunksize=self.chunk_size):
+            rows += self.load_frame(chunk)
+            self._log_progress(rows, start)
+        return LoadStats(rows, time.perf_counter() - start)
+
+    def load_dataframe(self, clean_df):
+        """Charge un DataFrame déjà en mémoire, découpé en lots de chunk_size lignes"""
+        start = time.perf_counter()
+        rows = 0
+        for offset in range(0, len(clean_df), self.chunk_size):
+            rows += self.load_frame(clean_df.iloc[offset:offset + self.chunk_size])
+            self._log_progress(rows, start)
+        return LoadStats(rows, time.perf_counter() - start)
+
+    def _log_progress(self, rows, start):
+        elapsed = time.perf_counter() - start
+        logger.info(f" {rows:,} lignes chargées ({rows / elapsed:,.0f} lignes/s)")
+
+    def load_frame(self, clean_df):
+        """Écrit un lot dans une transaction et retourne le nombre d'influenceurs fusionnés"""
+        cursor = self.connection.cursor()
+        pending = {name: {} for name in self.lookups}
+        try:
+            category_ids = self._lookup_ids(cursor, 'categories', 'category_id', 'category_name',
+                                            clean_df['category'], pending['categories'])
+            country_ids = self._lookup_ids(cursor, 'countries', 'country_id', 'country_name',
+                                           clean_df['country'], pending['countries'])
+            frame = self.prepare(clean_df, category_ids, country_ids)
+            self.merge(cursor, frame)
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        # Identifiants connus seulement une fois la transaction validée
+        for name, ids in pending.items():
+            self.lookups[name].update(ids)
+        return len(frame)
+
+    def _lookup_ids(self, cursor, table, id_column, name_column, names, pending):
+        """{nom: id} des noms du lot ; les noms inconnus sont insérés puis relus"""
+        known = self.lookups[table]
+        missing = [name for name in names.dropna().unique() if name not in known]
+        ph = self.placeholder
+        if missing:
+            cursor.executemany(
+                f"INSERT INTO {self.table(table)} ({name_column}) VALUES ({ph}) "
+                f"ON CONFLICT ({name_column}) DO NOTHING",
+                [(name,) for name in missing]
+            )
+            for offset in range(0, len(missing), 500):
+                batch = missing[offset:offset + 500]
+                cursor.execute(
+                    f"SELECT {id_column}, {name_column} FROM {self.table(table)} "
+                    f"WHERE {name_column} IN ({', '.join([ph] * len(batch))})",
+                    batch
+                )
+                pending.update((name, row_id) for row_id, name in cursor.fetchall())
+        return {**known, **pending}
+
+    def prepare(self, clean_df, category_ids, country_ids):
+        """Lignes de la table influenceurs (ids résolus, entiers arrondis, source_key)"""
+        frame = clean_df.assign(
+            category_id=clean_df['category'].map(category_ids),
+            country_id=clean_df['country'].map(country_ids),
+        )
+        missing_category = int(frame['category_id'].isna().sum() - clean_df['category'].isna().sum())
+        missing_country = int(frame['country_id'].isna().sum() - clean_df['country'].isna().sum())
+        if missing_category > 0:
+            logger.warning(f" {missing_category} influenceurs sans catégorie correspondante")
+        if missing_country > 0:
+            logger.warning(f" {missing_country} influenceurs sans pays correspondant")
+
+        frame = frame[list(INFLUENCER_COLUMNS)].rename(columns=INFLUENCER_COLUMNS)
+        for column in INTEGER_COLUMNS:
+            frame[column] = _round_integers(frame[column])
+        frame['source_key'] = source_keys(frame)
+        # Une même clé deux fois dans un lot : la dernière ligne l'emporte
+        return frame.drop_duplicates('source_key', keep='last')
+
+    def merge_sql(self, source):
+        """INSERT ... ON CONFLICT (source_key) DO UPDATE depuis `source` (VALUES ou SELECT)"""
+        columns = [*INFLUENCER_COLUMNS.values(), 'source_key']
+        updates = ', '.join(f"{column} = excluded.{column}" for column in columns if column != 'source_key')
+        return (
+            f"INSERT INTO {self.table('influenceurs')} ({', '.join(columns)}) {source} "
+            f"ON CONFLICT (source_key) DO UPDATE SET {updates}"
+        )
+
+    def merge(self, cursor, frame):
+        raise NotImplementedError
+
+    def log_statistics(self):
+        cursor = self.connection.cursor()
+        cursor.execute(f"""
+            SELECT
+                COUNT(*) as total_influenceurs,
+                AVG(followers) as avg_followers,
+                AVG(engagement_rate) as avg_engagement,
+                COUNT(DISTINCT category_id) as categories_count,
+                COUNT(DISTINCT country_id) as countries_count
+            FROM {self.table('influenceurs')}
+        """)
+        stats = cursor.fetchone()
+
+        logger.info("\n STATISTIQUES DE L'IMPORTATION:")
+        logger.info(f"  Total influenceurs: {stats[0]:,}")
+        logger.info(f"  Followers moyens: {stats[1]:,.0f}")
+        logger.info(f"  Engagement moyen: {stats[2]:.2f}%")
+        logger.info(f"  Catégories différentes: {stats[3]}")
+        logger.info(f"  Pays différents: {stats[4]}")
+
+        cursor.execute(f"""
+            SELECT i.influencer_name, i.followers, c.country_name, cat.category_name, i.engagement_rate
+            FROM {self.table('influenceurs')} i
+            LEFT JOIN {self.table('countries')} c ON i.country_id = c.country_id
+            LEFT JOIN {self.table('categories')} cat ON i.category_id = cat.category_id
+            ORDER BY i.followers DESC
+            LIMIT 5
+        """)
+        logger.info("\n TOP 5 INFLUENCEURS:")
+        for inf in cursor.fetchall():
+            logger.info(f"   {inf[0]}")
+            logger.info(f"     {inf[1]:,} followers")
+            logger.info(f"     {inf[2]} | 🏷️ {inf[3]} | ⭐ {inf[4]:.1f}% engagement")
+            logger.info("")
+
+
+class PostgresInfluencerLoader(InfluencerLoader):
+    """COPY FROM STDIN du lot dans une table temporaire, puis fusion en une requête"""
+
+    staging_table = 'influenceurs_staging'
+
+    def migrations(self):
+        return [f"ALTER TABLE {self.table('influenceurs')} ADD COLUMN IF NOT EXISTS source_key VARCHAR(32);"]
+
+    def merge(self, cursor, frame):
+        columns = ', '.join([*INFLUENCER_COLUMNS.values(), 'source_key'])
+        # Mêmes types que la table cible, sans contraintes ni séquence
+        cursor.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {self.staging_table} AS "
+            f"SELECT {columns} FROM {self.table('influenceurs')} WITH NO DATA"
+        )
+        cursor.execute(f"TRUNCATE {self.staging_table}")
+        buffer = io.StringIO()
+        frame.to_csv(buffer, index=False, header=False)
+        buffer.seek(0)
+        cursor.copy_expert(f"COPY {self.staging_table} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+        cursor.execute(self.merge_sql(f"SELECT {columns} FROM {self.staging_table}"))
+
+
+class SQLiteInfluencerLoader(InfluencerLoader):
+    """Repli sans PostgreSQL : même fusion, lignes envoyées par executemany"""
+
+    placeholder = '?'
+    serial = 'INTEGER PRIMARY KEY AUTOINCREMENT'
+
+    def table(self, name):
+        return name
+
+    def table_prefix(self):
+        return ''
+
+    def merge(self, cursor, frame):
+        # VALUES suivi de ON CONFLICT : pas d'ambiguïté avec la syntaxe UPSERT de SQLite
+        values = f"VALUES ({', '.join([self.placeholder] * len(frame.columns))})"
+        rows = frame.astype(object).where(frame.notna(), None)
+        cursor.executemany(self.merge_sql(values), rows.itertuples(index=False, name=None))
+
+
+def get_loader(connection, schema='public', chunk_size=50_000):
+    """Chargeur adapté à la connexion DB-API (sqlite3 ou psycopg2, éventuellement via engine.raw_connection())"""
+    # engine.raw_connection() renvoie un proxy SQLAlchemy autour de la connexion du pilote
+    driver_connection = getattr(connection, 'driver_connection', connection)
+    if isinstance(driver_connection, sqlite3.Connection):
+        return SQLiteInfluencerLoader(connection, schema, chunk_size)
+    return PostgresInfluencerLoader(connection, schema, chunk_size)
+
+
+def create_tables(engine, schema='public'):
+    """Crée les tables dans PostgreSQL"""
+    
+    logger.info("Création des tables dans PostgreSQL...")
     
     try:
-        with engine.connect() as conn:
-          
-            for sql in sql_commands:
-                conn.execute(text(sql))
-            conn.commit()
-            
-         
-            for sql in index_commands:
-                try:
-                    conn.execute(text(sql))
-                except Exception as e:
-                    logger.warning(f"Index peut déjà exister: {e}")
-            conn.commit()
-            
-            logger.info(" Tables créées avec succès")
-            return True
+        connection = engine.raw_connection()
+        try:
+            get_loader(connection, schema).create_tables()
+        finally:
+            connection.close()
+        logger.info(" Tables créées avec succès")
+        return True
             
     except Exception as e:
         logger.error(f" Erreur lors de la création des tables: {e}")
         return False
 
-def import_data_to_postgres(clean_df, engine, schema='public'):
-    """Importe les données dans PostgreSQL avec structure normalisée"""
+def import_data_to_postgres(clean_df, engine, schema='public', chunk_size=50_000):
+    """Importe les données dans PostgreSQL avec structure normalisée (par lots, COPY)"""
     
     logger.info("Début de l'importation des données...")
     
     try:
-        with engine.connect() as conn:
-           
-       
-            categories = clean_df['category'].dropna().unique()
-            categories_df = pd.DataFrame({'category_name': categories})
-            
-          
-            countries = clean_df['country'].dropna().unique()
-            countries_df = pd.DataFrame({'country_name': countries})
-            
-         
-            logger.info("Importation des catégories...")
-            categories_df.to_sql('categories', conn, schema=schema, if_exists='append', index=False)
-            
-      
-            result = conn.execute(text(f"SELECT category_id, category_name FROM {schema}.categories"))
-            category_map = {row[1]: row[0] for row in result.fetchall()}
-            logger.info(f" {len(category_map)} catégories disponibles")
-            
-          
-            logger.info("Importation des pays...")
-            countries_df.to_sql('countries', conn, schema=schema, if_exists='append', index=False)
-            
-       
-            result = conn.execute(text(f"SELECT country_id, country_name FROM {schema}.countries"))
-            country_map = {row[1]: row[0] for row in result.fetchall()}
-            logger.info(f" {len(country_map)} pays disponibles")
-            
-         
-            logger.info("Préparation des données des influenceurs...")
-            influenceurs_df = clean_df.copy()
-            
-       
-            influenceurs_df['category_id'] = influenceurs_df['category'].map(category_map)
-            influenceurs_df['country_id'] = influenceurs_df['country'].map(country_map)
-            
-           
-            missing_category = influenceurs_df['category_id'].isna().sum()
-            missing_country = influenceurs_df['country_id'].isna().sum()
-            
-            if missing_category > 0:
-                logger.warning(f" {missing_category} influenceurs sans catégorie correspondante")
-              
-                influenceurs_df['category_id'] = influenceurs_df['category_id'].where(influenceurs_df['category_id'].notna(), None)
-            
-            if missing_country > 0:
-                logger.warning(f" {missing_country} influenceurs sans pays correspondant")
-                
-                influenceurs_df['country_id'] = influenceurs_df['country_id'].where(influenceurs_df['country_id'].notna(), None)
-            
-          
-            columns_mapping = {
-                'influencer_name': 'influencer_name',
-                'username': 'username',
-                'category_id': 'category_id',
-                'followers': 'followers',
-                'posts': 'posts',
-                'avg_likes': 'avg_likes',
-                'avg_comments': 'avg_comments',
-                'engagement_rate': 'engagement_rate',
-                'country_id': 'country_id',
-                'influence_score': 'influence_score',
-                'rank': 'rank_position',
-                'Channel Info': 'channel_info'
-            }
+        connection = engine.raw_connection()
+        try:
+            loader = get_loader(connection, schema, chunk_size)
+            stats = loader.load_dataframe(clean_df)
+            _log_load(stats)
+            loader.log_statistics()
+        finally:
+            connection.close()
+        return True
             
-            influenceurs_final = influenceurs_df[list(columns_mapping.keys())].rename(columns=columns_mapping)
-            
-           
-            logger.info("Importation des influenceurs...")
-            influenceurs_final.to_sql('influenceurs', conn, schema=schema, if_exists='append', index=False)
-            
-          
-            result = conn.execute(text(f"""
-                SELECT 
-                    COUNT(*) as total_influenceurs,
-                    AVG(followers) as avg_followers,
-                    AVG(engagement_rate) as avg_engagement,
-                    COUNT(DISTINCT category_id) as categories_count,
-                    COUNT(DISTINCT country_id) as countries_count
-                FROM {schema}.influenceurs
-            """))
-            stats = result.fetchone()
-            
-            logger.info("\n STATISTIQUES DE L'IMPORTATION:")
-            logger.info(f"  Total influenceurs: {stats[0]:,}")
-            logger.info(f"  Followers moyens: {stats[1]:,.0f}")
-            logger.info(f"  Engagement moyen: {stats[2]:.2f}%")
-            logger.info(f"  Catégories différentes: {stats[3]}")
-            logger.info(f"  Pays différents: {stats[4]}")
-            
-            
-            result = conn.execute(text(f"""
-                SELECT i.influencer_name, i.followers, c.country_name, cat.category_name, i.engagement_rate
-                FROM {schema}.influenceurs i
-                LEFT JOIN {schema}.countries c ON i.country_id = c.country_id
-                LEFT JOIN {schema}.categories cat ON i.category_id = cat.category_id
-                ORDER BY i.followers DESC
-                LIMIT 5
-            """))
-            top_influencers = result.fetchall()
-            
-            logger.info("\n TOP 5 INFLUENCEURS:")
-            for inf in top_influencers:
-                logger.info(f"   {inf[0]}")
-                logger.info(f"     {inf[1]:,} followers")
-                logger.info(f"     {inf[2]} | 🏷️ {inf[3]} | ⭐ {inf[4]:.1f}% engagement")
-                logger.info("")
-            
-            return True
+    except Exception as e:
+        logger.error(f" Erreur lors de l'importation: {e}")
+        return False
+
+def import_csv(csv_path, connection, schema='public', chunk_size=50_000):
+    """Importe le CSV nettoyé par lots sans le charger entièrement (connexion psycopg2 ou sqlite3)"""
+    
+    logger.info(f"Importation par lots de {csv_path} (lots de {chunk_size:,} lignes)...")
+    loader = get_loader(connection, schema, chunk_size)
+    loader.create_tables()
+    stats = loader.load_csv(csv_path)
+    _log_load(stats)
+    loader.log_statistics()
+    return stats
+
+def import_csv_to_postgres(csv_path, engine, schema='public', chunk_size=50_000):
+    """Crée les tables et importe le CSV par lots via une connexion brute du moteur"""
+    
+    try:
+        connection = engine.raw_connection()
+        try:
+            import_csv(csv_path, connection, schema, chunk_size)
+        finally:
+            connection.close()
+        return True
             
     except Exception as e:
         logger.error(f" Erreur lors de l'importation: {e}")
         return False
 
-def import_simple_table(clean_df, engine, schema='public'):
-    """Importe les données dans une table simple (alternative)"""
+def _log_load(stats):
+    rate = stats.rows / stats.seconds if stats.seconds else 0
+    logger.info(f" {stats.rows:,} influenceurs fusionnés en {stats.seconds:.2f}s ({rate:,.0f} lignes/s)")
+
+def import_simple_table(csv_path, engine, schema='public', chunk_size=50_000):
+    """Importe les données dans une table simple (alternative), lot par lot"""
     
     logger.info("Importation dans une table simple...")
     
     try:
-        with engine.connect() as conn:
-         
-            df_for_import = clean_df.copy()
-            
+        with engine.begin() as conn:
             
-            df_for_import.columns = [col.lower().replace(' ', '_').replace('.', '_') for col in df_for_import.columns]
-            
-            df_for_import.to_sql('influenceurs_simple', conn, schema=schema, if_exists='replace', index=False)
+            for position, chunk in enumerate(pd.read_csv(csv_path, chunksize=chunk_size)):
+                chunk.columns = [col.lower().replace(' ', '_').replace('.', '_') for col in chunk.columns]
+                # Le premier lot recrée la table, les suivants s'y ajoutent
+                chunk.to_sql('influenceurs_simple', conn, schema=schema,
+                             if_exists='replace' if position == 0 else 'append', index=False)
             
            
             result = conn.execute(text(f"SELECT COUNT(*) FROM {schema}.influenceurs_simple"))
@@ -307,21 +494,16 @@ def main():
     """Fonction principale"""
     
    
-    csv_file = 'influenceurs_clean.csv'
+    # Sortie de l'étape clean du pipeline (chemin relatif à la racine du projet)
+    csv_file = 'data/generated/influenceurs_clean.csv'
     
     if not os.path.exists(csv_file):
         logger.error(f" Fichier {csv_file} non trouvé")
-        logger.info(" Exécutez d'abord: python clean_and_import.py")
+        logger.info(" Exécutez d'abord: python manage.py prepare_recommender_data --stage clean")
         return
     
-   
-    logger.info(f" Chargement du fichier {csv_file}...")
-    try:
-        clean_df = pd.read_csv(csv_file)
-        logger.info(f" Fichier chargé: {len(clean_df)} lignes, {len(clean_df.columns)} colonnes")
-    except Exception as e:
-        logger.error(f" Erreur de chargement: {e}")
-        return
+    # Le CSV est lu par lots pendant l'importation, jamais entièrement en mémoire
+    logger.info(f" Fichier {csv_file}: {os.path.getsize(csv_file) / 1024 / 1024:.1f} Mo")
     
     
     connection_string, config = get_postgres_connection()
@@ -365,17 +547,14 @@ def main():
     success = False
     
     if choice == '1':
-      
-        if create_tables(engine, config['schema']):
-           
-            success = import_data_to_postgres(clean_df, engine, config['schema'])
+        success = import_csv_to_postgres(csv_file, engine, config['schema'])
     
     elif choice == '2':
-        success = import_simple_table(clean_df, engine, config['schema'])
+        success = import_simple_table(csv_file, engine, config['schema'])
     
     elif choice == '3':
-        success1 = create_tables(engine, config['schema']) and import_data_to_postgres(clean_df, engine, config['schema'])
-        success2 = import_simple_table(clean_df, engine, config['schema'])
+        success1 = import_csv_to_postgres(csv_file, engine, config['schema'])
+        success2 = import_simple_table(csv_file, engine, config['schema'])
         success = success1 and success2
     
   
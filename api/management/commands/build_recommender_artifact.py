@@ -0,0 +1,87 @@
+import os
+import time
+
+import pandas as pd
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.artifacts import build_columns, candidate_data_paths, file_sha256, write_artifact
+from api.similarity_index import INDEX_BACKENDS, get_index_class
+
+
+class Command(BaseCommand):
+    help = 'Build the binary, memory-mapped recommender artifact from the prepared CSV'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--source',
+            type=str,
+            default=None,
+            help='Prepared CSV to build from. Default: first existing recommender data file',
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            default=None,
+            help='Artifact root directory. Default: settings.RECOMMENDER_ARTIFACT_DIR',
+        )
+        parser.add_argument(
+            '--keep',
+            type=int,
+            default=3,
+            help='Number of artifact versions to keep. Default: 3',
+        )
+        parser.add_argument(
+            '--index',
+            nargs='*',
+            choices=sorted(INDEX_BACKENDS),
+            default=[],
+            help='Similarity index backends to prebuild into the artifact (e.g. --index ivf kdtree)',
+        )
+
+    def handle(self, *args, **options):
+        source = options['source']
+        if source is None:
+            source = next(
+                (path for path in candidate_data_paths(settings.BASE_DIR) if os.path.exists(path)),
+                None,
+            )
+        if source is None or not os.path.exists(source):
+            raise CommandError(f'Source CSV not found: {source or "no candidate path exists"}')
+
+        output = options['output'] or settings.RECOMMENDER_ARTIFACT_DIR
+
+        start = time.perf_counter()
+        df = pd.read_csv(source)
+        self.stdout.write(f'Loaded {len(df)} influencers from {source}')
+
+        columns, vocab = build_columns(df)
+
+        # Built before write_artifact so they are in place when CURRENT switches to the new version
+        indexes = {}
+        for backend in options['index']:
+            index_start = time.perf_counter()
+            indexes[backend] = get_index_class(backend).build(columns['features'])
+            self.stdout.write(f'Index {backend} built in {time.perf_counter() - index_start:.2f}s')
+
+        version_dir = write_artifact(
+            output,
+            columns,
+            vocab,
+            source={'path': os.path.abspath(source), 'sha256': file_sha256(source)},
+            keep=options['keep'],
+            indexes=indexes,
+        )
+        elapsed = time.perf_counter() - start
+
+        size = sum(
+            os.path.getsize(os.path.join(dirpath, name))
+            for dirpath, _, filenames in os.walk(version_dir)
+            for name in filenames
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f'Artifact written to {version_dir}')
+        )
+        self.stdout.write(f'  > {len(df)} rows, {columns["features"].shape[1]} features')
+        self.stdout.write(f'  > {size / 1024:.1f} KB on disk')
+        self.stdout.write(f'  > built in {elapsed:.2f}s')
@@ -0,0 +1,84 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api.pipeline import Pipeline, default_stages
+from api.similarity_index import INDEX_BACKENDS
+
+
+class Command(BaseCommand):
+    help = (
+        'Run the recommender data preparation pipeline (clean CSV, feature matrix, artifact). '
+        'Stages whose inputs, code and outputs match data/pipeline_manifest.json are skipped'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--stage',
+            nargs='*',
+            default=None,
+            help='Stages to bring up to date, with their dependencies. Default: all stages',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Rerun the selected stages even if they are up to date',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only show which stages would run and why',
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            default=None,
+            help='Artifact root directory. Default: settings.RECOMMENDER_ARTIFACT_DIR',
+        )
+        parser.add_argument(
+            '--keep',
+            type=int,
+            default=3,
+            help='Number of artifact versions to keep. Default: 3',
+        )
+        parser.add_argument(
+            '--index',
+            nargs='*',
+            choices=sorted(INDEX_BACKENDS),
+            default=[],
+            help='Similarity index backends to prebuild into the artifact (e.g. --index ivf kdtree)',
+        )
+
+    def handle(self, *args, **options):
+        stages = default_stages(
+            artifact_dir=options['output'] or settings.RECOMMENDER_ARTIFACT_DIR,
+            index=options['index'],
+            keep=options['keep'],
+        )
+        pipeline = Pipeline(settings.BASE_DIR, stages)
+
+        start = time.perf_counter()
+        try:
+            results = pipeline.run(options['stage'], force=options['force'], dry_run=options['dry_run'])
+        except (ValueError, FileNotFoundError) as e:
+            raise CommandError(str(e))
+        elapsed = time.perf_counter() - start
+
+        labels = {'ran': 'ran', 'skipped': 'up to date', 'pending': 'would run'}
+        for result in results:
+            line = f'  {result.name:<10} {labels[result.status]:<11}'
+            if result.status == 'ran':
+                line += f' {result.seconds:>6.2f}s'
+            if result.status != 'skipped':
+                line += f'  ({result.reason})'
+            self.stdout.write(line)
+
+        ran = sum(result.status == 'ran' for result in results)
+        if options['dry_run']:
+            pending = sum(result.status == 'pending' for result in results)
+            self.stdout.write(self.style.SUCCESS(f'✓ Dry run: {pending}/{len(results)} stages would run'))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f'✓ {ran}/{len(results)} stages run in {elapsed:.2f}s, manifest: {pipeline.manifest_path}'
+            ))
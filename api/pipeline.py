@@ -0,0 +1,406 @@
+"""
+Pipeline incrémental de préparation des données du recommandeur.
+
+Les étapes forment un DAG : une étape dépend de celles qui produisent ses
+fichiers d'entrée. Il a deux branches indépendantes : aucune étape ne produit
+le CSV préparé (influenceurs_recommendation_ready.csv, colonnes normalisées
+et TF-IDF préparées hors du pipeline), source de features et artifact ;
+clean ne produit que le CSV nettoyé utilisé par l'import PostgreSQL
+(import_to_postgres.py). Modifier le CSV brut ne change donc pas l'artefact.
+
+    Top_Influencers_Full_1500.csv ──clean──> influenceurs_clean.csv (+ échantillon JSON)
+    influenceurs_recommendation_ready.csv ──features──> feature_matrix.npy, metadata.json,
+                                                       feature_columns.pkl, le_*.pkl
+    influenceurs_recommendation_ready.csv ──artifact──> data/recommender/<version> (artifacts.py)
+
+Les sorties de clean et features sont écrites sous data/generated/ (non
+versionné) : seules les sources du DAG sont suivies par git.
+
+La clé d'une étape est l'empreinte SHA-256 de ses fichiers d'entrée, du code
+qui la calcule et de ses paramètres. Une étape dont la clé et les empreintes
+des sorties correspondent au manifeste unique (data/pipeline_manifest.json)
+est sautée : après une modification du CSV préparé, seules features et
+artifact sont refaites ; après une modification du CSV brut, seulement clean.
+
+    python manage.py prepare_recommender_data
+    python manage.py prepare_recommender_data --dry-run
+    python manage.py prepare_recommender_data --stage artifact --force
+
+Les consommateurs appellent verify_stage() au lieu de régénérer
+silencieusement les fichiers manquants : StaleOutputs signale des sorties
+absentes, modifiées ou calculées sur des entrées qui ont changé depuis.
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+import pickle
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import LabelEncoder
+
+from .artifacts import CURRENT_FILE, MANIFEST_FILE, build_columns, file_sha256, write_artifact
+
+logger = logging.getLogger(__name__)
+
+# Incrémenter si la structure du manifeste change
+PIPELINE_FORMAT = 1
+
+PIPELINE_MANIFEST = os.path.join('data', 'pipeline_manifest.json')
+
+RAW_CSV = os.path.join('data', 'Top_Influencers_Full_1500.csv')
+# Aucune étape ne produit le CSV préparé : c'est une source du DAG, comme le CSV brut
+READY_CSV = os.path.join('data', 'influenceurs_recommendation_ready.csv')
+
+# Sorties générées, ignorées par git (.gitignore)
+GENERATED_DIR = os.path.join('data', 'generated')
+CLEAN_CSV = os.path.join(GENERATED_DIR, 'influenceurs_clean.csv')
+CLEAN_SAMPLE = os.path.join(GENERATED_DIR, 'influenceurs_clean_sample.json')
+FEATURE_MATRIX = os.path.join(GENERATED_DIR, 'feature_matrix.npy')
+METADATA = os.path.join(GENERATED_DIR, 'metadata.json')
+FEATURE_COLUMNS_FILE = os.path.join(GENERATED_DIR, 'feature_columns.pkl')
+LE_CATEGORY_FILE = os.path.join(GENERATED_DIR, 'le_category.pkl')
+LE_COUNTRY_FILE = os.path.join(GENERATED_DIR, 'le_country.pkl')
+ARTIFACT_DIR = os.path.join('data', 'recommender')
+
+# Colonnes de data/feature_matrix.npy (scores standardisés, codes, 10 premières composantes TF-IDF)
+FEATURE_COLUMNS = [
+    'followers_normalized',
+    'engagement_rate_normalized',
+    'posts_normalized',
+    'avg_likes_normalized',
+    'avg_comments_normalized',
+    'category_encoded',
+    'country_encoded',
+] + [f'tfidf_{i}' for i in range(10)]
+
+CLEAN_SAMPLE_ROWS = 50
+
+
+class StaleOutputs(Exception):
+    """Sorties d'une étape absentes ou incohérentes avec le manifeste du pipeline"""
+
+
+class Stage:
+    """
+    Étape du pipeline.
+
+    `func(paths, params)` reçoit les chemins absolus des entrées et sorties
+    déclarées ({'inputs': [...], 'outputs': [...]}) et renvoie la liste des
+    fichiers effectivement écrits (None : les sorties déclarées). Le code de
+    `func` et les fichiers de `code` font partie de la clé de l'étape.
+    """
+
+    def __init__(self, name, func, inputs, outputs, params=None, code=()):
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.params = params or {}
+        self.code = list(code)
+
+    def code_sha256(self):
+        digest = hashlib.sha256(inspect.getsource(self.func).encode('utf-8'))
+        for path in self.code:
+            digest.update(file_sha256(path).encode('ascii'))
+        return digest.hexdigest()
+
+    def key(self, input_hashes):
+        """Empreinte des entrées, du code et des paramètres de l'étape"""
+        payload = {
+            'stage': self.name,
+            'inputs': input_hashes,
+            'code': self.code_sha256(),
+            'params': self.params,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class StageResult:
+    """Résultat d'une étape : 'ran', 'skipped' ou 'pending' (dry run)"""
+
+    def __init__(self, name, status, reason, seconds=0.0):
+        self.name = name
+        self.status = status
+        self.reason = reason
+        self.seconds = seconds
+
+
+def _module_file(name):
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+
+
+def _write_atomic(path, write, mode='w'):
+    """Écrit `path` via un fichier temporaire renommé : un lecteur ne voit jamais de fichier partiel"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = os.path.join(os.path.dirname(path), f'.{os.path.basename(path)}.tmp')
+    with open(tmp_path, mode, encoding=None if 'b' in mode else 'utf-8') as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def run_clean(paths, params):
+    """CSV brut -> CSV nettoyé et échantillon JSON (voir clean_and_import.py)"""
+    from .clean_and_import import clean_csv
+
+    clean_path, sample_path = paths['outputs']
+    clean_df = clean_csv(paths['inputs'][0])
+    _write_atomic(clean_path, lambda f: clean_df.to_csv(f, index=False))
+    _write_atomic(sample_path, lambda f: clean_df.head(params['sample_rows']).to_json(
+        f, orient='records', indent=2, force_ascii=False
+    ))
+
+
+def run_features(paths, params):
+    """CSV préparé -> matrice de features, métadonnées et encodeurs"""
+    matrix_path, metadata_path, columns_path, le_category_path, le_country_path = paths['outputs']
+    df = pd.read_csv(paths['inputs'][0])
+    missing = [column for column in params['feature_columns'] if column not in df.columns]
+    if missing:
+        raise ValueError(f'Missing feature columns in {paths["inputs"][0]}: {missing}')
+
+    X = df[params['feature_columns']].fillna(0).to_numpy(dtype=np.float64)
+    _write_atomic(matrix_path, lambda f: np.save(f, X, allow_pickle=False), mode='wb')
+
+    metadata = {
+        'num_influencers': len(df),
+        'num_features': X.shape[1],
+        'categories': df['category'].dropna().unique().tolist(),
+        'countries': df['country'].dropna().unique().tolist(),
+        'date_prepared': datetime.now().isoformat(),
+        'columns': [column for column in df.columns if not column.startswith('tfidf_')],
+        'feature_columns': params['feature_columns'],
+    }
+    _write_atomic(metadata_path, lambda f: json.dump(metadata, f, ensure_ascii=False, indent=2))
+
+    _write_atomic(columns_path, lambda f: pickle.dump(params['feature_columns'], f), mode='wb')
+    for path, column in ((le_category_path, 'category'), (le_country_path, 'country')):
+        encoder = LabelEncoder().fit(df[column].fillna('Unknown'))
+        _write_atomic(path, lambda f: pickle.dump(encoder, f), mode='wb')
+
+
+def run_artifact(paths, params):
+    """CSV préparé -> artefact binaire versionné (et index de similarité pré-construits)"""
+    from .similarity_index import get_index_class
+
+    source = paths['inputs'][0]
+    root = os.path.dirname(paths['outputs'][0])
+    columns, vocab = build_columns(pd.read_csv(source))
+    version_dir = write_artifact(
+        root,
+        columns,
+        vocab,
+        source={'path': os.path.abspath(source), 'sha256': file_sha256(source)},
+        keep=params['keep'],
+        indexes={backend: get_index_class(backend).build(columns['features']) for backend in params['index']},
+    )
+    # CURRENT change à chaque version : le manifeste de la version identifie le contenu
+    return [paths['outputs'][0], os.path.join(version_dir, MANIFEST_FILE)]
+
+
+def default_stages(artifact_dir=ARTIFACT_DIR, index=(), keep=3):
+    """Étapes du pipeline, dans l'ordre de déclaration (chemins relatifs à la racine du projet)"""
+    return [
+        Stage(
+            'clean', run_clean,
+            inputs=[RAW_CSV],
+            outputs=[CLEAN_CSV, CLEAN_SAMPLE],
+            params={'sample_rows': CLEAN_SAMPLE_ROWS},
+            code=[_module_file('clean_and_import.py')],
+        ),
+        Stage(
+            'features', run_features,
+            inputs=[READY_CSV],
+            outputs=[FEATURE_MATRIX, METADATA, FEATURE_COLUMNS_FILE, LE_CATEGORY_FILE, LE_COUNTRY_FILE],
+            params={'feature_columns': FEATURE_COLUMNS},
+            code=[_module_file('pipeline.py')],
+        ),
+        Stage(
+            'artifact', run_artifact,
+            inputs=[READY_CSV],
+            outputs=[os.path.join(artifact_dir, CURRENT_FILE)],
+            params={'index': sorted(index), 'keep': keep},
+            code=[_module_file('artifacts.py'), _module_file('similarity_index.py')],
+        ),
+    ]
+
+
+def load_manifest(path):
+    """Manifeste du pipeline ({'format', 'stages': {nom: entrée}}), vide s'il n'existe pas"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return {'format': PIPELINE_FORMAT, 'stages': {}}
+    if manifest.get('format') != PIPELINE_FORMAT:
+        logger.warning(f"⚠ Ignoring pipeline manifest format {manifest.get('format')} (expected {PIPELINE_FORMAT})")
+        return {'format': PIPELINE_FORMAT, 'stages': {}}
+    return manifest
+
+
+class Pipeline:
+    """
+    Exécute les étapes périmées dans l'ordre du DAG et tient le manifeste à jour.
+
+    Le manifeste est réécrit (atomiquement) après chaque étape : une
+    exécution interrompue garde les étapes déjà terminées.
+    """
+
+    def __init__(self, base_dir, stages=None, manifest_path=None):
+        self.base_dir = base_dir
+        self.stages = stages if stages is not None else default_stages()
+        self.manifest_path = self.path(manifest_path or PIPELINE_MANIFEST)
+        self._by_name = {stage.name: stage for stage in self.stages}
+        if len(self._by_name) != len(self.stages):
+            raise ValueError('Duplicate stage names')
+
+    def path(self, path):
+        """Chemin absolu (les chemins relatifs partent de la racine du projet)"""
+        return os.path.join(self.base_dir, path)
+
+    def relative(self, path):
+        """Chemin enregistré dans le manifeste (relatif à la racine si possible)"""
+        relative = os.path.relpath(self.path(path), self.base_dir)
+        return path if relative.startswith('..') else relative
+
+    def upstream(self, stage):
+        """Étapes produisant les entrées de `stage`"""
+        inputs = {self.relative(path) for path in stage.inputs}
+        return [
+            other for other in self.stages
+            if other is not stage and inputs & {self.relative(path) for path in other.outputs}
+        ]
+
+    def ordered(self, names=None):
+        """
+        Étapes à considérer (celles de `names` et leurs dépendances), en ordre topologique.
+
+        Raises:
+            ValueError: étape inconnue ou cycle
+        """
+        unknown = set(names or ()) - set(self._by_name)
+        if unknown:
+            raise ValueError(f"Unknown stages: {', '.join(sorted(unknown))}")
+        ordered, visiting = [], set()
+
+        def visit(stage):
+            if stage in ordered:
+                return
+            if stage.name in visiting:
+                raise ValueError(f'Cycle in pipeline at stage {stage.name}')
+            visiting.add(stage.name)
+            for dependency in self.upstream(stage):
+                visit(dependency)
+            visiting.discard(stage.name)
+            ordered.append(stage)
+
+        for stage in (self._by_name[name] for name in names) if names else self.stages:
+            visit(stage)
+        return ordered
+
+    def hashes(self, paths):
+        """{chemin du manifeste: sha256} ; None pour un fichier absent"""
+        return {
+            self.relative(path): file_sha256(self.path(path)) if os.path.exists(self.path(path)) else None
+            for path in paths
+        }
+
+    def stale_reason(self, stage, entry, key):
+        """Raison de relancer `stage`, ou None si ses sorties sont à jour"""
+        if entry is None:
+            return 'never ran'
+        if entry.get('key') != key:
+            changed = [
+                path for path, digest in self.hashes(stage.inputs).items()
+                if entry.get('inputs', {}).get(path) != digest
+            ]
+            return f"inputs changed: {', '.join(changed)}" if changed else 'code or parameters changed'
+        for path, digest in entry.get('outputs', {}).items():
+            if not os.path.exists(self.path(path)):
+                return f'output missing: {path}'
+            if file_sha256(self.path(path)) != digest:
+                return f'output changed: {path}'
+        return None
+
+    def run(self, names=None, force=False, dry_run=False):
+        """
+        Exécute les étapes périmées parmi `names` (toutes par défaut) et leurs dépendances.
+
+        Returns:
+            Liste de StageResult, dans l'ordre d'exécution
+        """
+        manifest = load_manifest(self.manifest_path)
+        results, pending = [], set()
+        for stage in self.ordered(names):
+            # Sans exécution, les entrées d'une étape dont une dépendance est à relancer sont inconnues
+            if pending & {other.name for other in self.upstream(stage)}:
+                results.append(StageResult(stage.name, 'pending', 'upstream stage pending'))
+                pending.add(stage.name)
+                continue
+            missing = [path for path in stage.inputs if not os.path.exists(self.path(path))]
+            if missing:
+                raise FileNotFoundError(f"Stage {stage.name}: missing input {', '.join(missing)}")
+
+            input_hashes = self.hashes(stage.inputs)
+            key = stage.key(input_hashes)
+            reason = 'forced' if force else self.stale_reason(stage, manifest['stages'].get(stage.name), key)
+            if reason is None:
+                results.append(StageResult(stage.name, 'skipped', 'à jour'))
+                continue
+            if dry_run:
+                results.append(StageResult(stage.name, 'pending', reason))
+                pending.add(stage.name)
+                continue
+
+            logger.info(f"Running stage {stage.name} ({reason})")
+            start = time.perf_counter()
+            written = stage.func(
+                {'inputs': [self.path(path) for path in stage.inputs],
+                 'outputs': [self.path(path) for path in stage.outputs]},
+                stage.params,
+            )
+            seconds = time.perf_counter() - start
+            manifest['stages'][stage.name] = {
+                'key': key,
+                'inputs': input_hashes,
+                'outputs': self.hashes(written or stage.outputs),
+                'params': stage.params,
+                'completed_at': datetime.now(timezone.utc).isoformat(),
+                'seconds': round(seconds, 3),
+            }
+            manifest['updated_at'] = datetime.now(timezone.utc).isoformat()
+            _write_atomic(self.manifest_path, lambda f: json.dump(manifest, f, indent=2))
+            logger.info(f"✓ Stage {stage.name} done in {seconds:.2f}s")
+            results.append(StageResult(stage.name, 'ran', reason, seconds))
+        return results
+
+
+def verify_stage(base_dir, name, manifest_path=None):
+    """
+    Vérifie que les sorties de l'étape `name` sont celles du manifeste et
+    qu'elles ont été calculées sur les entrées actuelles.
+
+    Returns:
+        Entrée du manifeste pour l'étape
+
+    Raises:
+        StaleOutputs: étape jamais exécutée, entrée modifiée, sortie absente ou modifiée
+    """
+    pipeline = Pipeline(base_dir, stages=[], manifest_path=manifest_path)
+    entry = load_manifest(pipeline.manifest_path)['stages'].get(name)
+    hint = "run 'python manage.py prepare_recommender_data'"
+    if entry is None:
+        raise StaleOutputs(f'Stage {name} has no entry in {pipeline.manifest_path} ({hint})')
+    for kind, recorded in (('input', entry['inputs']), ('output', entry['outputs'])):
+        for path, digest in recorded.items():
+            current = pipeline.hashes([path])[path]
+            if current is None:
+                raise StaleOutputs(f'Stage {name}: {kind} {path} is missing ({hint})')
+            if current != digest:
+                raise StaleOutputs(f'Stage {name}: {kind} {path} changed since the stage ran ({hint})')
+    return entry
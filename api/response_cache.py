@@ -0,0 +1,191 @@
+"""
+Cache des réponses du recommandeur (recommend, search, modèle pondéré).
+
+Les mêmes combinaisons (catégorie, pays, n...) reviennent très souvent : la
+réponse calculée est gardée avec une durée de vie (TTL) et une taille bornée
+(éviction LRU). La clé contient la version des données servies, donc un
+rechargement de l'artefact invalide toutes les entrées.
+
+Backends (setting RECOMMENDER_CACHE['BACKEND']) :
+    - 'inprocess' : OrderedDict protégé par un verrou, propre à chaque worker
+    - 'django'    : framework de cache Django (locmem, fichier, redis...) ;
+                    la taille est bornée par MAX_ENTRIES du cache choisi
+    - 'none'      : désactivé
+
+    cache = get_response_cache()
+    result = cache.get_or_compute(make_key('recommend', version, category, country, n), compute)
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+# Valeur sentinelle : distingue "absent" d'un résultat mis en cache
+_MISSING = object()
+
+DEFAULT_CACHE_CONFIG = {
+    'BACKEND': 'inprocess',
+    'MAX_ENTRIES': 1024,
+    'TTL': 300,
+    'ALIAS': 'default',
+}
+
+
+def make_key(namespace, data_version, *parts):
+    """Clé stable à partir d'un espace de noms, de la version des données et de la requête normalisée"""
+    raw = repr((namespace, data_version) + parts)
+    return f"rec:{namespace}:{hashlib.sha1(raw.encode('utf-8')).hexdigest()}"
+
+
+class ResponseCache:
+    """Interface commune : get/set, compteurs hits/misses"""
+
+    backend = None
+
+    def __init__(self, ttl=300):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def get(self, key):
+        """Valeur en cache ou _MISSING"""
+        raise NotImplementedError
+
+    def set(self, key, value):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def get_or_compute(self, key, compute):
+        """Retourne la valeur en cache, sinon la calcule avec `compute()` et la stocke"""
+        value = self.get(key)
+        with self._stats_lock:
+            if value is _MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if value is _MISSING:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'backend': self.backend,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+class InProcessCache(ResponseCache):
+    """Cache LRU avec TTL en mémoire du processus"""
+
+    backend = 'inprocess'
+
+    def __init__(self, max_entries=1024, ttl=300):
+        super().__init__(ttl=ttl)
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        return {**super().stats(), 'entries': len(self), 'max_entries': self.max_entries}
+
+
+class DjangoCache(ResponseCache):
+    """Cache adossé au framework de cache Django (partageable entre workers)"""
+
+    backend = 'django'
+
+    def __init__(self, alias='default', ttl=300):
+        super().__init__(ttl=ttl)
+        from django.core.cache import caches
+        self.alias = alias
+        self._cache = caches[alias]
+
+    def get(self, key):
+        return self._cache.get(key, _MISSING)
+
+    def set(self, key, value):
+        self._cache.set(key, value, timeout=self.ttl)
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self):
+        return {**super().stats(), 'alias': self.alias}
+
+
+class NullCache(ResponseCache):
+    """Cache désactivé : chaque appel est un miss"""
+
+    backend = 'none'
+
+    def get(self, key):
+        return _MISSING
+
+    def set(self, key, value):
+        pass
+
+    def clear(self):
+        pass
+
+
+def build_response_cache(config=None):
+    """Instancie le backend décrit par un dict de configuration (voir DEFAULT_CACHE_CONFIG)"""
+    config = {**DEFAULT_CACHE_CONFIG, **(config or {})}
+    backend = config['BACKEND']
+    if backend == 'inprocess':
+        return InProcessCache(max_entries=config['MAX_ENTRIES'], ttl=config['TTL'])
+    if backend == 'django':
+        return DjangoCache(alias=config['ALIAS'], ttl=config['TTL'])
+    if backend == 'none':
+        return NullCache(ttl=config['TTL'])
+    raise ValueError(f"Unknown response cache backend '{backend}'. Available: ['django', 'inprocess', 'none']")
+
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """Cache partagé par les vues, configuré par le setting RECOMMENDER_CACHE"""
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                from django.conf import settings
+                _response_cache = build_response_cache(getattr(settings, 'RECOMMENDER_CACHE', None))
+    return _response_cache
@@ -0,0 +1,93 @@
+"""
+Moteur de similarité cosinus à la demande pour le recommandeur Brandfluence.
+
+Au lieu de conserver la matrice N×N de cosine_similarity (quadratique en
+mémoire), on garde uniquement les lignes de features normalisées L2 en
+float32. Les scores d'un influenceur de référence s'obtiennent alors par un
+simple produit matrice-vecteur, et le top-k par np.argpartition.
+"""
+
+import numpy as np
+
+
+def top_k_indices(scores, k, candidates=None):
+    """
+    Retourne les indices des k meilleurs scores, triés par score décroissant.
+
+    Args:
+        scores: Vecteur de scores (une valeur par influenceur)
+        k: Nombre de résultats souhaités
+        candidates: Tableau optionnel d'indices auxquels restreindre la sélection
+
+    Returns:
+        np.ndarray d'indices (dans l'espace de `scores`)
+    """
+    if candidates is None:
+        candidates = np.arange(len(scores))
+    candidates = np.asarray(candidates, dtype=np.intp)
+    if k <= 0 or len(candidates) == 0:
+        return np.empty(0, dtype=np.intp)
+
+    candidate_scores = scores[candidates]
+    if k < len(candidates):
+        part = np.argpartition(-candidate_scores, k - 1)[:k]
+    else:
+        part = np.arange(len(candidates))
+
+    # argpartition ne trie pas : on ordonne seulement les k retenus
+    order = np.argsort(-candidate_scores[part], kind='stable')
+    return candidates[part[order]]
+
+
+def normalize_rows(X):
+    """Normalise chaque ligne (norme L2) et convertit en float32 contigu"""
+    vectors = np.asarray(X, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    # Éviter la division par zéro pour les lignes nulles
+    norms[norms == 0] = 1.0
+    return np.ascontiguousarray(vectors / norms, dtype=np.float32)
+
+
+class CosineTopKEngine:
+    """
+    Similarité cosinus calculée à la demande à partir de vecteurs normalisés.
+
+    Example:
+        engine = CosineTopKEngine(X)
+        indices, scores = engine.top_k(ref_idx, k=5)
+    """
+
+    def __init__(self, X):
+        self.vectors = normalize_rows(X)
+
+    @classmethod
+    def from_normalized(cls, vectors):
+        """Réutilise des vecteurs déjà normalisés sans copie (ex: tableau mmap)"""
+        engine = object.__new__(cls)
+        engine.vectors = vectors
+        return engine
+
+    def __len__(self):
+        return self.vectors.shape[0]
+
+    @property
+    def nbytes(self):
+        """Mémoire occupée par les vecteurs (octets)"""
+        return self.vectors.nbytes
+
+    def scores(self, idx):
+        """Similarité cosinus entre la ligne `idx` et toutes les autres"""
+        return self.vectors @ self.vectors[idx]
+
+    def top_k(self, idx, k, exclude_self=True):
+        """
+        Les k influenceurs les plus similaires à `idx`.
+
+        Returns:
+            Tuple (indices, scores) triés par similarité décroissante
+        """
+        scores = self.scores(idx)
+        if exclude_self:
+            scores[idx] = -np.inf
+        indices = top_k_indices(scores, k)
+        return indices, scores[indices]
@@ -0,0 +1,287 @@
+"""
+Index de similarité interchangeables pour le recommandeur Brandfluence.
+
+Tous les index travaillent sur des vecteurs normalisés L2 (cosinus = produit
+scalaire) et exposent la même interface :
+
+    index = get_index_class('ivf').build(vectors)
+    index.save(directory)
+    index = load_index(directory, vectors)
+    indices, scores = index.query(query_vector, k, mask=None)
+
+Backends disponibles (setting RECOMMENDER_INDEX_BACKEND) :
+    - 'brute'   : recherche exacte (produit matrice-vecteur + argpartition)
+    - 'kdtree'  : sklearn KDTree (exact, distance euclidienne sur la sphère)
+    - 'balltree': sklearn BallTree
+    - 'ivf'     : index inversé approximatif, quantification grossière par k-means (NumPy pur)
+"""
+
+import json
+import os
+import pickle
+
+import numpy as np
+from sklearn.neighbors import BallTree, KDTree
+
+from .similarity import top_k_indices
+
+INDEX_META_FILE = 'index.json'
+
+
+class SimilarityIndex:
+    """Interface commune des index de similarité"""
+
+    name = None
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+
+    def __len__(self):
+        return self.vectors.shape[0]
+
+    @classmethod
+    def build(cls, vectors, **params):
+        """Construit l'index à partir des vecteurs normalisés"""
+        return cls(vectors, **params)
+
+    def params(self):
+        """Paramètres à persister avec l'index"""
+        return {}
+
+    def save(self, directory):
+        """Persiste l'index (les vecteurs eux-mêmes restent dans l'artefact)"""
+        os.makedirs(directory, exist_ok=True)
+        self._save_state(directory)
+        with open(os.path.join(directory, INDEX_META_FILE), 'w', encoding='utf-8') as f:
+            json.dump({'backend': self.name, 'rows': len(self), 'params': self.params()}, f, indent=2)
+
+    @classmethod
+    def load(cls, directory, vectors):
+        """Recharge un index sauvegardé par save()"""
+        with open(os.path.join(directory, INDEX_META_FILE), encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta['rows'] != len(vectors):
+            raise ValueError(f"Index built for {meta['rows']} rows, got {len(vectors)} vectors")
+        return cls._load_state(directory, vectors, **meta['params'])
+
+    def _save_state(self, directory):
+        pass
+
+    @classmethod
+    def _load_state(cls, directory, vectors, **params):
+        return cls(vectors, **params)
+
+    def query(self, query_vector, k, mask=None):
+        """
+        Les k vecteurs les plus similaires à `query_vector`.
+
+        Args:
+            query_vector: Vecteur normalisé
+            k: Nombre de résultats
+            mask: Tableau booléen optionnel (True = candidat autorisé)
+
+        Returns:
+            Tuple (indices, scores cosinus) triés par score décroissant
+        """
+        raise NotImplementedError
+
+    def _exact(self, query_vector, k, candidates):
+        """Top-k exact restreint à un ensemble de candidats"""
+        candidates = np.asarray(candidates, dtype=np.intp)
+        scores = self.vectors[candidates] @ query_vector
+        order = top_k_indices(scores, k)
+        return candidates[order], scores[order]
+
+
+class BruteForceIndex(SimilarityIndex):
+    """Recherche exacte sur tous les vecteurs"""
+
+    name = 'brute'
+
+    def query(self, query_vector, k, mask=None):
+        if mask is None:
+            scores = self.vectors @ query_vector
+            indices = top_k_indices(scores, k)
+            return indices, scores[indices]
+        return self._exact(query_vector, k, np.flatnonzero(mask))
+
+
+class _TreeIndex(SimilarityIndex):
+    """
+    Index arborescent sklearn. Sur des vecteurs unitaires, la distance
+    euclidienne est monotone avec le cosinus : cos = 1 - d² / 2.
+
+    Les arbres ne savent pas filtrer : avec un masque, on sur-échantillonne
+    puis on double k jusqu'à obtenir assez de candidats autorisés.
+    """
+
+    tree_class = None
+
+    def __init__(self, vectors, leaf_size=40, tree=None):
+        super().__init__(vectors)
+        self.leaf_size = leaf_size
+        self.tree = tree if tree is not None else self.tree_class(
+            np.asarray(vectors, dtype=np.float64), leaf_size=leaf_size
+        )
+
+    def params(self):
+        return {'leaf_size': self.leaf_size}
+
+    def _save_state(self, directory):
+        with open(os.path.join(directory, f'{self.name}.pkl'), 'wb') as f:
+            pickle.dump(self.tree, f)
+
+    @classmethod
+    def _load_state(cls, directory, vectors, **params):
+        with open(os.path.join(directory, f'{cls.name}.pkl'), 'rb') as f:
+            tree = pickle.load(f)
+        return cls(vectors, tree=tree, **params)
+
+    def query(self, query_vector, k, mask=None):
+        n_rows = len(self)
+        if mask is not None:
+            allowed = int(np.count_nonzero(mask))
+            if allowed <= k:
+                # Moins de candidats que k : le calcul exact est plus simple
+                return self._exact(query_vector, k, np.flatnonzero(mask))
+        fetch = min(k if mask is None else k * 4, n_rows)
+        point = np.asarray(query_vector, dtype=np.float64).reshape(1, -1)
+        while True:
+            distances, indices = self.tree.query(point, k=fetch)
+            distances, indices = distances[0], indices[0]
+            if mask is not None:
+                keep = mask[indices]
+                distances, indices = distances[keep], indices[keep]
+            if len(indices) >= k or fetch >= n_rows:
+                break
+            fetch = min(fetch * 2, n_rows)
+        indices = indices[:k]
+        return indices, (1.0 - distances[:k] ** 2 / 2.0).astype(np.float32)
+
+
+class KDTreeIndex(_TreeIndex):
+    name = 'kdtree'
+    tree_class = KDTree
+
+
+class BallTreeIndex(_TreeIndex):
+    name = 'balltree'
+    tree_class = BallTree
+
+
+def _assign(vectors, centroids, chunk_size=16384):
+    """Centroïde le plus proche (cosinus) de chaque vecteur, par blocs"""
+    assignments = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), chunk_size):
+        block = vectors[start:start + chunk_size]
+        assignments[start:start + chunk_size] = np.argmax(block @ centroids.T, axis=1)
+    return assignments
+
+
+def spherical_kmeans(vectors, n_clusters, n_iter=20, seed=0):
+    """k-means sphérique (centroïdes normalisés) en NumPy pur"""
+    rng = np.random.default_rng(seed)
+    vectors = np.asarray(vectors, dtype=np.float32)
+    centroids = vectors[rng.choice(len(vectors), n_clusters, replace=False)].copy()
+
+    for _ in range(n_iter):
+        assignments = _assign(vectors, centroids)
+        counts = np.bincount(assignments, minlength=n_clusters)
+        sums = np.stack([
+            np.bincount(assignments, weights=vectors[:, d], minlength=n_clusters)
+            for d in range(vectors.shape[1])
+        ], axis=1)
+
+        # Clusters vides : réinitialisés sur des points aléatoires
+        empty = counts == 0
+        sums[empty] = vectors[rng.choice(len(vectors), int(empty.sum()), replace=False)]
+
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        centroids = (sums / norms).astype(np.float32)
+
+    return centroids, _assign(vectors, centroids)
+
+
+class IVFIndex(SimilarityIndex):
+    """
+    Index inversé (IVF) : les vecteurs sont répartis en `n_lists` listes par
+    k-means ; une requête ne visite que les `n_probe` listes dont le
+    centroïde est le plus proche, puis calcule les scores exacts sur ces
+    candidats.
+    """
+
+    name = 'ivf'
+
+    def __init__(self, vectors, n_lists=None, n_probe=None, centroids=None, offsets=None, ids=None):
+        super().__init__(vectors)
+        n_rows = len(vectors)
+        self.n_lists = n_lists or max(1, min(int(np.sqrt(n_rows)), 1024))
+        self.n_probe = n_probe or max(1, self.n_lists // 8)
+
+        if centroids is None:
+            centroids, assignments = spherical_kmeans(vectors, self.n_lists)
+            ids = np.argsort(assignments, kind='stable').astype(np.intp)
+            offsets = np.concatenate([[0], np.cumsum(np.bincount(assignments, minlength=self.n_lists))])
+        self.centroids = centroids
+        self.offsets = offsets
+        self.ids = ids
+
+    def params(self):
+        return {'n_lists': self.n_lists, 'n_probe': self.n_probe}
+
+    def _save_state(self, directory):
+        np.save(os.path.join(directory, 'ivf_centroids.npy'), self.centroids, allow_pickle=False)
+        np.save(os.path.join(directory, 'ivf_offsets.npy'), self.offsets, allow_pickle=False)
+        np.save(os.path.join(directory, 'ivf_ids.npy'), self.ids, allow_pickle=False)
+
+    @classmethod
+    def _load_state(cls, directory, vectors, **params):
+        arrays = {
+            name: np.load(os.path.join(directory, f'ivf_{name}.npy'), mmap_mode='r', allow_pickle=False)
+            for name in ('centroids', 'offsets', 'ids')
+        }
+        return cls(vectors, **params, **arrays)
+
+    def query(self, query_vector, k, mask=None):
+        probe_order = np.argsort(-(self.centroids @ query_vector))
+        n_probe = self.n_probe
+        probed = 0
+        parts = []
+        found = 0
+
+        # Élargit la recherche tant qu'il n'y a pas assez de candidats autorisés
+        while probed < self.n_lists:
+            for list_id in probe_order[probed:n_probe]:
+                part = self.ids[self.offsets[list_id]:self.offsets[list_id + 1]]
+                if mask is not None:
+                    part = part[mask[part]]
+                parts.append(part)
+                found += len(part)
+            probed = min(n_probe, self.n_lists)
+            if found >= k:
+                break
+            n_probe *= 2
+
+        candidates = np.concatenate(parts) if parts else np.empty(0, dtype=np.intp)
+        return self._exact(query_vector, k, candidates)
+
+
+INDEX_BACKENDS = {
+    cls.name: cls for cls in (BruteForceIndex, KDTreeIndex, BallTreeIndex, IVFIndex)
+}
+
+
+def get_index_class(name):
+    """Classe d'index correspondant au nom de backend"""
+    try:
+        return INDEX_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown similarity index backend '{name}'. Available: {sorted(INDEX_BACKENDS)}")
+
+
+def load_index(directory, vectors):
+    """Recharge un index sauvegardé, quel que soit son backend"""
+    with open(os.path.join(directory, INDEX_META_FILE), encoding='utf-8') as f:
+        backend = json.load(f)['backend']
+    return get_index_class(backend).load(directory, vectors)
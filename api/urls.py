@@ -4,12 +4,15 @@ from . import views
 urlpatterns = [
     # Health and Stats
     path('health/', views.HealthCheckView.as_view(), name='health-check'),
+    path('health/ready/', views.ReadinessView.as_view(), name='readiness-check'),
     path('stats/', views.StatsView.as_view(), name='stats'),
     path('categories/', views.CategoriesView.as_view(), name='categories'),
     path('countries/', views.CountriesView.as_view(), name='countries'),
     
     # Recommendations
     path('recommend/', views.RecommendView.as_view(), name='recommend'),
+    path('recommend/weighted/', views.WeightedRecommendView.as_view(), name='recommend-weighted'),
+    path('recommend/batch/', views.BatchRecommendView.as_view(), name='recommend-batch'),
     
     # Search
     path('search/', views.SearchView.as_view(), name='search'),
@@ -5,26 +5,48 @@ from rest_framework import status
 from rest_framework.permissions import AllowAny
 import pandas as pd
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.preprocessing import StandardScaler, LabelEncoder
+import hashlib
 import os
 import logging
+import threading
+import time
 import traceback
 
+from .artifacts import ArtifactNotFound, build_columns, candidate_data_paths, file_sha256, load_artifact
+from .catalog_index import CatalogIndex
+from .response_cache import get_response_cache, make_key
+from .similarity import CosineTopKEngine, top_k_indices
+from .similarity_index import BruteForceIndex, get_index_class
+from .weighted_scoring import DEFAULT_WEIGHTS, top_n, weighted_scores
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
+MAX_BATCH_QUERIES = 100
+
 class HealthCheckView(APIView):
     """Vérification de la santé de l'API"""
     permission_classes = [AllowAny]
     
     def get(self, request):
+        # Liveness : le processus répond. La readiness (recommandeur chargé) est rapportée à part.
         return Response({
             'status': 'healthy',
             'service': 'Brandfluence Recommendation API',
-            'version': '1.0.0'
+            'version': '1.0.0',
+            'readiness': get_readiness(),
+            'cache': get_response_cache().stats()
         })
 
+class ReadinessView(APIView):
+    """Readiness : 200 seulement quand le recommandeur est chargé et préchauffé"""
+    permission_classes = [AllowAny]
+    
+    def get(self, request):
+        readiness = get_readiness()
+        code = status.HTTP_200_OK if readiness['state'] == 'ready' else status.HTTP_503_SERVICE_UNAVAILABLE
+        return Response(readiness, status=code)
+
 class BrandfluenceRecommender:
     """Système de recommandation Brandfluence - VERSION CORRIGÉE"""
     
@@ -48,17 +70,21 @@ class BrandfluenceRecommender:
             logger.info(f"Initializing recommender. BASE_DIR: {settings.BASE_DIR}")
             logger.info(f"Current working directory: {os.getcwd()}")
             
-            # Try multiple paths
-            possible_paths = [
-                os.path.join(settings.BASE_DIR, 'data', 'influenceurs_recommendation_ready.csv'),
-                os.path.join(settings.BASE_DIR, 'data', 'influenceurs_clean.csv'),
-                os.path.join(settings.BASE_DIR, 'api', 'data', 'influenceurs_recommendation_ready.csv'),
-                'data/influenceurs_recommendation_ready.csv',
-                'api/data/influenceurs_recommendation_ready.csv',
-                '../data/influenceurs_recommendation_ready.csv',
-                '/app/data/influenceurs_recommendation_ready.csv',
-                '/app/api/data/influenceurs_recommendation_ready.csv'
-            ]
+            # 1. Artefact binaire partagé entre workers (mmap), si disponible
+            artifact_dir = getattr(settings, 'RECOMMENDER_ARTIFACT_DIR', None)
+            if artifact_dir:
+                try:
+                    columns, vocab, manifest = load_artifact(artifact_dir)
+                    self.artifact_version = manifest['version']
+                    logger.info(f"✓ Using recommender artifact {manifest['version']} ({manifest['rows']} rows)")
+                    index_dir = os.path.join(artifact_dir, manifest['version'], 'index')
+                    self._load_columns(columns, vocab, manifest['version'], index_dir=index_dir)
+                    return
+                except ArtifactNotFound as e:
+                    logger.warning(f"⚠ {e} - falling back to CSV (run 'manage.py prepare_recommender_data')")
+            
+            # 2. Sinon, reconstruction depuis le CSV préparé
+            possible_paths = candidate_data_paths(settings.BASE_DIR)
             
             # Log all paths being checked
             logger.info(f"Checking {len(possible_paths)} possible data file locations...")
@@ -82,167 +108,279 @@ class BrandfluenceRecommender:
                 if os.path.exists(os.path.join(settings.BASE_DIR, 'api', 'data')):
                     logger.error(f"Files in api/data/: {os.listdir(os.path.join(settings.BASE_DIR, 'api', 'data'))}")
                 
-                self.df = pd.DataFrame()
-                self.X = None
-                self.similarity_matrix = None
+                self.size = 0
+                self.engine = None
                 self.categories = []
                 self.countries = []
                 return
             
-            self.df = pd.read_csv(data_path)
-            logger.info(f"✓ Données chargées: {len(self.df)} influenceurs")
-            logger.info(f"✓ Columns: {list(self.df.columns)}")
-            
-            # Créer la matrice de features
-            self.X = self._create_feature_matrix()
-            logger.info(f"✓ Feature matrix created: {self.X.shape}")
-            
-            # Calculer la matrice de similarité
-            self.similarity_matrix = cosine_similarity(self.X)
-            logger.info(f"✓ Matrice de similarité: {self.similarity_matrix.shape}")
-            
-            # Stocker les valeurs uniques
-            self.categories = sorted(self.df['category'].dropna().unique().tolist())
-            self.countries = sorted(self.df['country'].dropna().unique().tolist())
-            logger.info(f"✓ Categories: {len(self.categories)}, Countries: {len(self.countries)}")
+            # Même CSV => même version dans tous les workers : les clés du cache partagé coïncident
+            self._load_dataframe(pd.read_csv(data_path), data_version=f'csv-{file_sha256(data_path)[:16]}')
             
         except Exception as e:
             logger.error(f"✗ Erreur d'initialisation: {e}")
             logger.error(f"✗ Traceback: {traceback.format_exc()}")
             raise
     
-    def _create_feature_matrix(self):
-        """Crée la matrice de features"""
-        scaler = StandardScaler()
-        features_list = []
-        
-        # Normaliser les features numériques
-        for col in ['followers', 'engagement_rate', 'global_score']:
-            if col in self.df.columns:
-                normalized = scaler.fit_transform(self.df[[col]].fillna(0))
-                features_list.append(normalized)
-        
-        # Encoder la catégorie
-        if 'category' in self.df.columns:
-            le = LabelEncoder()
-            category_encoded = le.fit_transform(self.df['category'].fillna('Unknown')).reshape(-1, 1)
-            features_list.append(category_encoded)
+    @classmethod
+    def from_dataframe(cls, df, index_backend=None):
+        """Construit un recommandeur hors singleton (benchmarks, scripts)"""
+        instance = object.__new__(cls)
+        instance.initialized = True
+        instance._load_dataframe(df, index_backend=index_backend)
+        return instance
+    
+    def _load_dataframe(self, df, index_backend=None, data_version=None):
+        """Construit les colonnes en mémoire à partir du DataFrame préparé"""
+        logger.info(f"✓ Données chargées: {len(df)} influenceurs")
+        logger.info(f"✓ Columns: {list(df.columns)}")
+        self.artifact_version = None
+        if data_version is None:
+            # Sans fichier source : empreinte du contenu, identique pour des workers lisant les mêmes données
+            digest = hashlib.sha256(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+            data_version = f'memory-{digest.hexdigest()[:16]}'
+        columns, vocab = build_columns(df)
+        self._load_columns(columns, vocab, data_version, index_backend=index_backend)
+    
+    def _load_columns(self, columns, vocab, data_version, index_dir=None, index_backend=None):
+        """Prépare le moteur, les codes et l'index à partir des colonnes (mmap ou mémoire)"""
+        self.size = len(columns['names'])
+        # Version des données servies (clé du cache de réponses) : version de l'artefact ou empreinte du CSV
+        self.data_version = data_version
+        
+        # Moteur de similarité à la demande (pas de matrice N×N en mémoire)
+        self.engine = CosineTopKEngine.from_normalized(columns['features'])
+        logger.info(f"✓ Similarity engine: {len(self.engine)} vectors, {self.engine.nbytes / 1024:.1f} KB")
+        
+        # Index de similarité (brute force, arbre ou IVF selon RECOMMENDER_INDEX_BACKEND)
+        self.similarity_index = self._open_similarity_index(index_backend, index_dir)
+        
+        # Codes entiers catégorie/pays (valeurs normalisées en .title())
+        self.category_codes = columns['category_codes']
+        self.country_codes = columns['country_codes']
+        self._category_lookup = {value: code for code, value in enumerate(vocab['category'])}
+        self._country_lookup = {value: code for code, value in enumerate(vocab['country'])}
+        
+        # Index catégorie/pays -> row ids triés par global_score
+        self.index = CatalogIndex(
+            self.category_codes, vocab['category'],
+            self.country_codes, vocab['country'],
+            columns['global_score'],
+        )
         
-        # Encoder le pays
-        if 'country' in self.df.columns:
-            le = LabelEncoder()
-            country_encoded = le.fit_transform(self.df['country'].fillna('Unknown')).reshape(-1, 1)
-            features_list.append(country_encoded)
+        # Colonnes utilisées pour construire les réponses
+        self._names = columns['names']
+        self._category_values = columns['category']
+        self._country_values = columns['country']
+        self._followers = columns['followers']
+        self._engagement = columns['engagement_rate']
+        self._global_score = columns['global_score']
+        
+        # Feature store du modèle pondéré, et cache des combinaisons fréquentes
+        self.weighted_features = {
+            'engagement': columns.get('engagement_rate_normalized'),
+            'followers': columns.get('followers_normalized'),
+            'global_score': columns['global_score'],
+            'category_codes': self.category_codes,
+            'country_codes': self.country_codes,
+        }
         
-        return np.hstack(features_list) if features_list else np.random.randn(len(self.df), 5)
+        # Stocker les valeurs uniques
+        self.categories = list(vocab['categories'])
+        self.countries = list(vocab['countries'])
+        logger.info(f"✓ Categories: {len(self.categories)}, Countries: {len(self.countries)}")
+    
+    def _open_similarity_index(self, backend=None, index_dir=None):
+        """Recharge l'index pré-construit dans l'artefact, ou le construit en mémoire"""
+        from django.conf import settings
+        backend = backend or getattr(settings, 'RECOMMENDER_INDEX_BACKEND', 'brute')
+        index_class = get_index_class(backend)
+        
+        path = os.path.join(index_dir, backend) if index_dir else None
+        if path and os.path.exists(path):
+            try:
+                index = index_class.load(path, self.engine.vectors)
+                logger.info(f"✓ Similarity index '{backend}' loaded from {path}")
+                return index
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠ Could not load similarity index from {path}: {e}")
+        
+        index = index_class.build(self.engine.vectors)
+        logger.info(f"✓ Similarity index '{backend}' built in memory")
+        return index
+    
+    def is_available(self):
+        """True si des données de recommandation sont chargées"""
+        return getattr(self, 'size', 0) > 0 and self.engine is not None
     
     def recommend(self, category, country, n=5):
         """Recommande des influenceurs AVEC FILTRES PAR CATÉGORIE/PAYS"""
         # Check if data is available
-        if self.df is None or len(self.df) == 0 or self.similarity_matrix is None:
+        if not self.is_available():
             return {'error': 'Recommender data not available'}
         
-        category = str(category).strip().title()
-        country = str(country).strip().title()
-        n = max(1, min(n, 20))
-        
-        # 1. Filtrer par catégorie et pays
-        mask = (self.df['category'].str.title() == category) & \
-               (self.df['country'].str.title() == country)
+        category, country, n = self.normalize_query(category, country, n)
         
-        if not mask.any():
-            mask = self.df['category'].str.title() == category
-            if not mask.any():
-                return {'error': f'Aucun influenceur trouvé pour {category}/{country}'}
+        # 1. Get reference influencer (meilleur global_score du segment)
+        idx = self._reference_index(category, country)
+        if idx is None:
+            return {'error': f'Aucun influenceur trouvé pour {category}/{country}'}
         
-        # 2. Get reference influencer
-        if 'global_score' in self.df.columns and mask.any():
-            idx = self.df[mask]['global_score'].idxmax()
+        query_vector = self.engine.vectors[idx]
+        return self._tiered_recommendations(
+            category, country, n, idx,
+            lambda k, mask: self.similarity_index.query(query_vector, k, mask)
+        )
+    
+    @staticmethod
+    def normalize_query(category, country, n):
+        """Forme canonique (Category, Country, n borné à [1, 20]) d'une requête"""
+        return str(category).strip().title(), str(country).strip().title(), max(1, min(n, 20))
+    
+    def recommend_batch(self, queries):
+        """
+        Recommandations pour une liste de requêtes {category, country, n}.
+        
+        Les requêtes identiques (après normalisation) ne sont calculées qu'une
+        fois. Avec l'index exact, les scores de toutes les références sont
+        obtenus en un seul produit matriciel (N × Q).
+        
+        Returns:
+            Liste de résultats (même format que recommend()), dans l'ordre des requêtes
+        """
+        if not self.is_available():
+            return [{'error': 'Recommender data not available'} for _ in queries]
+        
+        keys = [self.normalize_query(*query) for query in queries]
+        unique_keys = list(dict.fromkeys(keys))
+        results = {}
+        resolved = []
+        for key in unique_keys:
+            idx = self._reference_index(key[0], key[1])
+            if idx is None:
+                results[key] = {'error': f'Aucun influenceur trouvé pour {key[0]}/{key[1]}'}
+            else:
+                resolved.append((key, idx))
+        
+        if resolved and isinstance(self.similarity_index, BruteForceIndex):
+            vectors = self.engine.vectors
+            score_matrix = vectors @ vectors[[idx for _, idx in resolved]].T
+            for column, ((category, country, n), idx) in enumerate(resolved):
+                scores = score_matrix[:, column]
+                results[(category, country, n)] = self._tiered_recommendations(
+                    category, country, n, idx,
+                    lambda k, mask, scores=scores: self._top_k_from_scores(scores, k, mask)
+                )
         else:
-            idx = self.df[mask].index[0]
+            # Index approché : même chemin que recommend() pour des résultats identiques
+            for (category, country, n), idx in resolved:
+                results[(category, country, n)] = self.recommend(category, country, n)
         
-        reference = self.df.iloc[idx]
-        
-        # 3. Get ALL similar influencers
-        similar_indices = np.argsort(self.similarity_matrix[idx])[::-1][1:]  # Tous sauf lui-même
-        similarity_scores = self.similarity_matrix[idx][similar_indices]
-        
-        # 4. FILTRER pour ne garder que ceux de la même catégorie/pays
-        filtered_indices = []
-        filtered_scores = []
-        
-        for inf_idx, score in zip(similar_indices, similarity_scores):
-            inf = self.df.iloc[inf_idx]
-            # Vérifier si l'influenceur a la même catégorie et pays
-            if (str(inf['category']).title() == category and 
-                str(inf['country']).title() == country):
-                filtered_indices.append(inf_idx)
-                filtered_scores.append(score)
-                
-                # Arrêter quand on a assez de résultats
-                if len(filtered_indices) >= n:
-                    break
-        
-        # Si pas assez de résultats avec le filtrage strict, assouplir
-        if len(filtered_indices) < n:
-            # Accepter juste la même catégorie
-            for inf_idx, score in zip(similar_indices, similarity_scores):
-                if inf_idx in filtered_indices:
-                    continue
-                    
-                inf = self.df.iloc[inf_idx]
-                if str(inf['category']).title() == category:
-                    filtered_indices.append(inf_idx)
-                    filtered_scores.append(score)
-                    
-                    if len(filtered_indices) >= n:
-                        break
-        
-        # Si toujours pas assez, prendre les plus similaires tout court
-        if len(filtered_indices) < n:
-            for inf_idx, score in zip(similar_indices, similarity_scores):
-                if inf_idx in filtered_indices:
-                    continue
-                    
-                filtered_indices.append(inf_idx)
-                filtered_scores.append(score)
-                
-                if len(filtered_indices) >= n:
-                    break
+        return [results[key] for key in keys]
+    
+    @staticmethod
+    def _top_k_from_scores(scores, k, mask):
+        indices = top_k_indices(scores, k, np.flatnonzero(mask))
+        return indices, scores[indices]
+    
+    def _tiered_recommendations(self, category, country, n, idx, query):
+        """
+        Sélection par paliers autour de l'influenceur de référence `idx`.
+        
+        `query(k, mask)` retourne les k plus similaires autorisés par `mask`.
+        """
+        # 2. Masques catégorie/pays (comparaison sur codes entiers)
+        category_match = self.category_codes == self._category_lookup.get(category, -2)
+        strict_match = category_match & (self.country_codes == self._country_lookup.get(country, -2))
+        
+        # 3. Candidats : tous sauf lui-même
+        available = np.ones(self.size, dtype=bool)
+        available[idx] = False
+        
+        # 4. Même catégorie/pays, puis même catégorie, puis les plus similaires tout court
+        selected = []
+        selected_scores = []
+        remaining = n
+        for tier in (strict_match, category_match, None):
+            if remaining <= 0:
+                break
+            tier_mask = available if tier is None else available & tier
+            chosen, chosen_scores = query(remaining, tier_mask)
+            available[chosen] = False
+            selected.append(chosen)
+            selected_scores.append(chosen_scores)
+            remaining -= len(chosen)
+        
+        filtered_indices = np.concatenate(selected)
         
         # 5. Build recommendations
-        recommendations = []
-        for i, (inf_idx, score) in enumerate(zip(filtered_indices[:n], filtered_scores[:n]), 1):
-            inf = self.df.iloc[inf_idx]
-            recommendations.append({
-                'rank': i,
-                'id': int(inf_idx),
-                'name': str(inf['influencer_name']),
-                'category': str(inf['category']),
-                'country': str(inf['country']),
-                'followers': int(inf['followers']),
-                'followers_formatted': self._format_number(inf['followers']),
-                'engagement_rate': float(inf['engagement_rate']),
-                'similarity_score': float(score)
-            })
+        recommendations = [
+            {'rank': i, **row, 'similarity_score': float(score)}
+            for i, (row, score) in enumerate(
+                zip(self._build_rows(filtered_indices), np.concatenate(selected_scores)), 1
+            )
+        ]
         
         return {
             'success': True,
             'query': {'category': category, 'country': country, 'n': n},
-            'reference': {
-                'id': int(idx),
-                'name': str(reference['influencer_name']),
-                'category': str(reference['category']),
-                'country': str(reference['country'])
-            },
+            'reference': self._reference_payload(idx),
             'recommendations': recommendations,
             'total': len(recommendations),
             'note': 'Recommandations filtrées par catégorie/pays' if len(filtered_indices) >= n else 'Filtrage partiel appliqué'
         }
     
+    def recommend_weighted(self, category, country, n=5, weights=None):
+        """
+        Recommande avec le modèle pondéré (Content-Based Filtering).
+        
+        Les poids par requête surchargent DEFAULT_WEIGHTS.
+        """
+        if not self.is_available():
+            return {'error': 'Recommender data not available'}
+        
+        category, country, n = self.normalize_query(category, country, n)
+        weights = dict(sorted({**DEFAULT_WEIGHTS, **(weights or {})}.items()))
+        idx = self._reference_index(category, country)
+        if idx is None:
+            return {'error': f'Aucun influenceur trouvé pour {category}/{country}'}
+        
+        scores = weighted_scores(self.weighted_features, idx, weights)
+        indices = top_n(scores, n, exclude=idx)
+        recommendations = [
+            {'rank': i, **row, 'similarity_score': float(score)}
+            for i, (row, score) in enumerate(zip(self._build_rows(indices), scores[indices]), 1)
+        ]
+        
+        return {
+            'success': True,
+            'model': 'content_based_weighted',
+            'query': {'category': category, 'country': country, 'n': n, 'weights': weights},
+            'reference': self._reference_payload(idx),
+            'recommendations': recommendations,
+            'total': len(recommendations)
+        }
+    
+    def _reference_index(self, category, country):
+        """Meilleur global_score du segment catégorie/pays, sinon de la catégorie seule"""
+        candidates = self.index.lookup(category=category, country=country)
+        if len(candidates) == 0:
+            candidates = self.index.lookup(category=category)
+            if len(candidates) == 0:
+                return None
+        return int(candidates[0])
+    
+    def _reference_payload(self, idx):
+        return {
+            'id': idx,
+            'name': str(self._names[idx]),
+            'category': str(self._category_values[idx]),
+            'country': str(self._country_values[idx])
+        }
+    
     def search(self, category=None, country=None, min_followers=0, limit=10):
         """Recherche d'influenceurs"""
-        if self.df is None or len(self.df) == 0:
+        if not self.is_available():
             return {
                 'success': False,
                 'results': [],
@@ -250,30 +388,12 @@ class BrandfluenceRecommender:
                 'error': 'Data not available'
             }
         
-        mask = pd.Series([True] * len(self.df))
-        
-        if category:
-            mask &= self.df['category'].str.title() == category.title()
-        
-        if country:
-            mask &= self.df['country'].str.title() == country.title()
+        rows = self.index.lookup(category=category or None, country=country or None)
         
         if min_followers > 0:
-            mask &= self.df['followers'] >= min_followers
-        
-        results_df = self.df[mask].sort_values('global_score', ascending=False).head(limit)
-        
-        results = []
-        for _, row in results_df.iterrows():
-            results.append({
-                'id': int(row.name),
-                'name': str(row['influencer_name']),
-                'category': str(row['category']),
-                'country': str(row['country']),
-                'followers': int(row['followers']),
-                'followers_formatted': self._format_number(row['followers']),
-                'engagement_rate': float(row['engagement_rate'])
-            })
+            rows = self._filter_min_followers(rows, min_followers, limit)
+        
+        results = self._build_rows(rows[:limit])
         
         return {
             'success': True,
@@ -281,9 +401,25 @@ class BrandfluenceRecommender:
             'count': len(results)
         }
     
+    def _filter_min_followers(self, rows, min_followers, limit, block_size=4096):
+        """Filtre `rows` (ordre conservé) par blocs, en s'arrêtant dès `limit` résultats"""
+        if limit <= 0:
+            return rows[self._followers[rows] >= min_followers]
+        
+        found = []
+        count = 0
+        for start in range(0, len(rows), block_size):
+            block = rows[start:start + block_size]
+            block = block[self._followers[block] >= min_followers]
+            found.append(block)
+            count += len(block)
+            if count >= limit:
+                break
+        return np.concatenate(found) if found else rows[:0]
+    
     def stats(self):
         """Statistiques du système"""
-        if self.df is None or len(self.df) == 0:
+        if not self.is_available():
             return {
                 'total_influencers': 0,
                 'categories': [],
@@ -294,13 +430,34 @@ class BrandfluenceRecommender:
             }
         
         return {
-            'total_influencers': len(self.df),
+            'total_influencers': self.size,
             'categories': self.categories,
             'countries': self.countries,
-            'avg_followers': int(self.df['followers'].mean()),
-            'avg_engagement': float(self.df['engagement_rate'].mean())
+            'avg_followers': int(np.mean(self._followers)),
+            'avg_engagement': float(np.nanmean(self._engagement))
         }
     
+    def detail(self, influencer_id):
+        """Détails d'un influenceur par son id (position dans le catalogue)"""
+        row = self._build_rows([influencer_id])[0]
+        row['global_score'] = float(self._global_score[influencer_id])
+        return row
+    
+    def _build_rows(self, indices):
+        """Construit les lignes de réponse à partir des colonnes précalculées"""
+        return [
+            {
+                'id': int(i),
+                'name': str(self._names[i]),
+                'category': str(self._category_values[i]),
+                'country': str(self._country_values[i]),
+                'followers': int(self._followers[i]),
+                'followers_formatted': self._format_number(self._followers[i]),
+                'engagement_rate': float(self._engagement[i]),
+            }
+            for i in indices
+        ]
+    
     def _format_number(self, num):
         """Formate un nombre"""
         if num >= 1_000_000:
@@ -311,21 +468,83 @@ class BrandfluenceRecommender:
 
 # Initialize recommender singleton - lazy loading
 _recommender_instance = None
+_recommender_lock = threading.Lock()
+
+# État de préchauffage, rapporté par HealthCheckView et ReadinessView
+_readiness = {
+    'state': 'not_started',
+    'artifact_version': None,
+    'warmup_ms': None,
+    'error': None,
+}
 
 def get_recommender():
-    """Get or create recommender instance (lazy loading)"""
+    """Get or create recommender instance (lazy loading, thread-safe)"""
     global _recommender_instance
     if _recommender_instance is None:
-        _recommender_instance = BrandfluenceRecommender()
+        with _recommender_lock:
+            if _recommender_instance is None:
+                _recommender_instance = BrandfluenceRecommender()
     return _recommender_instance
 
+def warm_up_recommender():
+    """
+    Charge le recommandeur et exécute une requête de chauffe.
+    
+    Appelé depuis brandfluence/wsgi.py : avec `gunicorn --preload`, cela se
+    produit une seule fois dans le master, avant le fork, et les workers
+    héritent des pages en copy-on-write.
+    """
+    _readiness['state'] = 'warming'
+    start = time.perf_counter()
+    try:
+        rec = get_recommender()
+        if rec.is_available() and rec.categories and rec.countries:
+            # Touche les pages (mmap) et les chemins NumPy utilisés par les requêtes
+            rec.recommend(rec.categories[0], rec.countries[0], 5)
+            rec.search(limit=1)
+            _readiness['state'] = 'ready'
+            _readiness['error'] = None
+        else:
+            _readiness['state'] = 'unavailable'
+            _readiness['error'] = 'Recommender data not available'
+        _readiness['artifact_version'] = getattr(rec, 'artifact_version', None)
+    except Exception as e:
+        logger.error(f"✗ Recommender warm-up failed: {e}")
+        _readiness['state'] = 'failed'
+        _readiness['error'] = str(e)
+    _readiness['warmup_ms'] = round((time.perf_counter() - start) * 1000, 2)
+    logger.info(f"Recommender warm-up: {_readiness['state']} in {_readiness['warmup_ms']} ms")
+    return get_readiness()
+
+def get_readiness():
+    """Copie de l'état de readiness (chargement paresseux pris en compte)"""
+    if _readiness['state'] == 'not_started' and _recommender_instance is not None:
+        _readiness['state'] = 'ready' if _recommender_instance.is_available() else 'unavailable'
+        _readiness['artifact_version'] = getattr(_recommender_instance, 'artifact_version', None)
+    return dict(_readiness)
+
+def cached_response(namespace, rec, key, compute):
+    """
+    Réponse servie depuis le cache (TTL + LRU), clé = requête normalisée et
+    version des données : un rechargement du recommandeur invalide les entrées.
+    """
+    return get_response_cache().get_or_compute(make_key(namespace, rec.data_version, *key), compute)
+
+def cached_recommend(rec, category, country, n):
+    """rec.recommend() à travers le cache de réponses"""
+    return cached_response(
+        'recommend', rec, rec.normalize_query(category, country, n),
+        lambda: rec.recommend(category, country, n)
+    )
+
 class StatsView(APIView):
     """Statistiques du système"""
     permission_classes = [AllowAny]
     
     def get(self, request):
         rec = get_recommender()
-        if rec.df is None or len(rec.df) == 0:
+        if not rec.is_available():
             return Response({
                 'error': 'Data not available',
                 'total_influencers': 0,
@@ -382,16 +601,16 @@ class RecommendView(APIView):
         
         try:
             rec = get_recommender()
-            logger.info(f"Recommender instance retrieved. Has data: {rec.df is not None and len(rec.df) > 0 if rec.df is not None else False}")
+            logger.info(f"Recommender instance retrieved. Has data: {rec.is_available()}")
             
-            if rec.df is None or (hasattr(rec.df, '__len__') and len(rec.df) == 0):
+            if not rec.is_available():
                 logger.error("Recommender data not available")
                 return Response({
                     'error': 'Recommender data not available. Please contact administrator.',
                     'debug_info': 'Data file was not loaded during initialization'
                 }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
             
-            result = rec.recommend(category, country, n)
+            result = cached_recommend(rec, category, country, n)
             logger.info(f"Recommendation result: {result.get('success', False)}")
             
             if 'error' in result:
@@ -421,12 +640,12 @@ class RecommendView(APIView):
         
         try:
             rec = get_recommender()
-            if rec.df is None or (hasattr(rec.df, '__len__') and len(rec.df) == 0):
+            if not rec.is_available():
                 return Response({
                     'error': 'Recommender data not available. Please contact administrator.'
                 }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
             
-            result = rec.recommend(category, country, n)
+            result = cached_recommend(rec, category, country, n)
             
             if 'error' in result:
                 return Response(result, status=status.HTTP_404_NOT_FOUND)
@@ -438,6 +657,157 @@ class RecommendView(APIView):
                 'detail': str(e)
             }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
 
+class BatchRecommendView(APIView):
+    """
+    Recommandations pour plusieurs requêtes catégorie/pays en un seul appel.
+    
+    POST /api/recommend/batch/ {"queries": [{"category": "Music", "country": "France", "n": 5}, ...]}
+    
+    Chaque entrée de "results" a le même format que /api/recommend/ (ou un
+    champ "error"), dans l'ordre des requêtes.
+    """
+    permission_classes = [AllowAny]
+    
+    def post(self, request):
+        queries = request.data.get('queries')
+        if not isinstance(queries, list) or not queries:
+            return Response({
+                'error': 'Le champ "queries" doit être une liste non vide'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        if len(queries) > MAX_BATCH_QUERIES:
+            return Response({
+                'error': f'Maximum {MAX_BATCH_QUERIES} requêtes par lot'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        parsed = []
+        for position, query in enumerate(queries):
+            if not isinstance(query, dict) or not query.get('category') or not query.get('country'):
+                return Response({
+                    'error': f'Requête {position}: les champs "category" et "country" sont requis'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            try:
+                n = int(query.get('n', 5))
+            except (TypeError, ValueError):
+                n = 5
+            parsed.append((query['category'], query['country'], n))
+        
+        try:
+            rec = get_recommender()
+            if not rec.is_available():
+                return Response({
+                    'error': 'Recommender data not available. Please contact administrator.'
+                }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+            
+            results = rec.recommend_batch(parsed)
+            return Response({
+                'success': True,
+                'results': results,
+                'total_queries': len(results),
+                'unique_queries': len({rec.normalize_query(*query) for query in parsed})
+            })
+        except Exception as e:
+            logger.error(f"Exception in BatchRecommendView: {e}")
+            return Response({
+                'error': 'Recommender service unavailable',
+                'detail': str(e)
+            }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+def parse_weights(raw):
+    """
+    Valide les surcharges de poids du modèle pondéré.
+    
+    Raises:
+        ValueError: nom de poids inconnu, valeur non numérique ou négative
+    """
+    weights = {}
+    for name, value in (raw or {}).items():
+        if name not in DEFAULT_WEIGHTS:
+            raise ValueError(f'Poids inconnu "{name}". Poids disponibles: {sorted(DEFAULT_WEIGHTS)}')
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(f'Le poids "{name}" doit être un nombre')
+        if not np.isfinite(value) or value < 0:
+            raise ValueError(f'Le poids "{name}" doit être un nombre positif')
+        weights[name] = value
+    return weights
+
+class WeightedRecommendView(APIView):
+    """
+    Recommandation avec le modèle pondéré (engagement, followers, catégorie,
+    popularité, diversité) et poids ajustables par requête.
+    
+    GET  /api/recommend/weighted/?category=Music&country=France&n=5&weight_engagement=0.5
+    POST /api/recommend/weighted/ {"category": ..., "country": ..., "n": 5, "weights": {"engagement": 0.5}}
+    """
+    permission_classes = [AllowAny]
+    
+    def get(self, request):
+        weights = {
+            key[len('weight_'):]: value
+            for key, value in request.GET.items()
+            if key.startswith('weight_')
+        }
+        return self._recommend(
+            request.GET.get('category', ''),
+            request.GET.get('country', ''),
+            request.GET.get('n', 5),
+            weights
+        )
+    
+    def post(self, request):
+        weights = request.data.get('weights') or {}
+        if not isinstance(weights, dict):
+            return Response({
+                'error': 'Le champ "weights" doit être un objet'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        return self._recommend(
+            request.data.get('category', ''),
+            request.data.get('country', ''),
+            request.data.get('n', 5),
+            weights
+        )
+    
+    def _recommend(self, category, country, n, weights):
+        try:
+            n = int(n)
+        except (TypeError, ValueError):
+            n = 5
+        
+        if not category or not country:
+            return Response({
+                'error': 'Les paramètres "category" et "country" sont requis'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            weights = parse_weights(weights)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            rec = get_recommender()
+            if not rec.is_available():
+                return Response({
+                    'error': 'Recommender data not available. Please contact administrator.'
+                }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+            
+            result = cached_response(
+                'weighted', rec,
+                (*rec.normalize_query(category, country, n), tuple(sorted(weights.items()))),
+                lambda: rec.recommend_weighted(category, country, n, weights)
+            )
+            
+            if 'error' in result:
+                return Response(result, status=status.HTTP_404_NOT_FOUND)
+            
+            return Response(result)
+        except Exception as e:
+            logger.error(f"Exception in WeightedRecommendView: {e}")
+            return Response({
+                'error': 'Recommender service unavailable',
+                'detail': str(e)
+            }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
 class SearchView(APIView):
     """Recherche d'influenceurs"""
     permission_classes = [AllowAny]
@@ -456,18 +826,24 @@ class SearchView(APIView):
             limit = 10
         
         rec = get_recommender()
-        if rec.df is None or len(rec.df) == 0:
+        if not rec.is_available():
             return Response({
                 'results': [],
                 'count': 0,
                 'message': 'Data not available'
             })
         
-        result = rec.search(
-            category=category if category else None,
-            country=country if country else None,
-            min_followers=min_followers,
-            limit=limit
+        category = category if category else None
+        country = country if country else None
+        key = (
+            str(category).title() if category else None,
+            str(country).title() if country else None,
+            max(min_followers, 0),
+            limit
+        )
+        result = cached_response(
+            'search', rec, key,
+            lambda: rec.search(category=category, country=country, min_followers=min_followers, limit=limit)
         )
         
         return Response(result)
@@ -483,20 +859,9 @@ class InfluencerDetailView(APIView):
             return Response({'error': 'ID invalide'}, status=status.HTTP_400_BAD_REQUEST)
         
         rec = get_recommender()
-        if influencer_id < 0 or influencer_id >= len(rec.df):
+        if influencer_id < 0 or influencer_id >= rec.size:
             return Response({
-                'error': f'ID {influencer_id} invalide. Doit être entre 0 et {len(rec.df)-1}'
+                'error': f'ID {influencer_id} invalide. Doit être entre 0 et {rec.size-1}'
             }, status=status.HTTP_404_NOT_FOUND)
         
-        inf = rec.df.iloc[influencer_id]
-        
-        return Response({
-            'id': int(influencer_id),
-            'name': str(inf['influencer_name']),
-            'category': str(inf['category']),
-            'country': str(inf['country']),
-            'followers': int(inf['followers']),
-            'followers_formatted': rec._format_number(inf['followers']),
-            'engagement_rate': float(inf['engagement_rate']),
-            'global_score': float(inf.get('global_score', 0))
-        })
\ No newline at end of file
+        return Response(rec.detail(influencer_id))
\ No newline at end of file
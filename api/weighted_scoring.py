@@ -0,0 +1,116 @@
+"""
+Score pondéré du modèle Content-Based Filtering, vectorisé avec NumPy.
+
+Reproduit Model3_ContentBasedFiltering.calculate_similarity pour tous les
+candidats en une seule expression (et pour plusieurs requêtes à la fois sous
+forme de matrice), au lieu d'un appel Python par paire d'influenceurs :
+
+    score = w_engagement * (1 - |Δ engagement_rate_normalized| / 2)
+          + w_followers  * (1 - |Δ followers_normalized| / 2)
+          + w_category   * (1 si même catégorie sinon 0.3)
+          + w_popularity * global_score du candidat
+          - w_diversity  * (0.1 si même pays sinon 0)
+
+puis borné à [0, 1].
+"""
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_WEIGHTS = {
+    'engagement': 0.3,
+    'followers': 0.25,
+    'category': 0.2,
+    'popularity': 0.15,
+    'diversity': 0.1
+}
+
+
+def _codes(series):
+    """Codes entiers pour une comparaison d'égalité exacte; -1 pour les manquantes"""
+    return pd.factorize(series)[0].astype(np.int32)
+
+
+def build_weighted_features(df):
+    """
+    Extrait du DataFrame les colonnes utilisées par le score pondéré.
+
+    Les colonnes absentes valent None : le terme correspondant est ignoré,
+    comme dans calculate_similarity.
+    """
+    def column(name):
+        return df[name].to_numpy(dtype=np.float64) if name in df.columns else None
+
+    return {
+        'engagement': column('engagement_rate_normalized'),
+        'followers': column('followers_normalized'),
+        'global_score': column('global_score'),
+        'category_codes': _codes(df['category']),
+        'country_codes': _codes(df['country']) if 'country' in df.columns else None,
+    }
+
+
+def _same(codes, query):
+    """Égalité de codes; une valeur manquante n'est égale à rien"""
+    query_codes = codes[query]
+    return (codes == query_codes) & (query_codes >= 0)
+
+
+def weighted_scores(features, query, weights=None):
+    """
+    Scores pondérés entre une ou plusieurs requêtes et tous les influenceurs.
+
+    Args:
+        features: dict retourné par build_weighted_features
+        query: Index d'une ligne, ou tableau d'index pour un calcul par lot
+        weights: Poids (DEFAULT_WEIGHTS par défaut)
+
+    Returns:
+        np.ndarray de forme (N,) pour une requête, (Q, N) pour un lot
+    """
+    weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+    # (Q, 1) en lot pour que la diffusion produise une matrice (Q, N)
+    query = np.asarray(query)
+    if query.ndim == 1:
+        query = query[:, None]
+
+    n_rows = len(features['category_codes'])
+    score = np.zeros(np.broadcast_shapes(query.shape, (n_rows,)), dtype=np.float64)
+
+    for key in ('engagement', 'followers'):
+        values = features[key]
+        if values is not None:
+            score += (1 - np.abs(values[query] - values) / 2) * weights[key]
+
+    score += np.where(_same(features['category_codes'], query), 1.0, 0.3) * weights['category']
+
+    if features['global_score'] is not None:
+        score += features['global_score'] * weights['popularity']
+
+    if features['country_codes'] is not None:
+        score -= np.where(_same(features['country_codes'], query), 0.1, 0.0) * weights['diversity']
+
+    return np.clip(score, 0, 1)
+
+
+def top_n(scores, n, exclude=None):
+    """
+    Les n meilleurs indices par score décroissant, égalités départagées par
+    indice croissant (même ordre qu'un tri stable).
+    """
+    scores = np.array(scores, dtype=np.float64)
+    if exclude is not None:
+        scores[exclude] = -np.inf
+    available = len(scores) - (0 if exclude is None else np.size(exclude))
+    n = max(0, min(n, available))
+    if n == 0:
+        return np.empty(0, dtype=np.intp)
+
+    if n < len(scores):
+        # Seuil du n-ième score, puis toutes les lignes qui l'atteignent (égalités incluses)
+        threshold = scores[np.argpartition(-scores, n - 1)[n - 1]]
+        candidates = np.flatnonzero(scores >= threshold)
+    else:
+        candidates = np.arange(len(scores))
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order[:n]]
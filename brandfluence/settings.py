@@ -214,6 +214,10 @@ GRAPHENE = {
     ],
 }
 
+# Keyset (seek) cursors on the connection fields declared keyset=True (common/pagination_utils.py).
+# Off by default: it changes the cursors those fields return (offset cursors stay accepted as input)
+GRAPHQL_KEYSET_PAGINATION = os.getenv('GRAPHQL_KEYSET_PAGINATION', 'False') == 'True'
+
 # GraphQL JWT Settings
 from datetime import timedelta
 
@@ -291,3 +295,40 @@ DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', EMAIL_HOST_USER)
 
 # Frontend URL for email verification links
 FRONTEND_URL = os.getenv('FRONTEND_URL', 'http://localhost:3000')
+
+# Recommender artifact directory (built with `python manage.py build_recommender_artifact`)
+RECOMMENDER_ARTIFACT_DIR = os.getenv('RECOMMENDER_ARTIFACT_DIR', os.path.join(BASE_DIR, 'data', 'recommender'))
+
+# Similarity index backend: 'brute' (exact), 'kdtree', 'balltree' or 'ivf' (approximate)
+RECOMMENDER_INDEX_BACKEND = os.getenv('RECOMMENDER_INDEX_BACKEND', 'brute')
+
+# Load and warm the recommender when the WSGI app is created (see brandfluence/wsgi.py)
+RECOMMENDER_WARMUP = os.getenv('RECOMMENDER_WARMUP', 'True') == 'True'
+
+# Cache shared by all gunicorn workers, e.g. CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+# CACHE_LOCATION=redis://... (or db.DatabaseCache + `manage.py createcachetable`). CachedCount totals
+# (common/pagination_utils.py) are only cached with a shared backend, not the default per-process LocMemCache
+if os.getenv('CACHE_BACKEND'):
+    CACHES = {
+        'default': {
+            'BACKEND': os.getenv('CACHE_BACKEND'),
+            'LOCATION': os.getenv('CACHE_LOCATION', ''),
+        }
+    }
+
+# Recommender response cache (see api/response_cache.py)
+# BACKEND: 'inprocess' (per-worker LRU), 'django' (uses CACHES[ALIAS]) or 'none'
+RECOMMENDER_CACHE = {
+    'BACKEND': os.getenv('RECOMMENDER_CACHE_BACKEND', 'inprocess'),
+    'MAX_ENTRIES': int(os.getenv('RECOMMENDER_CACHE_MAX_ENTRIES', 1024)),
+    'TTL': int(os.getenv('RECOMMENDER_CACHE_TTL', 300)),
+    'ALIAS': os.getenv('RECOMMENDER_CACHE_ALIAS', 'default'),
+}
+
+# Influencer full-text search backend (see users/search/backends.py)
+# 'auto' (PostgreSQL tsvector / SQLite FTS5 by database vendor), 'postgres', 'sqlite_fts' or 'icontains'
+INFLUENCER_SEARCH_BACKEND = os.getenv('INFLUENCER_SEARCH_BACKEND', 'auto')
+
+# Cached per-offer / per-user application counters for the stats queries (see offer/stats.py)
+# After enabling on an existing database, run `python manage.py rebuild_application_stats`
+OFFER_APPLICATION_STATS_COUNTERS = os.getenv('OFFER_APPLICATION_STATS_COUNTERS', 'False') == 'True'
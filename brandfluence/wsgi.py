@@ -14,4 +14,9 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'brandfluence.settings')
 
 application = get_wsgi_application()
 
+# Build and warm the recommender before serving (before fork with gunicorn --preload)
+from django.conf import settings
 
+if settings.RECOMMENDER_WARMUP:
+    from api.views import warm_up_recommender
+    warm_up_recommender()
@@ -1,13 +1,13 @@
 import graphene
 from ..types import CategoryNode
-from graphene_django.filter import DjangoFilterConnectionField
+from common.query_optimizer import OptimizedConnectionField
 from ..filters import CategoryFilter
 
 
 class CategoryListQuery(graphene.ObjectType):
     """Query to get all categories with pagination and totalCount"""
 
-    all_categories = DjangoFilterConnectionField(
+    all_categories = OptimizedConnectionField(
         CategoryNode,
         filterset_class=CategoryFilter
     )
@@ -1,3 +1,34 @@
-from django.test import TestCase
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from graphql_relay import to_global_id
 
-# Create your tests here.
+from .models import Category
+
+
+class CategoryQueryOptimizerTests(TestCase):
+    """Category querysets only load the selected columns"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.categories = [Category.objects.create(name=f'Category {index}', description='Description') for index in range(3)]
+
+    def execute(self, query):
+        from brandfluence.schema import schema
+        with CaptureQueriesContext(connection) as queries:
+            result = schema.execute(query, context_value=RequestFactory().post('/graphql/'))
+        self.assertIsNone(result.errors)
+        return result.data, queries
+
+    def test_list_selects_requested_columns(self):
+        data, queries = self.execute('{ allCategories(first: 3) { edges { node { name } } } }')
+        self.assertEqual(len(data['allCategories']['edges']), 3)
+        self.assertEqual(len(queries), 2)
+        self.assertNotIn('"description"', queries[1]['sql'])
+
+    def test_single_node_lookup(self):
+        category_id = to_global_id('CategoryNode', self.categories[0].pk)
+        data, queries = self.execute('{ category(id: "%s") { name } }' % category_id)
+        self.assertEqual(data['category'], {'name': 'Category 0'})
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"description"', queries[0]['sql'])
@@ -14,11 +14,7 @@ if exist "data\influenceurs_recommendation_ready.csv" (
     echo    [FAIL] data\influenceurs_recommendation_ready.csv NOT FOUND
 )
 
-if exist "data\influenceurs_clean.csv" (
-    echo    [OK] data\influenceurs_clean.csv EXISTS
-) else (
-    echo    [FAIL] data\influenceurs_clean.csv NOT FOUND
-)
+REM data\generated\ (clean CSV, feature matrix) is rebuilt by prepare_recommender_data, not deployed
 
 if exist "api\data\influenceurs_recommendation_ready.csv" (
     echo    [OK] api\data\influenceurs_recommendation_ready.csv EXISTS
@@ -0,0 +1,120 @@
+"""
+Per-request batching of Django relations for GraphQL resolvers (DataLoader pattern).
+
+Without batching, a list of 50 nodes that each resolve `self.relation.all()`
+issues 50 queries per relation. The registry below is stored on the GraphQL
+context (one per request). Connections prime it with the nodes of the page;
+the first node asking for a relation then loads it for every primed node of
+the same model in a single `IN` query (Django's prefetch_related_objects).
+
+graphql-core 3 executes resolvers synchronously, so batching uses the page
+known upfront instead of deferred promises.
+
+Example:
+    class InfluencerConnection(PrimingConnectionMixin, relay.Connection):
+        ...
+
+    class InfluencerNode(DjangoObjectType):
+        def resolve_reseaux_sociaux(self, info):
+            return get_dataloaders(info).load(self, 'reseaux_sociaux')
+"""
+
+from collections import defaultdict
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import prefetch_related_objects
+
+CONTEXT_ATTRIBUTE = '_dataloaders'
+
+
+def _is_loaded(instance, relation):
+    """True if `relation` is already cached on the instance (prefetch or select_related)"""
+    return (
+        relation in getattr(instance, '_prefetched_objects_cache', {})
+        or relation in instance._state.fields_cache
+    )
+
+
+class DataLoaderRegistry:
+    """Primed parent instances per model, loaded relation by relation"""
+
+    def __init__(self):
+        self._parents = defaultdict(dict)
+        self._expanded = defaultdict(set)
+        self._values = defaultdict(dict)
+
+    def prime(self, instances):
+        """Register instances whose relations should be loaded together"""
+        for instance in instances:
+            if instance is not None and instance.pk is not None:
+                self._parents[type(instance)].setdefault(instance.pk, instance)
+
+    def _prime_related(self, model, relation):
+        """Prime the related objects of every sibling whose `relation` is loaded (nested batching)"""
+        expanded = self._expanded[(model, relation)]
+        for pk, parent in self._parents[model].items():
+            if pk in expanded or not _is_loaded(parent, relation):
+                continue
+            expanded.add(pk)
+            try:
+                value = getattr(parent, relation)
+            except ObjectDoesNotExist:
+                continue
+            self.prime(value.all() if hasattr(value, 'all') else [value])
+
+    def load(self, instance, relation):
+        """
+        Value of `relation` for `instance`, loading it for all primed siblings at once.
+
+        Returns a list for to-many relations, the related object (or raises
+        its DoesNotExist) for to-one relations. The related objects are primed
+        in turn, so their own relations are batched across the siblings.
+        """
+        siblings = self._parents[type(instance)]
+        siblings.setdefault(instance.pk, instance)
+        if not _is_loaded(instance, relation):
+            batch = [parent for parent in siblings.values() if not _is_loaded(parent, relation)]
+            if not any(parent is instance for parent in batch):
+                batch.append(instance)
+            prefetch_related_objects(batch, relation)
+        self._prime_related(type(instance), relation)
+        value = getattr(instance, relation)
+        return list(value.all()) if hasattr(value, 'all') else value
+
+    def load_batch(self, instance, key, batch_load, default=None):
+        """
+        Value computed by `batch_load(pks) -> {pk: value}` for `instance`.
+
+        The function runs once for all primed siblings not loaded yet (e.g. one
+        grouped COUNT query for a page of offers); missing pks get `default`.
+        """
+        model = type(instance)
+        values = self._values[(model, key)]
+        if instance.pk not in values:
+            siblings = self._parents[model]
+            siblings.setdefault(instance.pk, instance)
+            pks = [pk for pk in siblings if pk not in values]
+            loaded = batch_load(pks)
+            for pk in pks:
+                values[pk] = loaded.get(pk, default)
+        return values[instance.pk]
+
+
+def get_dataloaders(info_or_context):
+    """DataLoaderRegistry of the current request (created on first use)"""
+    context = getattr(info_or_context, 'context', info_or_context)
+    if context is None:
+        return DataLoaderRegistry()
+    registry = getattr(context, CONTEXT_ATTRIBUTE, None)
+    if registry is None:
+        registry = DataLoaderRegistry()
+        setattr(context, CONTEXT_ATTRIBUTE, registry)
+    return registry
+
+
+class PrimingConnectionMixin:
+    """Connection mixin priming the request's DataLoaderRegistry with the page nodes"""
+
+    def resolve_edges(root, info, **kwargs):
+        get_dataloaders(info).prime(edge.node for edge in root.edges)
+        return root.edges
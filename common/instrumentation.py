@@ -0,0 +1,38 @@
+"""
+Query count and duration of a block of code, for logging hot paths.
+
+    with track_queries() as stats:
+        ...
+    logger.info('✓ completeInfluencerProfile: %d queries in %.1f ms', stats.queries, stats.duration_ms)
+
+Queries are counted with a connection execute wrapper, so it works with
+DEBUG off and does not keep the SQL around.
+"""
+
+import time
+from contextlib import contextmanager
+
+from django.db import connections
+
+
+class QueryStats:
+    """Number of queries run and elapsed time of a track_queries block"""
+
+    def __init__(self):
+        self.queries = 0
+        self.duration_ms = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries += 1
+        return execute(sql, params, many, context)
+
+
+@contextmanager
+def track_queries(using='default'):
+    stats = QueryStats()
+    start = time.perf_counter()
+    try:
+        with connections[using].execute_wrapper(stats):
+            yield stats
+    finally:
+        stats.duration_ms = (time.perf_counter() - start) * 1000
@@ -1,16 +1,428 @@
 """
 Reusable pagination utilities for offset-based GraphQL pagination with totalCount.
 Can be used across different models (Category, User, etc.)
+
+totalCount goes through a count strategy chosen per connection field:
+
+    all_influencers = OptimizedConnectionField(
+        InfluencerNode,
+        filterset_class=InfluencerFilter,
+        count_strategy=EstimatedCount(threshold=100_000, fallback=CachedCount(depends_on=('users.Influencer',))),
+    )
+
+    - ExactCount: one COUNT(*) per page fetch (default)
+    - CachedCount: exact COUNT cached per (filter hash, data version); any
+      save/delete of the counted models bumps their data version. Needs a
+      cache shared by all workers (CACHES: Redis, Memcached, database...):
+      with the default per-process LocMemCache it counts like ExactCount
+    - EstimatedCount: PostgreSQL planner estimate (reltuples for a whole
+      table, EXPLAIN rows for a filtered queryset) above a threshold, exposed
+      to clients with `isEstimate: true`
+
+Fields can also page with keyset (seek) cursors instead of OFFSET:
+
+    all_users = OptimizedConnectionField(UserNode, filterset_class=UserFilter, keyset=True)
+
+keyset=True only takes effect when the GRAPHQL_KEYSET_PAGINATION setting is
+on; otherwise the field keeps its offset cursors and pagination.
+
+The cursor then encodes the sort key of the last row, e.g. (created_at, id),
+and the next page is a WHERE on that key, so page 1000 costs the same as
+page 1. Any ordering of the queryset (OrderingFilter, model Meta.ordering)
+is made total by appending the primary key.
+
+Switching an existing field to keyset=True changes the cursors it returns.
+Offset cursors ('arrayconnection:N', base64) it issued before are still
+accepted in after/before: that page is served by position, and its edges
+carry keyset cursors from then on.
 """
 
+import base64
+import binascii
+import contextvars
+import hashlib
+import json
+import logging
+import time
+from collections import namedtuple
+from functools import partial
+
 import graphene
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connections, transaction
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import F, Q
+from django.db.models.aggregates import Aggregate
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.expressions import Col, OrderBy
+from django.db.models.query import QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.db.models.utils import make_model_tuple
 from graphene import relay
+from graphene.relay.connection import connection_adapter, page_info_adapter
+from graphql import GraphQLError
+from graphql_relay import connection_from_array_slice, cursor_to_offset, get_offset_with_default, offset_to_cursor
+
+from .dataloaders import PrimingConnectionMixin
+
+# value: number of rows, is_estimate: True when `value` is a planner estimate
+CountResult = namedtuple('CountResult', ['value', 'is_estimate'])
+
+DATA_VERSION_KEY = 'count-version:{}'
+
+# (model, cache alias) pairs whose writes bump the data version
+_watched_models = set()
+
+# Process-local backends: a version bumped by one worker is invisible to the others
+LOCAL_CACHE_BACKENDS = (LocMemCache, DummyCache)
+
+logger = logging.getLogger(__name__)
+_warned_local_aliases = set()
+
+
+def shared_cache(alias='default'):
+    """True when the cache `alias` is shared by every worker process"""
+    return not isinstance(caches[alias], LOCAL_CACHE_BACKENDS)
+
+
+def _resolve_model(model):
+    return apps.get_model(model) if isinstance(model, str) else model
+
+
+def data_version(model, alias='default'):
+    """
+    Opaque version of a model's rows, changed by bump_data_version.
+    
+    A missing (evicted) version gets a fresh value, so counts cached under
+    an older version can never be served again.
+    """
+    cache = caches[alias]
+    key = DATA_VERSION_KEY.format(_resolve_model(model)._meta.label_lower)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def watch_models(models, alias='default'):
+    """
+    Bump the data version of `models` on every save/delete (and m2m change).
+    
+    Models may be labels ('users.User'): the receivers are connected as soon
+    as the model is registered, so every process bumps on writes whether or
+    not it has counted the model yet.
+    """
+    for model in models:
+        apps.lazy_model_operation(partial(_watch_model, alias=alias), make_model_tuple(model))
+
+
+def _watch_model(model, alias):
+    if (model, alias) in _watched_models:
+        return
+    _watched_models.add((model, alias))
+    receiver = _bump_on_write(model, alias)
+    uid = f'cached-count:{model._meta.label_lower}:{alias}'
+    post_save.connect(receiver, sender=model, weak=False, dispatch_uid=uid)
+    post_delete.connect(receiver, sender=model, weak=False, dispatch_uid=uid)
+    for field in model._meta.local_many_to_many:
+        m2m_changed.connect(receiver, sender=field.remote_field.through, weak=False, dispatch_uid=uid)
+
+
+def bump_data_version(model, alias='default'):
+    """
+    Invalidate the cached counts over `model`.
+    
+    Called automatically on save/delete of watched models; bulk writes that
+    skip signals (bulk_create, queryset.update(), imports) call it themselves.
+    """
+    caches[alias].set(DATA_VERSION_KEY.format(_resolve_model(model)._meta.label_lower), time.time_ns(), None)
+
+
+class CountStrategy:
+    """Computes the totalCount of a connection queryset"""
+    
+    def count(self, queryset):
+        """CountResult of `queryset` (an empty queryset is counted without a query)"""
+        if queryset.query.is_empty():
+            return CountResult(0, False)
+        return self.count_queryset(queryset)
+    
+    def count_queryset(self, queryset):
+        raise NotImplementedError
+
+
+class ExactCount(CountStrategy):
+    """One COUNT(*) on every page fetch"""
+    
+    def count_queryset(self, queryset):
+        return CountResult(queryset.count(), False)
+
+
+class CachedCount(CountStrategy):
+    """
+    Exact COUNT(*) cached per (SQL + params hash, data version).
+    
+    The data version of the queryset's model, and of the models listed in
+    `depends_on` (e.g. the tables a filter joins), changes on every
+    save/delete of their rows. Writes that bypass signals are picked up after
+    `timeout` seconds at the latest, or immediately via bump_data_version().
+    Counts read inside a transaction are not cached, and nothing is cached
+    when `alias` is a per-process cache (LocMemCache): the other workers
+    would keep serving a stale total after a write.
+    
+    `depends_on` must include the counted model itself: its receivers are
+    connected when the CachedCount is built (see watch_models), so build
+    it in a module the app imports in AppConfig.ready().
+    
+    Example:
+        CachedCount(timeout=300, depends_on=('users.Influencer', 'users.InfluencerMetrics'))
+    """
+    
+    def __init__(self, timeout=300, depends_on=(), alias='default'):
+        self.timeout = timeout
+        self.depends_on = tuple(depends_on)
+        self.alias = alias
+        watch_models(self.depends_on, alias)
+    
+    def cache_key(self, queryset):
+        models = [queryset.model] + [_resolve_model(model) for model in self.depends_on]
+        # Safety net for a counted model missing from depends_on
+        _watch_model(queryset.model, self.alias)
+        sql, params = queryset.query.sql_with_params()
+        versions = [data_version(model, self.alias) for model in models]
+        digest = hashlib.sha1(repr((queryset.db, sql, params, versions)).encode('utf-8')).hexdigest()
+        return f'count:{queryset.model._meta.label_lower}:{digest}'
+    
+    def count_queryset(self, queryset):
+        if connections[queryset.db].in_atomic_block:
+            # The count may include uncommitted writes that could be rolled back
+            return CountResult(queryset.count(), False)
+        if not shared_cache(self.alias):
+            if self.alias not in _warned_local_aliases:
+                _warned_local_aliases.add(self.alias)
+                logger.warning(
+                    "CachedCount: cache '%s' is not shared between workers, counting without cache", self.alias
+                )
+            return CountResult(queryset.count(), False)
+        cache = caches[self.alias]
+        key = self.cache_key(queryset)
+        value = cache.get(key)
+        if value is None:
+            value = queryset.count()
+            cache.set(key, value, self.timeout)
+        return CountResult(value, False)
+
+
+def _bump_on_write(model, alias):
+    def receiver(sender, **kwargs):
+        if kwargs.get('action', 'post_').startswith('post_'):
+            bump_data_version(model, alias)
+            # Counts cached by other connections before the commit saw the old rows
+            transaction.on_commit(lambda: bump_data_version(model, alias), using=kwargs.get('using'))
+    return receiver
+
+
+class EstimatedCount(CountStrategy):
+    """
+    PostgreSQL planner estimate when it reaches `threshold` rows.
+    
+    An unfiltered queryset reads pg_class.reltuples, a filtered one the row
+    estimate of EXPLAIN. Below the threshold, on other databases, or when the
+    table was never analysed, `fallback` (ExactCount by default) counts.
+    """
+    
+    def __init__(self, threshold=100_000, fallback=None):
+        self.threshold = threshold
+        self.fallback = fallback or ExactCount()
+    
+    def estimate(self, queryset):
+        """Planner row estimate of `queryset`, or None if unavailable"""
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+        query = queryset.query
+        with connection.cursor() as cursor:
+            if not query.where and not query.distinct and not query.is_sliced and not query.combinator:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                    [queryset.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+                return row[0] if row and row[0] >= 0 else None
+            sql, params = queryset.order_by().query.sql_with_params()
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+    
+    def count_queryset(self, queryset):
+        estimate = self.estimate(queryset)
+        if estimate is not None and estimate >= self.threshold:
+            return CountResult(estimate, True)
+        return self.fallback.count(queryset)
+
+
+EXACT_COUNT = ExactCount()
+
+# Pagination options of the connection field being resolved (set by PaginationFieldMixin)
+FieldPagination = namedtuple('FieldPagination', ['count_strategy', 'keyset'])
+_field_pagination = contextvars.ContextVar('field_pagination', default=FieldPagination(None, False))
+
+
+def current_count_strategy(connection_type):
+    """Count strategy of the current field, else of the connection type, else ExactCount"""
+    return (
+        _field_pagination.get().count_strategy
+        or getattr(connection_type, 'count_strategy', None)
+        or EXACT_COUNT
+    )
+
+
+def count_queryset(connection_type, queryset):
+    """CountResult of `queryset` with current_count_strategy"""
+    return current_count_strategy(connection_type).count(queryset)
+
+
+def keyset_enabled():
+    """
+    True if the connection field being resolved pages with keyset cursors:
+    declared keyset=True and the GRAPHQL_KEYSET_PAGINATION setting is on.
+    """
+    return _field_pagination.get().keyset and getattr(settings, 'GRAPHQL_KEYSET_PAGINATION', False)
+
+
+class PaginationFieldMixin:
+    """
+    Connection field mixin choosing the count strategy of its totalCount and
+    whether it pages with keyset cursors.
+    
+    Example:
+        all_offers = OptimizedConnectionField(OfferNode, count_strategy=CachedCount(depends_on=('offer.Offer',)), keyset=True)
+    """
+    
+    def __init__(self, *args, count_strategy=None, keyset=False, **kwargs):
+        self.pagination = FieldPagination(count_strategy, keyset)
+        super().__init__(*args, **kwargs)
+    
+    def wrap_resolve(self, parent_resolver):
+        resolver = super().wrap_resolve(parent_resolver)
+        pagination = self.pagination
+        if pagination == FieldPagination(None, False):
+            return resolver
+        
+        def paginated_resolver(root, info, **args):
+            token = _field_pagination.set(pagination)
+            try:
+                return resolver(root, info, **args)
+            finally:
+                _field_pagination.reset(token)
+        return paginated_resolver
+
+
+def counted_connection(connection_type, args, queryset, max_limit=None):
+    """
+    Page of a relay connection over `queryset`, counted with count_queryset.
+    
+    Same arguments as DjangoConnectionField.resolve_connection (first, last,
+    after, before, offset). An estimated count only backs totalCount: the
+    page is fetched with one extra row to know whether a next page exists,
+    and backward pagination (`last`/`before`) always counts exactly.
+    """
+    offset = args.pop('offset', None)
+    after = args.get('after')
+    if offset:
+        if after:
+            offset += cursor_to_offset(after) + 1
+        # input offset starts at 1 while the graphene offset starts at 0
+        args['after'] = offset_to_cursor(offset - 1)
+    
+    if max_limit is not None and args.get('first') is None and args.get('last') is None:
+        args['first'] = max_limit
+    
+    total = count_queryset(connection_type, queryset)
+    after_offset = get_offset_with_default(args.get('after'), -1) + 1
+    first = args.get('first')
+    if total.is_estimate and (first is None or args.get('last') is not None or args.get('before')):
+        total = EXACT_COUNT.count(queryset)
+    
+    if total.is_estimate:
+        rows = list(queryset[after_offset:after_offset + first + 1])
+        slice_start = after_offset
+        array_length = slice_start + len(rows)
+        iterable = rows
+        # Never report fewer rows than the ones already fetched
+        total = CountResult(max(total.value, array_length), True)
+    else:
+        array_length = total.value
+        slice_start = min(after_offset, array_length)
+        iterable = queryset[slice_start:]
+    
+    connection = connection_from_array_slice(
+        iterable,
+        args,
+        slice_start=slice_start,
+        array_length=array_length,
+        array_slice_length=array_length - slice_start,
+        connection_type=partial(connection_adapter, connection_type),
+        edge_type=connection_type.Edge,
+        page_info_type=page_info_adapter,
+    )
+    connection.iterable = queryset
+    connection.length = total.value
+    connection.is_estimate = total.is_estimate
+    return connection
+
+
+def _connection_length(root):
+    """
+    Count stored on the connection by the field, or counted on first use.
+    
+    Keyset pages do not need the count, so it only runs when totalCount
+    or isEstimate is selected, with the strategy stored on the connection.
+    """
+    if not hasattr(root, 'length'):
+        iterable = getattr(root, 'iterable', None)
+        if isinstance(iterable, QuerySet):
+            strategy = getattr(root, 'count_strategy', None) or EXACT_COUNT
+            root.length, root.is_estimate = strategy.count(iterable)
+        else:
+            root.length = len(iterable) if iterable is not None else len(root.edges)
+    return root.length
 
 
-class PaginatedConnection(relay.Connection):
+class CountedConnectionMixin:
+    """
+    Connection mixin exposing totalCount and isEstimate.
+    
+    Both come from the count stored by the connection field (see
+    counted_connection and keyset_page); connections built elsewhere fall
+    back to counting their iterable.
+    """
+    
+    total_count = graphene.Int()
+    is_estimate = graphene.Boolean(description='True when totalCount is a planner estimate')
+    
+    def resolve_total_count(root, info, **kwargs):
+        """Resolve total count from stored length or iterable"""
+        return _connection_length(root)
+    
+    def resolve_is_estimate(root, info, **kwargs):
+        _connection_length(root)
+        return getattr(root, 'is_estimate', False)
+
+
+class PaginatedConnection(CountedConnectionMixin, PrimingConnectionMixin, relay.Connection):
     """
     Base Connection class that adds totalCount field.
     Inherit from this for any model that needs pagination with total count.
+    The page nodes are primed in the request's DataLoaderRegistry so node
+    resolvers can batch their relations (see common/dataloaders.py).
     
     Example:
         class UserConnection(PaginatedConnection):
@@ -18,26 +430,19 @@ class PaginatedConnection(relay.Connection):
                 node = UserNode
     """
     
-    total_count = graphene.Int()
-    
     class Meta:
         abstract = True
-    
-    def resolve_total_count(root, info, **kwargs):
-        """Resolve total count from stored length or iterable"""
-        return root.length if hasattr(root, 'length') else (
-            root.iterable.count() if hasattr(root, 'iterable') and hasattr(root.iterable, 'count') else len(root.edges)
-        )
 
 
-class OffsetConnectionField(relay.ConnectionField):
+class OffsetConnectionField(PaginationFieldMixin, relay.ConnectionField):
     """
     Custom ConnectionField that handles offset-based pagination properly.
     Automatically adds offset parameter and calculates correct pageInfo.
     
     Features:
     - Adds 'offset' argument automatically
-    - Calculates totalCount independently of pagination
+    - Calculates totalCount independently of pagination (count_strategy=...)
+    - keyset=True pages with keyset cursors (see keyset_page)
     - Correctly determines hasNextPage and hasPreviousPage
     
     Example:
@@ -75,8 +480,18 @@ class OffsetConnectionField(relay.ConnectionField):
             Connection instance with proper pagination info
         """
         
+        if keyset_enabled() and isinstance(resolved, QuerySet):
+            connection = keyset_page(
+                connection_type, resolved, args, count_strategy=current_count_strategy(connection_type)
+            )
+            if connection is not None:
+                return connection
+        
         # Get the total count from the queryset before slicing
-        if hasattr(resolved, 'count'):
+        is_estimate = False
+        if isinstance(resolved, QuerySet):
+            total_count, is_estimate = count_queryset(connection_type, resolved)
+        elif hasattr(resolved, 'count'):
             total_count = resolved.count()
         elif hasattr(resolved, '__len__'):
             total_count = len(resolved)
@@ -88,7 +503,14 @@ class OffsetConnectionField(relay.ConnectionField):
         first = args.get('first')
         
         # Calculate pagination info
-        if first is not None:
+        if first is not None and is_estimate:
+            # An estimate cannot tell where the data ends: fetch one extra row
+            rows = list(resolved[offset:offset + first + 1])
+            has_next_page = len(rows) > first
+            has_previous_page = offset > 0
+            sliced_iterable = rows[:first]
+            total_count = max(total_count, offset + len(rows))
+        elif first is not None:
             # Check if there are more items after this page
             has_next_page = (offset + first) < total_count
             # Check if we're not at the beginning
@@ -109,6 +531,7 @@ class OffsetConnectionField(relay.ConnectionField):
         
         # Store total count on the connection for resolve_total_count
         connection.length = total_count
+        connection.is_estimate = is_estimate
         connection.iterable = resolved
         
         # Override pageInfo with our calculated values
@@ -139,3 +562,250 @@ def create_offset_connection_field(connection_class, **extra_args):
         )
     """
     return OffsetConnectionField(connection_class, **extra_args)
+
+
+def encode_cursor(values):
+    """
+    Encode the sort key values of a row into an opaque cursor.
+    
+    Example:
+        encode_cursor([15200, 42])  # -> 'WzE1MjAwLCA0Ml0='
+    """
+    return base64.urlsafe_b64encode(json.dumps(values, default=str).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor):
+    """Decode a cursor produced by encode_cursor (GraphQLError if malformed)"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+    except (ValueError, TypeError, binascii.Error):
+        raise GraphQLError('Invalid cursor')
+    if not isinstance(values, list):
+        raise GraphQLError('Invalid cursor')
+    return values
+
+
+def legacy_cursor_offset(cursor):
+    """Position of an offset cursor ('arrayconnection:N'), None for any other cursor"""
+    offset = cursor_to_offset(cursor)
+    if offset is None or offset < 0 or offset_to_cursor(offset) != cursor:
+        return None
+    return offset
+
+
+def _sort_field(queryset, name):
+    """
+    Model field or annotation a sort key refers to, or None if it cannot be
+    used as a keyset key (unknown name, or a relation sorted by its own ordering).
+    """
+    if name in queryset.query.annotations:
+        return queryset.query.annotations[name]
+    model = queryset.model
+    for part in name.split(LOOKUP_SEP):
+        if model is None:
+            return None
+        try:
+            field = model._meta.pk if part == 'pk' else model._meta.get_field(part)
+        except FieldDoesNotExist:
+            return None
+        model = field.related_model if field.is_relation else None
+    return None if field.is_relation else field
+
+
+def _is_nullable(queryset, name):
+    """True if the sort key can be NULL (nullable column, outer join, annotated column or aggregate)"""
+    annotation = queryset.query.annotations.get(name)
+    if annotation is not None:
+        return isinstance(annotation, (Col, Aggregate))
+    model = queryset.model
+    for part in name.split(LOOKUP_SEP):
+        field = model._meta.pk if part == 'pk' else model._meta.get_field(part)
+        if not field.is_relation:
+            return field.null
+        if field.null or not field.concrete or field.many_to_many:
+            return True
+        model = field.related_model
+    return False
+
+
+def keyset_ordering(queryset):
+    """
+    Sort keys of `queryset` ending with the primary key, e.g. ['-created_at', '-pk'].
+    
+    Uses the queryset ordering (OrderingFilter, order_by) or the model
+    Meta.ordering. Returns None when a key cannot be compared in SQL
+    (random or raw ordering, ordering by a relation).
+    """
+    query = queryset.query
+    terms = list(query.order_by) or (list(queryset.model._meta.ordering) if query.default_ordering else [])
+    ordering = []
+    for term in terms:
+        if isinstance(term, OrderBy) and isinstance(term.expression, F):
+            term = ('-' if term.descending else '') + term.expression.name
+        if not isinstance(term, str) or term == '?' or _sort_field(queryset, term.lstrip('-')) is None:
+            return None
+        ordering.append(term)
+    
+    pk = queryset.model._meta.pk
+    if not any(term.lstrip('-') in ('pk', pk.name, pk.attname) for term in ordering):
+        descending = bool(ordering) and ordering[-1].startswith('-')
+        ordering.append('-pk' if descending else 'pk')
+    return ordering
+
+
+def keyset_order_by(ordering, nullable=(), reverse=False):
+    """
+    order_by() arguments of a keyset ordering; NULLs sort last (first when `reverse`).
+    
+    Example:
+        keyset_order_by(['-total_followers', '-pk'], nullable={'total_followers'})
+        # -> [F('total_followers').desc(nulls_last=True), '-pk']
+    """
+    terms = []
+    for field in ordering:
+        name = field.lstrip('-')
+        descending = field.startswith('-') != reverse
+        if name in nullable:
+            direction = F(name).desc if descending else F(name).asc
+            terms.append(direction(nulls_first=True) if reverse else direction(nulls_last=True))
+        else:
+            terms.append(f'-{name}' if descending else name)
+    return terms
+
+
+def keyset_filter(ordering, values, nullable=(), reverse=False):
+    """
+    Q object selecting the rows strictly after `values` in `ordering`
+    (before them when `reverse`), NULLs sorting last as in keyset_order_by.
+    
+    Example:
+        keyset_filter(['-score', '-id'], [10, 42])
+        # -> Q(score__lt=10) | Q(score=10, id__lt=42)
+    """
+    condition = Q()
+    for position, field in enumerate(ordering):
+        name = field.lstrip('-')
+        value = values[position]
+        descending = field.startswith('-') != reverse
+        if value is None:
+            if not reverse:
+                # NULLs sort last: no row follows on this key alone
+                continue
+            step = Q(**{f'{name}__isnull': False})
+        else:
+            step = Q(**{f'{name}__{"lt" if descending else "gt"}': value})
+            if name in nullable and not reverse:
+                step |= Q(**{f'{name}__isnull': True})
+        for previous, previous_value in zip(ordering[:position], values[:position]):
+            previous = previous.lstrip('-')
+            step &= Q(**({f'{previous}__isnull': True} if previous_value is None else {previous: previous_value}))
+        condition |= step
+    return condition
+
+
+def keyset_page(connection_type, queryset, args, ordering=None, max_limit=None, count_strategy=None):
+    """
+    Connection page with keyset (seek) pagination.
+    
+    The cursor encodes the sort key of the last row, so a deep page is a
+    WHERE on the sort key instead of an OFFSET re-scanning earlier rows.
+    `ordering` defaults to keyset_ordering(queryset); sort keys are model
+    fields, related fields ('user__name') or annotations. Supports
+    first/after, last/before and an `offset` counted from the cursor.
+    Legacy offset cursors are paged by position (see legacy_cursor_offset).
+    totalCount is counted with `count_strategy` only if it is selected.
+    
+    Returns None when the queryset ordering cannot be keyed.
+    
+    Example:
+        return keyset_page(
+            InfluencerSearchConnection,
+            queryset,
+            {'first': 20, 'after': after},
+            ordering=['-search_rank', '-search_followers', '-id'],
+        )
+    """
+    ordering = ordering or keyset_ordering(queryset)
+    if ordering is None:
+        return None
+    nullable = {field.lstrip('-') for field in ordering if _is_nullable(queryset, field.lstrip('-'))}
+    
+    first, last = args.get('first'), args.get('last')
+    if max_limit is not None and first is None and last is None:
+        first = max_limit
+    backward = first is None and last is not None
+    cursor = args.get('before') if backward else args.get('after')
+    
+    legacy_offset = legacy_cursor_offset(cursor) if cursor else None
+    if legacy_offset is not None:
+        # Offset cursor issued before the field paged with keyset cursors
+        offset = args.get('offset') or 0
+        if backward:
+            end = max(legacy_offset - offset, 0)
+            start = max(end - last, 0)
+            args = {'first': end - start, 'offset': start}
+        else:
+            args = {'first': first, 'offset': offset + legacy_offset + 1}
+        return keyset_page(connection_type, queryset, args, ordering, max_limit, count_strategy)
+    
+    # Sort keys are selected under their own alias, so reading them needs no deferred field or join
+    keys = {f'keyset_{position}': F(field.lstrip('-')) for position, field in enumerate(ordering)}
+    page = queryset.annotate(**keys).order_by(*keyset_order_by(ordering, nullable, reverse=backward))
+    if cursor:
+        values = decode_cursor(cursor)
+        if len(values) != len(ordering):
+            raise GraphQLError('Invalid cursor')
+        page = page.filter(keyset_filter(ordering, values, nullable, reverse=backward))
+    
+    # One extra row tells whether another page exists
+    offset = args.get('offset') or 0
+    size = last if backward else first
+    if size is None:
+        rows, has_more = list(page[offset:]), False
+    else:
+        rows = list(page[offset:offset + size + 1])
+        has_more = len(rows) > size
+        rows = rows[:size]
+    if backward:
+        rows.reverse()
+    elif last is not None and len(rows) > last:
+        rows = rows[-last:]
+    
+    edges = [
+        connection_type.Edge(node=row, cursor=encode_cursor([getattr(row, key) for key in keys]))
+        for row in rows
+    ]
+    connection = connection_type(
+        edges=edges,
+        page_info=relay.PageInfo(
+            start_cursor=edges[0].cursor if edges else None,
+            end_cursor=edges[-1].cursor if edges else None,
+            has_previous_page=has_more if backward else bool(cursor or offset),
+            has_next_page=bool(cursor) if backward else has_more,
+        )
+    )
+    connection.iterable = queryset
+    connection.count_strategy = count_strategy
+    return connection
+
+
+def keyset_connection(connection_type, queryset, ordering, first, after=None, count_strategy=None):
+    """
+    Keyset page of `queryset` in an explicit `ordering` (see keyset_page).
+    
+    `ordering` must end with a unique field (e.g. 'id') and name model
+    fields or annotations.
+    
+    Example:
+        return keyset_connection(
+            InfluencerSearchConnection,
+            Influencer.objects.annotate(followers=...),
+            ['-followers', '-id'],
+            first=20,
+            after=after,
+        )
+    """
+    return keyset_page(
+        connection_type, queryset, {'first': first, 'after': after},
+        ordering=ordering, count_strategy=count_strategy
+    )
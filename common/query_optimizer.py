@@ -0,0 +1,141 @@
+"""
+Selection-set-aware queryset optimisation for GraphQL nodes.
+
+Instead of hand-written `select_related`/`prefetch_related` calls that run
+whatever the client asks for, the queryset is shaped from the GraphQL
+selection set (graphene-django-optimizer): requested foreign keys become
+joins, requested reverse/many-to-many relations become prefetches, and the
+selected scalar fields become an `only()` column list.
+
+Nodes mix in OptimizedNodeMixin (single-object lookups through
+`relay.Node.Field`), list fields use OptimizedConnectionField, and custom
+resolvers call `optimize_queryset(queryset, info)` themselves.
+
+Nodes must NOT override `get_queryset` for this: graphene-django then
+resolves every foreign key pointing to the node with one `get_node` query
+per row, which defeats the joins computed here.
+
+Resolvers that read model data the optimiser cannot infer declare it with
+`resolver_hints` (otherwise `only()` is disabled for the whole query):
+
+    class OfferApplicationNode(OptimizedNodeMixin, DjangoObjectType):
+        @resolver_hints(only=('status',))
+        def resolve_is_pending(self, info):
+            return self.is_pending
+"""
+
+from django.db.models import Manager, Prefetch
+from django.db.models.query import QuerySet
+from graphene.types.definitions import GrapheneObjectType
+from graphene_django import DjangoObjectType
+from graphene_django.filter import DjangoFilterConnectionField
+from graphene_django.utils import maybe_queryset
+import graphene_django_optimizer as gql_optimizer
+
+from .pagination_utils import (
+    PaginationFieldMixin,
+    counted_connection,
+    current_count_strategy,
+    keyset_enabled,
+    keyset_page,
+)
+
+# Re-exported so nodes only depend on common/
+resolver_hints = gql_optimizer.resolver_hints
+
+
+def _unwrap(graphql_type):
+    while hasattr(graphql_type, 'of_type'):
+        graphql_type = graphql_type.of_type
+    return graphql_type
+
+
+def _returned_model(info):
+    """Django model returned by the field being resolved (node, list of nodes or connection)"""
+    graphql_type = _unwrap(info.return_type)
+    if not isinstance(graphql_type, GrapheneObjectType):
+        return None
+    graphene_type = graphql_type.graphene_type
+    node = getattr(graphene_type._meta, 'node', None)
+    if node is not None:
+        graphene_type = node
+    if isinstance(graphene_type, type) and issubclass(graphene_type, DjangoObjectType):
+        return graphene_type._meta.model
+    return None
+
+
+def _merge_prefetches(queryset):
+    """
+    Keep one lookup per prefetch path.
+
+    A resolver hint ('applications') and a selected field (Prefetch('applications',
+    queryset=...)) can target the same relation, which Django rejects; the
+    Prefetch carries the nested joins so it wins.
+    """
+    lookups = queryset._prefetch_related_lookups
+    custom = {lookup.prefetch_to for lookup in lookups if isinstance(lookup, Prefetch)}
+    merged, seen = [], set()
+    for lookup in lookups:
+        path = lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup
+        if path in seen or (not isinstance(lookup, Prefetch) and path in custom):
+            continue
+        seen.add(path)
+        merged.append(lookup)
+    if len(merged) == len(lookups):
+        return queryset
+    return queryset.prefetch_related(None).prefetch_related(*merged)
+
+
+def optimize_queryset(queryset, info, **options):
+    """
+    Add the joins, prefetches and `only()` columns needed by the selection set of `info`.
+
+    The queryset is returned unchanged when the field does not return nodes
+    of its model (e.g. the generic `node(id:)` field, typed as an interface).
+    """
+    if info is None:
+        return queryset
+    if isinstance(queryset, Manager):
+        queryset = queryset.all()
+    if _returned_model(info) is not queryset.model:
+        return queryset
+    return _merge_prefetches(gql_optimizer.query(queryset, info, **options))
+
+
+class OptimizedNodeMixin:
+    """DjangoObjectType mixin optimising single-object lookups (`relay.Node.Field`)"""
+
+    @classmethod
+    def get_node(cls, info, id):
+        queryset = optimize_queryset(cls.get_queryset(cls._meta.model.objects.all(), info), info)
+        try:
+            return queryset.get(pk=id)
+        except cls._meta.model.DoesNotExist:
+            return None
+
+
+class OptimizedConnectionField(PaginationFieldMixin, DjangoFilterConnectionField):
+    """
+    DjangoFilterConnectionField whose filtered queryset is optimised for the
+    selection set, and whose totalCount uses the field's `count_strategy`.
+    With `keyset=True` the cursors encode the sort key of the row instead of
+    its offset (see common/pagination_utils.py).
+    """
+
+    @classmethod
+    def resolve_queryset(cls, connection, iterable, info, args, filtering_args, filterset_class):
+        queryset = super().resolve_queryset(connection, iterable, info, args, filtering_args, filterset_class)
+        return optimize_queryset(queryset, info)
+
+    @classmethod
+    def resolve_connection(cls, connection, args, iterable, max_limit=None):
+        iterable = maybe_queryset(iterable)
+        if not isinstance(iterable, QuerySet):
+            return super().resolve_connection(connection, args, iterable, max_limit=max_limit)
+        if keyset_enabled():
+            page = keyset_page(
+                connection, iterable, args, max_limit=max_limit, count_strategy=current_count_strategy(connection)
+            )
+            if page is not None:
+                return page
+        return counted_connection(connection, args, iterable, max_limit=max_limit)
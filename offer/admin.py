@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.utils.html import format_html
 from .models import Offer, OfferApplication, ApplicationStatus
+from .stats import refresh_application_counters
 
 
 @admin.register(Offer)
@@ -144,6 +145,11 @@ class OfferApplicationAdmin(admin.ModelAdmin):
     status_badge.short_description = 'Status'
     status_badge.admin_order_field = 'status'
     
+    def _counter_scopes(self, queryset):
+        """Offer and user ids whose cached application counters a bulk action touches"""
+        scopes = list(queryset.order_by().values_list('offer_id', 'user_id'))
+        return [offer_id for offer_id, _ in scopes], [user_id for _, user_id in scopes]
+    
     def approve_applications(self, request, queryset):
         """Approve selected applications"""
         from django.utils import timezone
@@ -152,6 +158,7 @@ class OfferApplicationAdmin(admin.ModelAdmin):
             reviewed_by=request.user,
             reviewed_at=timezone.now()
         )
+        refresh_application_counters(*self._counter_scopes(queryset))
         self.message_user(request, f'{updated} applications approved.')
     approve_applications.short_description = "✓ Approve selected applications"
     
@@ -163,6 +170,7 @@ class OfferApplicationAdmin(admin.ModelAdmin):
             reviewed_by=request.user,
             reviewed_at=timezone.now()
         )
+        refresh_application_counters(*self._counter_scopes(queryset))
         self.message_user(request, f'{updated} applications rejected.')
     reject_applications.short_description = "✗ Reject selected applications"
     
@@ -173,5 +181,6 @@ class OfferApplicationAdmin(admin.ModelAdmin):
             reviewed_by=None,
             reviewed_at=None
         )
+        refresh_application_counters(*self._counter_scopes(queryset))
         self.message_user(request, f'{updated} applications set to pending.')
     set_pending.short_description = "⏳ Set to pending"
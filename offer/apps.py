@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class OfferConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'offer'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        # Builds the CachedCount totals, whose receivers bump the count versions on writes
+        from .queries import offer_application_queries, offer_list  # noqa: F401
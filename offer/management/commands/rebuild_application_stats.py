@@ -0,0 +1,26 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from offer.models import Offer, OfferApplicationCounter, UserApplicationCounter
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the cached per-offer and per-user application counters (after enabling OFFER_APPLICATION_STATS_COUNTERS or bulk changes)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Offers/users counted per query (default: 500)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        offer_ids = Offer.objects.order_by('id').values_list('id', flat=True)
+        # Applicants, plus users whose counter row may be stale
+        user_ids = set(
+            get_user_model().objects.filter(applications__isnull=False).values_list('id', flat=True)
+        ) | set(UserApplicationCounter.objects.values_list('user_id', flat=True))
+        offers = OfferApplicationCounter.refresh(list(offer_ids), batch_size=batch_size)
+        users = UserApplicationCounter.refresh(sorted(user_ids), batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(f'✓ Rebuilt application counters for {offers} offer(s) and {users} user(s)'))
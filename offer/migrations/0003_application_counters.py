@@ -0,0 +1,42 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offer', '0002_alter_offerapplication_options_and_more'),
+        ('users', '0010_influencersearchdocument'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OfferApplicationCounter',
+            fields=[
+                ('pending', models.IntegerField(default=0)),
+                ('approved', models.IntegerField(default=0)),
+                ('rejected', models.IntegerField(default=0)),
+                ('withdrawn', models.IntegerField(default=0)),
+                ('offer', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='application_counter', serialize=False, to='offer.offer')),
+            ],
+            options={
+                'db_table': 'offer_application_counters',
+            },
+        ),
+        migrations.CreateModel(
+            name='UserApplicationCounter',
+            fields=[
+                ('pending', models.IntegerField(default=0)),
+                ('approved', models.IntegerField(default=0)),
+                ('rejected', models.IntegerField(default=0)),
+                ('withdrawn', models.IntegerField(default=0)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='application_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'user_application_counters',
+            },
+        ),
+    ]
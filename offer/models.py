@@ -94,3 +94,103 @@ class OfferApplication(models.Model):
     @property
     def is_rejected(self):
         return self.status == ApplicationStatus.REJECTED
+
+
+# ApplicationStatus -> counter column (see ApplicationStatusCounter and offer/stats.py)
+STATUS_COUNTER_FIELDS = {
+    ApplicationStatus.PENDING: 'pending',
+    ApplicationStatus.APPROVED: 'approved',
+    ApplicationStatus.REJECTED: 'rejected',
+    ApplicationStatus.WITHDRAW: 'withdrawn',
+}
+
+
+class ApplicationStatusCounter(models.Model):
+    """
+    Cached number of applications per status for one offer or one user.
+
+    Optional (OFFER_APPLICATION_STATS_COUNTERS setting): kept current by the
+    application mutations inside their transaction, so stats reads are a
+    primary-key lookup. `refresh()` rebuilds rows from offer_application.
+    """
+
+    # Foreign key of OfferApplication the counter is grouped by
+    scope_field = None
+
+    pending = models.IntegerField(default=0)
+    approved = models.IntegerField(default=0)
+    rejected = models.IntegerField(default=0)
+    withdrawn = models.IntegerField(default=0)
+
+    class Meta:
+        abstract = True
+
+    def counts(self):
+        counts = {field: getattr(self, field) for field in STATUS_COUNTER_FIELDS.values()}
+        return {'total': sum(counts.values()), **counts}
+
+    @classmethod
+    def refresh(cls, ids, batch_size=500):
+        """
+        Recompute the counters of the given offers/users.
+
+        One grouped query and one upsert per batch; ids that no longer exist
+        are ignored. Returns the number of rows written.
+        """
+        from django.db.models import Count
+
+        related_model = cls._meta.get_field(cls.scope_field).related_model
+        ids = list(dict.fromkeys(ids))
+        written = 0
+        for start in range(0, len(ids), batch_size):
+            batch = related_model.objects.filter(pk__in=ids[start:start + batch_size]).values_list('pk', flat=True)
+            counters = {pk: cls(**{f'{cls.scope_field}_id': pk}) for pk in batch}
+            rows = (
+                OfferApplication.objects.filter(**{f'{cls.scope_field}_id__in': list(counters)})
+                .order_by()
+                .values_list(f'{cls.scope_field}_id', 'status')
+                .annotate(count=Count('id'))
+            )
+            for pk, status, count in rows:
+                if status in STATUS_COUNTER_FIELDS:
+                    setattr(counters[pk], STATUS_COUNTER_FIELDS[status], count)
+            cls.objects.bulk_create(
+                counters.values(),
+                update_conflicts=True,
+                unique_fields=[cls.scope_field],
+                update_fields=list(STATUS_COUNTER_FIELDS.values()),
+            )
+            written += len(counters)
+        return written
+
+
+class OfferApplicationCounter(ApplicationStatusCounter):
+    """Application counts of one offer (offerApplicationStats)"""
+
+    scope_field = 'offer'
+
+    offer = models.OneToOneField(
+        Offer,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='application_counter'
+    )
+
+    class Meta:
+        db_table = 'offer_application_counters'
+
+
+class UserApplicationCounter(ApplicationStatusCounter):
+    """Application counts of one applicant (myApplicationStats)"""
+
+    scope_field = 'user'
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='application_counter'
+    )
+
+    class Meta:
+        db_table = 'user_application_counters'
@@ -4,7 +4,8 @@ Complete query operations with proper filtering and permissions
 """
 
 import graphene
-from graphene_django.filter import DjangoFilterConnectionField
+from common.pagination_utils import CachedCount, EstimatedCount
+from common.query_optimizer import OptimizedConnectionField
 from graphql import GraphQLError
 from graphql_jwt.decorators import login_required
 from graphql_relay import from_global_id
@@ -12,6 +13,7 @@ from graphql_relay import from_global_id
 from ..models import OfferApplication, ApplicationStatus, Offer
 from ..types.OfferApplication_Node import OfferApplicationNode
 from ..filters.OfferApplication_Filter import OfferApplicationFilter
+from ..stats import offer_application_stats, user_application_stats
 from users.utils import check_user_role
 
 
@@ -22,32 +24,37 @@ class OfferApplicationQueries(graphene.ObjectType):
     offer_application = graphene.relay.Node.Field(OfferApplicationNode)
     
     # Get all applications with filtering and pagination
-    all_offer_applications = DjangoFilterConnectionField(
+    all_offer_applications = OptimizedConnectionField(
         OfferApplicationNode,
         filterset_class=OfferApplicationFilter,
+        keyset=True,
+        count_strategy=EstimatedCount(fallback=CachedCount(depends_on=('offer.OfferApplication',))),
         description="Get all offer applications with pagination and filtering"
     )
     
     # Get current user's applications (influencer view)
-    my_applications = DjangoFilterConnectionField(
+    my_applications = OptimizedConnectionField(
         OfferApplicationNode,
         filterset_class=OfferApplicationFilter,
+        keyset=True,
         description="Get current user's applications"
     )
     
     # Get applications for a specific offer (offer creator view)
-    applications_for_offer = DjangoFilterConnectionField(
+    applications_for_offer = OptimizedConnectionField(
         OfferApplicationNode,
         filterset_class=OfferApplicationFilter,
+        keyset=True,
         offer_id_custom=graphene.ID(required=True),
         description="Get all applications for a specific offer"
     )
     
     # Get applications by status
-    applications_by_status = DjangoFilterConnectionField(
+    applications_by_status = OptimizedConnectionField(
         OfferApplicationNode,
         status_filter=graphene.String(required=True),
         filterset_class=OfferApplicationFilter,
+        keyset=True,
         description="Get applications filtered by status"
     )
     
@@ -138,15 +145,7 @@ class OfferApplicationQueries(graphene.ObjectType):
         if not check_user_role(user, 'INFLUENCER'):
             raise GraphQLError('This query is only available for influencer accounts')
         
-        applications = OfferApplication.objects.filter(user=user)
-        
-        return ApplicationStatsType(
-            total=applications.count(),
-            pending=applications.filter(status=ApplicationStatus.PENDING).count(),
-            approved=applications.filter(status=ApplicationStatus.APPROVED).count(),
-            rejected=applications.filter(status=ApplicationStatus.REJECTED).count(),
-            withdrawn=applications.filter(status=ApplicationStatus.WITHDRAW).count(),
-        )
+        return ApplicationStatsType(**user_application_stats(user.id))
     
     @login_required
     def resolve_offer_application_stats(self, info, offer_id_stats, **kwargs):
@@ -166,15 +165,7 @@ class OfferApplicationQueries(graphene.ObjectType):
         if not (is_offer_creator or is_admin):
             raise GraphQLError('You do not have permission to view statistics for this offer')
         
-        applications = OfferApplication.objects.filter(offer=offer)
-        
-        return ApplicationStatsType(
-            total=applications.count(),
-            pending=applications.filter(status=ApplicationStatus.PENDING).count(),
-            approved=applications.filter(status=ApplicationStatus.APPROVED).count(),
-            rejected=applications.filter(status=ApplicationStatus.REJECTED).count(),
-            withdrawn=applications.filter(status=ApplicationStatus.WITHDRAW).count(),
-        )
+        return ApplicationStatsType(**offer_application_stats(offer.id))
 
 
 class ApplicationStatsType(graphene.ObjectType):
@@ -1,5 +1,6 @@
 import graphene
-from graphene_django.filter import DjangoFilterConnectionField
+from common.pagination_utils import CachedCount
+from common.query_optimizer import OptimizedConnectionField
 from graphql import GraphQLError
 from graphql_jwt.decorators import login_required
 
@@ -11,16 +12,19 @@ from offer.models import Offer
 class OfferListQuery(graphene.ObjectType):
     """Query to get all offers with pagination and totalCount"""
 
-    all_offers = DjangoFilterConnectionField(
+    all_offers = OptimizedConnectionField(
         OfferNode,
         filterset_class=OfferFilter,
+        keyset=True,
+        count_strategy=CachedCount(depends_on=('offer.Offer',)),
         description="Get all offers with pagination and filtering"
     )
     
     # Get offers created by current user
-    my_offers = DjangoFilterConnectionField(
+    my_offers = OptimizedConnectionField(
         OfferNode,
         filterset_class=OfferFilter,
+        keyset=True,
         description="Get offers created by the authenticated user"
     )
 
@@ -30,4 +34,4 @@ class OfferListQuery(graphene.ObjectType):
     def resolve_my_offers(self, info, **kwargs):
         """Get offers created by the current authenticated user"""
         user = info.context.user
-        return Offer.objects.filter(created_by=user).prefetch_related('applications', 'applications__user')
+        return Offer.objects.filter(created_by=user)
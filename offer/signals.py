@@ -0,0 +1,44 @@
+"""
+Signals keeping the cached application counters (offer/stats.py) in sync
+with every write: mutations, the admin change form, and deletes that bypass
+the mutations (admin deletes, queryset.delete() and the Offer / User ->
+OfferApplication cascades). Writes that send no signal (queryset.update(),
+bulk_create) call refresh_application_counters() themselves.
+"""
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import OfferApplication
+from .stats import counters_enabled, record_status_change, refresh_application_counters
+
+
+@receiver(pre_save, sender=OfferApplication)
+def read_counted_state(sender, instance, raw=False, **kwargs):
+    # The stored row, not the instance: it may have been loaded before another write
+    instance._counted_state = None
+    if counters_enabled() and not raw and not instance._state.adding:
+        instance._counted_state = (
+            OfferApplication.objects.filter(pk=instance.pk).values_list('status', 'offer_id', 'user_id').first()
+        )
+
+
+@receiver(post_save, sender=OfferApplication)
+def update_application_counters(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, '_counted_state', None)
+    if created or previous is None:
+        record_status_change(instance)
+        return
+    previous_status, offer_id, user_id = previous
+    if (offer_id, user_id) == (instance.offer_id, instance.user_id):
+        record_status_change(instance, previous_status)
+    else:
+        # Application moved to another offer/user: rebuild both scopes
+        refresh_application_counters({offer_id, instance.offer_id}, {user_id, instance.user_id})
+
+
+@receiver(post_delete, sender=OfferApplication)
+def decrement_application_counters(sender, instance, **kwargs):
+    record_status_change(instance, instance.status, deleted=True)
@@ -0,0 +1,123 @@
+"""
+Application counts per status, computed in a single query.
+
+    application_status_counts(OfferApplication.objects.filter(user=user))
+    # {'total': 5, 'pending': 2, 'approved': 1, 'rejected': 1, 'withdrawn': 1}
+
+    application_counts_by_offer([1, 2])
+    # {1: {'total': 3, 'pending': 3, ...}, 2: {...}}  (offers without applications are absent)
+
+Dashboard stats (offer_application_stats / user_application_stats) read the
+OfferApplicationCounter / UserApplicationCounter rows when the
+OFFER_APPLICATION_STATS_COUNTERS setting is enabled; post_save / post_delete
+signals (offer/signals.py) keep them current with record_status_change() on
+every save and delete (mutations, admin, queryset.delete(), cascades).
+"""
+
+from django.conf import settings
+from django.db.models import Count, F, Q
+
+from .models import (
+    STATUS_COUNTER_FIELDS,
+    OfferApplication,
+    OfferApplicationCounter,
+    UserApplicationCounter,
+)
+
+# Status -> key of the count dictionaries
+STATUS_KEYS = STATUS_COUNTER_FIELDS
+
+
+def _status_aggregates():
+    """Conditional COUNTs: total plus one per status"""
+    return {
+        'total': Count('id'),
+        **{key: Count('id', filter=Q(status=status)) for status, key in STATUS_KEYS.items()},
+    }
+
+
+def empty_counts():
+    return {'total': 0, **{key: 0 for key in STATUS_KEYS.values()}}
+
+
+def application_status_counts(queryset):
+    """Counts per status of an OfferApplication queryset (one grouped query)"""
+    counts = empty_counts()
+    for status, count in queryset.order_by().values_list('status').annotate(count=Count('id')):
+        counts['total'] += count
+        if status in STATUS_KEYS:
+            counts[STATUS_KEYS[status]] = count
+    return counts
+
+
+def application_counts_by_offer(offer_ids):
+    """Counts per status of the applications of several offers (one grouped query)"""
+    rows = (
+        OfferApplication.objects.filter(offer_id__in=offer_ids)
+        .order_by()
+        .values('offer_id')
+        .annotate(**_status_aggregates())
+    )
+    return {row.pop('offer_id'): row for row in rows}
+
+
+def counters_enabled():
+    return getattr(settings, 'OFFER_APPLICATION_STATS_COUNTERS', False)
+
+
+def _stats(counter_model, pk):
+    if counters_enabled():
+        counter = counter_model.objects.filter(pk=pk).first()
+        if counter is None and counter_model.refresh([pk]):
+            # First read: build the row from offer_application
+            counter = counter_model.objects.get(pk=pk)
+        if counter is not None:
+            return counter.counts()
+    scope = {f'{counter_model.scope_field}_id': pk}
+    return application_status_counts(OfferApplication.objects.filter(**scope))
+
+
+def offer_application_stats(offer_id):
+    """Counts per status of the applications received by an offer"""
+    return _stats(OfferApplicationCounter, offer_id)
+
+
+def user_application_stats(user_id):
+    """Counts per status of the applications sent by a user"""
+    return _stats(UserApplicationCounter, user_id)
+
+
+def record_status_change(application, previous_status=None, deleted=False):
+    """
+    Update the cached counters of the application's offer and user.
+
+    Called by the post_save / post_delete signals (offer/signals.py) after
+    a save (previous_status=None for a new application) or a delete, inside
+    the same transaction. Missing counter rows are rebuilt from
+    offer_application, which already includes the change, except on delete:
+    during an Offer or User cascade the counter row itself may already be
+    gone, and a missing row is rebuilt on first read anyway.
+    No-op unless OFFER_APPLICATION_STATS_COUNTERS is set.
+    """
+    if not counters_enabled():
+        return
+    previous = STATUS_KEYS.get(previous_status)
+    current = None if deleted else STATUS_KEYS.get(application.status)
+    if previous == current:
+        return
+    changes = {}
+    if previous:
+        changes[previous] = F(previous) - 1
+    if current:
+        changes[current] = F(current) + 1
+    for counter_model in (OfferApplicationCounter, UserApplicationCounter):
+        pk = getattr(application, f'{counter_model.scope_field}_id')
+        if not counter_model.objects.filter(pk=pk).update(**changes) and not deleted:
+            counter_model.refresh([pk])
+
+
+def refresh_application_counters(offer_ids=(), user_ids=()):
+    """Rebuild the counters touched by a bulk change (queryset.update(), imports)"""
+    if counters_enabled():
+        OfferApplicationCounter.refresh(offer_ids)
+        UserApplicationCounter.refresh(user_ids)
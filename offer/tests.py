@@ -1,3 +1,445 @@
-from django.test import TestCase
+import datetime
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import F
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from graphql_relay import offset_to_cursor
+
+from common.pagination_utils import EstimatedCount
+from users.models import User
+from .models import ApplicationStatus, Offer, OfferApplication, OfferApplicationCounter, UserApplicationCounter
+from .stats import application_status_counts, user_application_stats
+
+
+APPLICATIONS_QUERY = """
+query Applications($first: Int) {
+  allOfferApplications(first: $first) {
+    totalCount
+    edges {
+      node {
+        status
+        isPending
+        canEdit
+        offer { title createdBy { email } }
+        user { name }
+      }
+    }
+  }
+}
+"""
+
+OFFER_COUNTS_QUERY = """
+query OfferCounts($first: Int) {
+  allOffers(first: $first) {
+    edges { node { title applicationsCount pendingApplicationsCount approvedApplicationsCount } }
+  }
+}
+"""
+
+OFFER_STATS_QUERY = """
+query OfferStats($offerId: ID!) {
+  offerApplicationStats(offerIdStats: $offerId) { total pending approved rejected withdrawn }
+}
+"""
+
+APPLICATION_PAGE_QUERY = """
+query ApplicationPage($first: Int, $last: Int, $offset: Int) {
+  allOfferApplications(first: $first, last: $last, offset: $offset) {
+    totalCount
+    isEstimate
+    pageInfo { hasNextPage }
+    edges { node { status } }
+  }
+}
+"""
+
+KEYSET_PAGE_QUERY = """
+query KeysetPage($first: Int, $after: String, $last: Int, $before: String, $ordering: String) {
+  allOfferApplications(first: $first, after: $after, last: $last, before: $before, ordering: $ordering) {
+    pageInfo { hasNextPage hasPreviousPage startCursor endCursor }
+    edges { node { proposal } }
+  }
+}
+"""
+
+STATUSES = [ApplicationStatus.PENDING, ApplicationStatus.APPROVED, ApplicationStatus.REJECTED]
+
+
+@override_settings(GRAPHQL_KEYSET_PAGINATION=True)
+class OfferQueryOptimizerTests(TestCase):
+    """Offer and application querysets follow the GraphQL selection set"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = User.objects.create_user(email='company@example.com', name='Company', role='COMPANY')
+        cls.influencers = influencers = [
+            User.objects.create_user(email=f'influencer{index}@example.com', name=f'Influencer {index}', role='INFLUENCER')
+            for index in range(3)
+        ]
+        today = datetime.date.today()
+        for index in range(4):
+            offer = Offer.objects.create(
+                title=f'Offer {index}', min_budget=100, max_budget=200, start_date=today, end_date=today,
+                influencer_number=2, requirement='Requirement', objectif='Objectif', created_by=cls.company
+            )
+            for influencer, status in zip(influencers, STATUSES):
+                OfferApplication.objects.create(
+                    offer=offer, user=influencer, proposal='Proposal', asking_price=150, status=status
+                )
+        # Offer without applications
+        Offer.objects.create(
+            title='Offer 4', min_budget=100, max_budget=200, start_date=today, end_date=today,
+            influencer_number=2, requirement='Requirement', objectif='Objectif', created_by=cls.company
+        )
+
+    def execute(self, query, as_user=None, **variables):
+        from brandfluence.schema import schema
+        context = RequestFactory().post('/graphql/')
+        context.user = as_user or self.company
+        with CaptureQueriesContext(connection) as queries:
+            result = schema.execute(query, variable_values=variables, context_value=context)
+        self.assertIsNone(result.errors)
+        return result.data, queries
+
+    def test_application_relations_are_joined(self):
+        for first in (2, 12):
+            data, queries = self.execute(APPLICATIONS_QUERY, first=first)
+            self.assertEqual(data['allOfferApplications']['totalCount'], 12)
+            self.assertEqual(len(data['allOfferApplications']['edges']), first)
+            # COUNT + applications joined with offer, offer creator and user
+            self.assertEqual(len(queries), 2)
+
+    def test_unrequested_applications_are_not_prefetched(self):
+        data, queries = self.execute('{ allOffers(first: 4) { edges { node { title createdBy { email } } } } }')
+        self.assertEqual(len(data['allOffers']['edges']), 4)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('offer_offerapplication', queries[0]['sql'])
+        self.assertNotIn('"requirement"', queries[0]['sql'])
+
+
+class ApplicationCountTests(OfferQueryOptimizerTests):
+    """Status counts are computed with one aggregate query per page"""
+
+    def test_offer_counts_are_batched_per_page(self):
+        for first in (2, 5):
+            data, queries = self.execute(OFFER_COUNTS_QUERY, first=first)
+            counts = {
+                edge['node']['title']: (
+                    edge['node']['applicationsCount'],
+                    edge['node']['pendingApplicationsCount'],
+                    edge['node']['approvedApplicationsCount'],
+                )
+                for edge in data['allOffers']['edges']
+            }
+            self.assertEqual(len(counts), first)
+            for title, value in counts.items():
+                self.assertEqual(value, (0, 0, 0) if title == 'Offer 4' else (3, 1, 1))
+            # Offers + grouped application counts (totalCount not selected: no COUNT)
+            self.assertEqual(len(queries), 2)
+
+    def test_connection_status_counts_use_one_query(self):
+        data, queries = self.execute(
+            '{ allOfferApplications(first: 1) { totalCount pendingCount approvedCount rejectedCount } }'
+        )
+        self.assertEqual(data['allOfferApplications'], {
+            'totalCount': 12, 'pendingCount': 4, 'approvedCount': 4, 'rejectedCount': 4,
+        })
+        # COUNT + page + conditional aggregate
+        self.assertEqual(len(queries), 3)
+
+
+class ApplicationStatsTests(OfferQueryOptimizerTests):
+    """myApplicationStats / offerApplicationStats: one grouped query, or cached counters"""
+
+    def offer_stats(self, offer):
+        data, queries = self.execute(OFFER_STATS_QUERY, offerId=offer.pk)
+        return data['offerApplicationStats'], queries
+
+    def test_stats_use_one_grouped_query(self):
+        offer = Offer.objects.get(title='Offer 0')
+        stats, queries = self.offer_stats(offer)
+        self.assertEqual(stats, {'total': 3, 'pending': 1, 'approved': 1, 'rejected': 1, 'withdrawn': 0})
+        # Offer (permission check) + grouped COUNT
+        self.assertEqual(len(queries), 2)
+
+        data, queries = self.execute(
+            '{ myApplicationStats { total pending approved rejected withdrawn } }', as_user=self.influencers[1]
+        )
+        self.assertEqual(data['myApplicationStats'], {'total': 4, 'pending': 0, 'approved': 4, 'rejected': 0, 'withdrawn': 0})
+        self.assertEqual(len(queries), 1)
+
+    @override_settings(OFFER_APPLICATION_STATS_COUNTERS=True)
+    def test_counters_follow_mutations(self):
+        offer = Offer.objects.get(title='Offer 4')
+        self.assertEqual(self.offer_stats(offer)[0]['total'], 0)
+        self.assertTrue(OfferApplicationCounter.objects.filter(pk=offer.pk).exists())
+
+        self.execute(
+            'mutation Apply($offerId: ID!) { createOfferApplication(offerId: $offerId, proposal: "P", askingPrice: 150) { ok } }',
+            as_user=self.influencers[0], offerId=offer.pk,
+        )
+        application = OfferApplication.objects.get(offer=offer)
+        self.execute(
+            'mutation Review($id: ID!) { updateOfferApplicationStatus(applicationId: $id, status: "Approved") { ok } }',
+            id=application.pk,
+        )
+        stats, queries = self.offer_stats(offer)
+        self.assertEqual(stats, {'total': 1, 'pending': 0, 'approved': 1, 'rejected': 0, 'withdrawn': 0})
+        # Offer (permission check) + counter primary-key lookup
+        self.assertEqual(len(queries), 2)
+        self.assertNotIn('offer_offerapplication', queries[1]['sql'])
+
+        # post_save signal
+        application.refresh_from_db()
+        application.status = ApplicationStatus.WITHDRAW
+        application.save()
+        self.assertEqual(self.offer_stats(offer)[0]['withdrawn'], 1)
+
+        # post_delete signal
+        application.delete()
+        self.assertEqual(self.offer_stats(offer)[0]['total'], 0)
+
+        data, _ = self.execute(
+            '{ myApplicationStats { total pending approved rejected withdrawn } }', as_user=self.influencers[0]
+        )
+        self.assertEqual(data['myApplicationStats'], {'total': 4, 'pending': 4, 'approved': 0, 'rejected': 0, 'withdrawn': 0})
+
+    @override_settings(OFFER_APPLICATION_STATS_COUNTERS=True)
+    def test_counters_follow_cascade_and_queryset_deletes(self):
+        user = self.influencers[1]
+        before = user_application_stats(user.pk)
+        self.assertTrue(UserApplicationCounter.objects.filter(pk=user.pk).exists())
+        applications = OfferApplication.objects.filter(user=user)
+        offer = applications.first().offer
+        removed = applications.filter(offer=offer).count()
+
+        offer.delete()
+        after = user_application_stats(user.pk)
+        self.assertEqual(after['total'], before['total'] - removed)
+        self.assertEqual(after, application_status_counts(OfferApplication.objects.filter(user=user)))
+
+        OfferApplication.objects.filter(user=user).delete()
+        self.assertEqual(user_application_stats(user.pk)['total'], 0)
+        self.assertFalse(OfferApplicationCounter.objects.filter(pk=offer.pk).exists())
+
+    @override_settings(OFFER_APPLICATION_STATS_COUNTERS=True)
+    def test_counters_follow_admin_writes(self):
+        offer = Offer.objects.get(title='Offer 4')
+        user = self.influencers[0]
+        self.assertEqual(self.offer_stats(offer)[0]['total'], 0)
+        before = user_application_stats(user.pk)
+        admin = User.objects.create_superuser(email='admin@example.com', name='Admin', password='password')
+        self.client.force_login(admin)
+        form = {
+            'offer': offer.pk, 'user': user.pk, 'asking_price': '150.00', 'status': ApplicationStatus.PENDING,
+            'proposal': 'Admin proposal', 'cover_letter': '', 'portfolio_links': '[]', 'rejection_reason': '',
+            'admin_notes': '',
+        }
+
+        response = self.client.post(reverse('admin:offer_offerapplication_add'), form)
+        self.assertEqual(response.status_code, 302)
+        application = OfferApplication.objects.get(offer=offer)
+        self.assertEqual(self.offer_stats(offer)[0]['pending'], 1)
+        self.assertEqual(user_application_stats(user.pk)['total'], before['total'] + 1)
+
+        form['status'] = ApplicationStatus.APPROVED
+        response = self.client.post(reverse('admin:offer_offerapplication_change', args=[application.pk]), form)
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.offer_stats(offer)[0], {'total': 1, 'pending': 0, 'approved': 1, 'rejected': 0, 'withdrawn': 0})
+
+        response = self.client.post(
+            reverse('admin:offer_offerapplication_delete', args=[application.pk]), {'post': 'yes'}
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.offer_stats(offer)[0]['total'], 0)
+        self.assertEqual(user_application_stats(user.pk), before)
+
+
+class EstimatedTotalCountTests(OfferQueryOptimizerTests):
+    """allOfferApplications reports the planner estimate of large tables"""
+
+    def page(self, **variables):
+        with mock.patch.object(EstimatedCount, 'estimate', return_value=500_000):
+            data, queries = self.execute(APPLICATION_PAGE_QUERY, **variables)
+        return data['allOfferApplications'], queries
+
+    def test_estimate_replaces_count(self):
+        page, queries = self.page(first=5)
+        self.assertEqual((page['totalCount'], page['isEstimate']), (500_000, True))
+        self.assertTrue(page['pageInfo']['hasNextPage'])
+        self.assertEqual(len(page['edges']), 5)
+        # Page only: no COUNT
+        self.assertEqual(len(queries), 1)
+
+        # The extra row fetched, not the estimate, ends the pagination
+        page, _ = self.page(first=5, offset=10)
+        self.assertFalse(page['pageInfo']['hasNextPage'])
+        self.assertEqual(len(page['edges']), 2)
+
+    def test_backward_pagination_keeps_the_estimate(self):
+        # Keyset pages never need the count, in either direction
+        page, queries = self.page(last=2)
+        self.assertEqual((page['totalCount'], page['isEstimate']), (500_000, True))
+        self.assertEqual(len(page['edges']), 2)
+        self.assertEqual(len(queries), 1)
+
+
+COUNT_CACHE = {
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+    'LOCATION': os.path.join(tempfile.gettempdir(), 'brandfluence-count-cache-tests'),
+}
+
+# Another worker that has never counted offers saves one (the write itself is signalled only:
+# the in-memory test database is not visible from another process)
+OTHER_WORKER_WRITE = """
+import django
+django.setup()
+from django.db.models.signals import post_save
+from offer.models import Offer
+post_save.send(sender=Offer, instance=Offer(), created=True, raw=False, using='default', update_fields=None)
+"""
+
+
+@override_settings(CACHES={'default': COUNT_CACHE})
+class CachedTotalCountTests(TransactionTestCase):
+    """allOffers caches its COUNT in a shared cache until an offer is written (outside transactions only)"""
+
+    def setUp(self):
+        cache.clear()
+        self.company = User.objects.create_user(email='company@example.com', name='Company', role='COMPANY')
+        for index in range(3):
+            self.create_offer(index)
+
+    def create_offer(self, index):
+        today = datetime.date.today()
+        return Offer.objects.create(
+            title=f'Offer {index}', min_budget=100, max_budget=200, start_date=today, end_date=today,
+            influencer_number=2, requirement='Requirement', objectif='Objectif', created_by=self.company
+        )
+
+    def total_count(self, query='{ allOffers(first: 2) { totalCount isEstimate edges { node { title } } } }'):
+        from brandfluence.schema import schema
+        context = RequestFactory().post('/graphql/')
+        context.user = self.company
+        with CaptureQueriesContext(connection) as queries:
+            result = schema.execute(query, context_value=context)
+        self.assertIsNone(result.errors)
+        self.assertFalse(result.data['allOffers']['isEstimate'])
+        return result.data['allOffers']['totalCount'], len(queries)
+
+    def test_count_is_cached_per_data_version(self):
+        self.assertEqual(self.total_count(), (3, 2))
+        self.assertEqual(self.total_count(), (3, 1))
+
+        # Another filter is another cache key
+        self.assertEqual(self.total_count('{ allOffers(first: 2, title: "Offer 1") { totalCount isEstimate } }'), (1, 2))
+
+        self.create_offer(3)
+        self.assertEqual(self.total_count(), (4, 2))
+        Offer.objects.filter(title='Offer 0').delete()
+        self.assertEqual(self.total_count(), (3, 2))
+
+    def test_write_in_a_fresh_process_invalidates_the_count(self):
+        self.assertEqual(self.total_count(), (3, 2))
+        today = datetime.date.today()
+        # bulk_create sends no signal: the cached total is stale until a worker bumps the version
+        Offer.objects.bulk_create([Offer(
+            title='Offer 3', min_budget=100, max_budget=200, start_date=today, end_date=today,
+            influencer_number=2, requirement='Requirement', objectif='Objectif', created_by=self.company
+        )])
+        self.assertEqual(self.total_count(), (3, 1))
+
+        env = dict(os.environ, CACHE_BACKEND=COUNT_CACHE['BACKEND'], CACHE_LOCATION=COUNT_CACHE['LOCATION'])
+        env.setdefault('DJANGO_SETTINGS_MODULE', 'brandfluence.settings')
+        subprocess.run([sys.executable, '-c', OTHER_WORKER_WRITE], cwd=settings.BASE_DIR, env=env, check=True)
+        self.assertEqual(self.total_count(), (4, 2))
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_per_process_cache_counts_every_time(self):
+        # Another worker's writes would not bump this process's data version
+        self.assertEqual(self.total_count(), (3, 2))
+        self.assertEqual(self.total_count(), (3, 2))
+
+
+class KeysetPaginationTests(OfferQueryOptimizerTests):
+    """Application lists page with keyset cursors in any OrderingFilter ordering"""
+
+    def walk(self, ordering, size=5, backward=False):
+        proposals, cursor = [], None
+        while True:
+            if backward:
+                data, queries = self.execute(KEYSET_PAGE_QUERY, last=size, before=cursor, ordering=ordering)
+            else:
+                data, queries = self.execute(KEYSET_PAGE_QUERY, first=size, after=cursor, ordering=ordering)
+            page = data['allOfferApplications']
+            # One page query, no OFFSET and no COUNT
+            self.assertEqual(len(queries), 1)
+            self.assertNotIn('OFFSET', queries[0]['sql'])
+            page_proposals = [edge['node']['proposal'] for edge in page['edges']]
+            proposals = page_proposals + proposals if backward else proposals + page_proposals
+            if backward and not page['pageInfo']['hasPreviousPage']:
+                return proposals
+            if not backward and not page['pageInfo']['hasNextPage']:
+                return proposals
+            cursor = page['pageInfo']['startCursor' if backward else 'endCursor']
+
+    def setUp(self):
+        self.applications = list(OfferApplication.objects.order_by('pk'))
+        for index, application in enumerate(self.applications):
+            # Ties and NULLs: the primary key breaks ties, NULLs come last
+            application.proposal = f'Proposal {index}'
+            application.estimated_reach = None if index % 4 == 0 else 1000 * (index % 3)
+            application.save()
+
+    def test_nullable_ordering_is_walked_in_both_directions(self):
+        applications = self.applications
+        expected = [
+            application.proposal
+            for application in sorted(
+                applications,
+                key=lambda application: (application.estimated_reach is None, -(application.estimated_reach or 0), -application.pk)
+            )
+        ]
+        self.assertEqual(self.walk('-estimated_reach'), expected)
+        self.assertEqual(self.walk('-estimated_reach', backward=True), expected)
+
+    @override_settings(GRAPHQL_KEYSET_PAGINATION=False)
+    def test_offset_cursors_unless_keyset_pagination_is_enabled(self):
+        data, _ = self.execute(KEYSET_PAGE_QUERY, first=3, ordering='user_name')
+        self.assertEqual(data['allOfferApplications']['pageInfo']['endCursor'], offset_to_cursor(2))
+
+    def test_legacy_offset_cursors_are_accepted(self):
+        expected = list(OfferApplication.objects.order_by('user__name', 'pk').values_list('proposal', flat=True))
+        data, _ = self.execute(KEYSET_PAGE_QUERY, first=3, after=offset_to_cursor(4), ordering='user_name')
+        page = data['allOfferApplications']
+        self.assertEqual([edge['node']['proposal'] for edge in page['edges']], expected[5:8])
+        self.assertTrue(page['pageInfo']['hasPreviousPage'])
+        self.assertTrue(page['pageInfo']['hasNextPage'])
+        # The next page continues from the keyset cursor returned for the legacy one
+        data, _ = self.execute(KEYSET_PAGE_QUERY, first=3, after=page['pageInfo']['endCursor'], ordering='user_name')
+        self.assertEqual([edge['node']['proposal'] for edge in data['allOfferApplications']['edges']], expected[8:11])
+
+        data, _ = self.execute(KEYSET_PAGE_QUERY, last=3, before=offset_to_cursor(2), ordering='user_name')
+        page = data['allOfferApplications']
+        self.assertEqual([edge['node']['proposal'] for edge in page['edges']], expected[:2])
+        self.assertFalse(page['pageInfo']['hasPreviousPage'])
+
+    def test_related_field_ordering(self):
+        expected = list(
+            OfferApplication.objects.order_by('user__name', 'pk').values_list('proposal', flat=True)
+        )
+        self.assertEqual(len(set(expected)), 12)
+        self.assertEqual(self.walk('user_name', size=4), expected)
+        self.assertEqual(self.walk('-estimated_reach,user_name'), list(
+            OfferApplication.objects.order_by(F('estimated_reach').desc(nulls_last=True), 'user__name', 'pk')
+            .values_list('proposal', flat=True)
+        ))
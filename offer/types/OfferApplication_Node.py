@@ -1,13 +1,25 @@
 import graphene
 from graphene_django import DjangoObjectType
 from graphene import relay
+from common.query_optimizer import OptimizedNodeMixin, resolver_hints
+from common.pagination_utils import CountedConnectionMixin
 from ..models import OfferApplication
+from ..stats import application_status_counts, empty_counts
 
 
-class OfferApplicationConnection(relay.Connection):
+def _connection_status_counts(connection):
+    """Counts per status of the whole filtered queryset, computed once per connection"""
+    if not hasattr(connection, 'status_counts'):
+        iterable = getattr(connection, 'iterable', None)
+        connection.status_counts = (
+            application_status_counts(iterable) if hasattr(iterable, 'filter') else empty_counts()
+        )
+    return connection.status_counts
+
+
+class OfferApplicationConnection(CountedConnectionMixin, relay.Connection):
     """Connection for OfferApplication with totalCount support"""
     
-    total_count = graphene.Int()
     pending_count = graphene.Int()
     approved_count = graphene.Int()
     rejected_count = graphene.Int()
@@ -15,32 +27,20 @@ class OfferApplicationConnection(relay.Connection):
     class Meta:
         abstract = True
     
-    def resolve_total_count(root, info, **kwargs):
-        """Resolve total count"""
-        return root.length if hasattr(root, 'length') else (
-            root.iterable.count() if hasattr(root, 'iterable') and hasattr(root.iterable, 'count') else len(root.edges)
-        )
-    
     def resolve_pending_count(root, info, **kwargs):
         """Count of pending applications"""
-        if hasattr(root, 'iterable') and hasattr(root.iterable, 'filter'):
-            return root.iterable.filter(status='Pending').count()
-        return 0
+        return _connection_status_counts(root)['pending']
     
     def resolve_approved_count(root, info, **kwargs):
         """Count of approved applications"""
-        if hasattr(root, 'iterable') and hasattr(root.iterable, 'filter'):
-            return root.iterable.filter(status='Approved').count()
-        return 0
+        return _connection_status_counts(root)['approved']
     
     def resolve_rejected_count(root, info, **kwargs):
         """Count of rejected applications"""
-        if hasattr(root, 'iterable') and hasattr(root.iterable, 'filter'):
-            return root.iterable.filter(status='Rejected').count()
-        return 0
+        return _connection_status_counts(root)['rejected']
 
 
-class OfferApplicationNode(DjangoObjectType):
+class OfferApplicationNode(OptimizedNodeMixin, DjangoObjectType):
     """GraphQL Node for OfferApplication"""
     
     is_pending = graphene.Boolean()
@@ -55,26 +55,19 @@ class OfferApplicationNode(DjangoObjectType):
         connection_class = OfferApplicationConnection
         fields = '__all__'
     
-    @classmethod
-    def get_queryset(cls, queryset, info):
-        """Optimize queryset to reduce database hits"""
-        return queryset.select_related(
-            'offer',
-            'user',
-            'reviewed_by'
-        ).prefetch_related(
-            'offer__created_by'
-        )
-    
+    @resolver_hints(only=('status',))
     def resolve_is_pending(self, info):
         return self.is_pending
     
+    @resolver_hints(only=('status',))
     def resolve_is_approved(self, info):
         return self.is_approved
     
+    @resolver_hints(only=('status',))
     def resolve_is_rejected(self, info):
         return self.is_rejected
     
+    @resolver_hints(only=('user', 'status'))
     def resolve_can_edit(self, info):
         """Check if current user can edit this application"""
         user = info.context.user
@@ -83,6 +76,7 @@ class OfferApplicationNode(DjangoObjectType):
         # Only the applicant can edit, and only if pending
         return self.user_id == user.id and self.is_pending
     
+    @resolver_hints(only=('user', 'status'))
     def resolve_can_withdraw(self, info):
         """Check if current user can withdraw this application"""
         user = info.context.user
@@ -1,25 +1,28 @@
 import graphene
 from graphene_django import DjangoObjectType
 from graphene import relay
+from common.dataloaders import PrimingConnectionMixin, get_dataloaders
+from common.query_optimizer import OptimizedNodeMixin, resolver_hints
+from common.pagination_utils import CountedConnectionMixin
 from ..models import Offer
+from ..stats import application_counts_by_offer, empty_counts
 
 
-class OfferConnection(relay.Connection):
+def _application_counts(offer, info):
+    """Counts per status, loaded with one grouped query for the whole page of offers"""
+    return get_dataloaders(info).load_batch(
+        offer, 'application_counts', application_counts_by_offer, default=empty_counts()
+    )
+
+
+class OfferConnection(CountedConnectionMixin, PrimingConnectionMixin, relay.Connection):
     """Connection for Offer with totalCount and offset pagination support"""
     
-    total_count = graphene.Int()
-    
     class Meta:
         abstract = True
-    
-    def resolve_total_count(root, info, **kwargs):
-        """Resolve total count from stored length or iterable"""
-        return root.length if hasattr(root, 'length') else (
-            root.iterable.count() if hasattr(root, 'iterable') and hasattr(root.iterable, 'count') else len(root.edges)
-        )
 
 
-class OfferNode(DjangoObjectType):
+class OfferNode(OptimizedNodeMixin, DjangoObjectType):
     """GraphQL Node for Offer - defines what data can be queried"""
     
     applications_count = graphene.Int()
@@ -31,19 +34,17 @@ class OfferNode(DjangoObjectType):
         interfaces = (relay.Node,)
         connection_class = OfferConnection
     
-    @classmethod
-    def get_queryset(cls, queryset, info):
-        """Optimize queryset to reduce database hits"""
-        return queryset.select_related('created_by').prefetch_related('applications', 'applications__user')
-    
+    @resolver_hints()
     def resolve_applications_count(self, info):
         """Get total count of applications"""
-        return self.applications.count()
+        return _application_counts(self, info)['total']
     
+    @resolver_hints()
     def resolve_pending_applications_count(self, info):
         """Get count of pending applications"""
-        return self.applications.filter(status='Pending').count()
+        return _application_counts(self, info)['pending']
     
+    @resolver_hints()
     def resolve_approved_applications_count(self, info):
         """Get count of approved applications"""
-        return self.applications.filter(status='Approved').count()
+        return _application_counts(self, info)['approved']
@@ -6,3 +6,8 @@ class UsersConfig(AppConfig):
     name = 'users'
     verbose_name = 'User Management'
 
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        # Builds the CachedCount totals, whose receivers bump the count versions on writes
+        from .queries import influencer_queries, user_queries  # noqa: F401
@@ -0,0 +1,100 @@
+"""
+Benchmark de la pagination profonde de allUsers : OFFSET contre curseur
+keyset (WHERE sur la clé de tri, voir common/pagination_utils.keyset_page).
+
+Le benchmark crée une base de test temporaire (jamais la base réelle), y
+insère des utilisateurs synthétiques puis mesure la latence de la page 1000
+(20 résultats par page) pour chaque tri.
+
+Usage (depuis la racine du projet) :
+    python -m users.benchmark_pagination
+    python -m users.benchmark_pagination --page 1000 --page-size 20 --repeats 5
+"""
+
+import argparse
+import os
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'brandfluence.settings')
+# allUsers ne pagine par keyset que si ce réglage est actif
+os.environ.setdefault('GRAPHQL_KEYSET_PAGINATION', 'True')
+django.setup()
+
+from django.db import connection
+from django.test import RequestFactory
+
+from brandfluence.schema import schema
+from users.models import User
+
+ORDERINGS = ['-created_at', 'name', 'email']
+
+PAGE_QUERY = """
+query Page($first: Int, $offset: Int, $after: String, $ordering: String) {
+  allUsers(first: $first, offset: $offset, after: $after, ordering: $ordering) {
+    pageInfo { endCursor }
+    edges { node { email } }
+  }
+}
+"""
+
+
+def populate(n_rows, batch_size=5000):
+    """Insère n_rows utilisateurs synthétiques (noms répétés : égalités départagées par l'id)"""
+    for offset in range(0, n_rows, batch_size):
+        User.objects.bulk_create([
+            User(email=f'bench{i}@example.com', name=f'Utilisateur {i % 500}', password='!')
+            for i in range(offset, min(offset + batch_size, n_rows))
+        ])
+
+
+def fetch(context, **variables):
+    result = schema.execute(PAGE_QUERY, variable_values=variables, context_value=context)
+    if result.errors:
+        raise result.errors[0]
+    return result.data['allUsers']
+
+
+def time_page(context, repeats, **variables):
+    """Latence moyenne (ms) d'une page et e-mails retournés"""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        page = fetch(context, **variables)
+    return (time.perf_counter() - start) * 1000 / repeats, [edge['node']['email'] for edge in page['edges']]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--page', type=int, default=1000)
+    parser.add_argument('--page-size', type=int, default=20)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        skipped = (args.page - 1) * args.page_size
+        populate(skipped + 5 * args.page_size)
+        context = RequestFactory().post('/graphql/')
+        context.user = User.objects.create_user(email='admin@example.com', name='Admin', is_staff=True)
+
+        print(f" Benchmark pagination ({connection.vendor}, page {args.page} x {args.page_size}, repeats={args.repeats})")
+        print(f"{'tri':>12} | {'offset':>11} | {'keyset':>11} | {'speedup':>7} | identiques")
+        print("-" * 62)
+        for ordering in ORDERINGS:
+            # Curseur de la dernière ligne de la page précédente (hors mesure)
+            previous = fetch(context, first=1, offset=skipped - 1, ordering=ordering)
+            before, offset_rows = time_page(
+                context, args.repeats, first=args.page_size, offset=skipped, ordering=ordering
+            )
+            after, keyset_rows = time_page(
+                context, args.repeats, first=args.page_size, after=previous['pageInfo']['endCursor'], ordering=ordering
+            )
+            print(f"{ordering:>12} | {before:>8.2f} ms | {after:>8.2f} ms | "
+                  f"x{before / after:>6.1f} | {'oui' if offset_rows == keyset_rows else 'NON'}")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark de la recherche d'influenceurs : icontains (LIKE '%q%') contre le
+backend plein texte (tsvector + GIN sur PostgreSQL, FTS5 sur SQLite).
+
+Le benchmark crée une base de test temporaire (jamais la base réelle), y
+insère des profils synthétiques puis mesure la latence d'une page de 20
+résultats et du COUNT associé.
+
+Usage (depuis la racine du projet) :
+    python -m users.benchmark_search
+    python -m users.benchmark_search --sizes 10000 100000 --repeats 5
+"""
+
+import argparse
+import os
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'brandfluence.settings')
+django.setup()
+
+import numpy as np
+from django.db import connection
+
+from users.influencer_models import Influencer
+from users.models import User
+from users.search import get_search_backend, rebuild_search_index
+
+WORDS = [
+    'mode', 'voyage', 'beauté', 'cuisine', 'sport', 'fitness', 'musique', 'gaming', 'tech', 'photo',
+    'lifestyle', 'famille', 'nature', 'art', 'danse', 'humour', 'santé', 'décoration', 'auto', 'cinéma',
+]
+QUERIES = ['voyage', 'photo cuisine', 'gam', 'influenceur mode', 'introuvable']
+
+
+def populate(n_rows, seed=42, batch_size=5000):
+    """Insère n_rows profils synthétiques (utilisateur + influenceur)"""
+    rng = np.random.default_rng(seed)
+    start = User.objects.count()
+    for offset in range(0, n_rows, batch_size):
+        ids = range(start + offset, start + min(offset + batch_size, n_rows))
+        users = User.objects.bulk_create([
+            User(email=f'bench{i}@example.com', name=f'Influenceur {i}', password='!')
+            for i in ids
+        ])
+        Influencer.objects.bulk_create([
+            Influencer(
+                user=user,
+                pseudo=f'creator_{i}',
+                biography=' '.join(rng.choice(WORDS, 12)),
+                centres_interet=list(rng.choice(WORDS, 3)),
+            )
+            for i, user in zip(ids, users)
+        ])
+    rebuild_search_index(batch_size=2000)
+
+
+def time_query(backend, query, repeats):
+    """Latence moyenne (ms) d'une page de 20 résultats + COUNT"""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        queryset = backend.search(Influencer.objects.all(), query)
+        list(queryset.order_by('-search_rank', '-id')[:20])
+        count = queryset.count()
+    return (time.perf_counter() - start) * 1000 / repeats, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        baseline = get_search_backend('icontains')
+        fulltext = get_search_backend()
+        print(f" Benchmark recherche ({connection.vendor}, backend '{fulltext.name}', repeats={args.repeats})")
+        print(f"{'profils':>8} | {'requête':>18} | {'icontains':>11} | {fulltext.name:>11} | {'speedup':>7} | {'matches':>13}")
+        print("-" * 86)
+
+        populated = 0
+        for size in sorted(args.sizes):
+            populate(size - populated, seed=size)
+            populated = size
+            for query in QUERIES:
+                before, count_before = time_query(baseline, query, args.repeats)
+                after, count_after = time_query(fulltext, query, args.repeats)
+                print(f"{size:>8} | {query:>18} | {before:>8.2f} ms | {after:>8.2f} ms | "
+                      f"x{before / after:>6.1f} | {count_before:>6}/{count_after:<6}")
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,380 @@
+"""
+Bulk import of influencer accounts (used by the import_influencers command).
+
+    with open('influencer_accounts.json', encoding='utf-8') as f:
+        importer = InfluencerImporter(update_existing=True)
+        for chunk in chunked(iter_json_array(f), 1000):
+            result = importer.import_chunk(chunk)
+
+The JSON array is decoded one element at a time, so a 100k-profile file is
+never held in memory. Each chunk is written in one transaction with one
+bulk_create per table (users, profiles, category links, social networks,
+previous works, collaboration offers). When a chunk fails, it is replayed
+row by row so only the faulty rows are reported as errors.
+
+bulk_create does not send post_save signals: the chunk refreshes the
+InfluencerMetrics rows, the search documents and the cached counts itself.
+"""
+
+import json
+from collections import namedtuple
+from decimal import Decimal
+from itertools import islice
+
+import django
+from django.apps import apps
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from category.models import Category
+from common.pagination_utils import bump_data_version
+
+from .influencer_models import Influencer, InfluencerMetrics, InfluencerWork, OffreCollaboration, ReseauSocial
+from .models import User
+from .search import refresh_search_documents
+
+DEFAULT_PASSWORD = 'DefaultPassword123!'
+
+PROFILE_FIELDS = {
+    'instagram_username': None,
+    'pseudo': None,
+    'biography': None,
+    'site_web': None,
+    'localisation': None,
+    'langues': list,
+    'centres_interet': list,
+    'type_contenu': list,
+    'disponibilite_collaboration': 'disponible',
+}
+
+RowError = namedtuple('RowError', 'email message')
+
+
+def iter_json_array(fp, buffer_size=1 << 16):
+    """
+    Yield the elements of the top-level JSON array read from the text file `fp`.
+
+    Only the element being decoded is buffered. Raises json.JSONDecodeError
+    (positions are relative to the current buffer) on malformed input.
+    """
+    decoder = json.JSONDecoder()
+    buffer, position, eof = '', 0, False
+
+    def skip_whitespace():
+        nonlocal buffer, position, eof
+        while True:
+            while position < len(buffer) and buffer[position].isspace():
+                position += 1
+            if position < len(buffer) or eof:
+                return
+            buffer, position = fp.read(buffer_size), 0
+            eof = not buffer
+
+    def expect(characters):
+        nonlocal position
+        skip_whitespace()
+        if position >= len(buffer) or buffer[position] not in characters:
+            raise json.JSONDecodeError(f'Expected one of {characters!r}', buffer, position)
+        position += 1
+        return buffer[position - 1]
+
+    expect('[')
+    skip_whitespace()
+    if position < len(buffer) and buffer[position] == ']':
+        return
+    while True:
+        skip_whitespace()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = None
+            # A value ending the buffer may continue in the next read (numbers)
+            if end is not None and (end < len(buffer) or eof):
+                break
+            more = fp.read(buffer_size)
+            eof = not more
+            buffer, position = buffer[position:] + more, 0
+        position = end
+        yield value
+        if expect(',]') == ']':
+            return
+
+
+def chunked(iterable, size):
+    """Lists of `size` items (the last one may be shorter)"""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _setup_worker():
+    # Spawned workers (non-fork platforms) start without configured apps
+    if not apps.ready:
+        django.setup()
+
+
+def password_hasher(workers):
+    """
+    Executor hashing passwords in `workers` processes (None for in-process hashing).
+
+    The hashers are CPU bound (PBKDF2 iterations), so threads would not help.
+    """
+    if workers <= 1:
+        return None
+    from concurrent.futures import ProcessPoolExecutor
+    return ProcessPoolExecutor(max_workers=workers, initializer=_setup_worker)
+
+
+def hash_passwords(passwords, executor=None):
+    if executor is None:
+        return [make_password(password) for password in passwords]
+    return list(executor.map(make_password, passwords, chunksize=16))
+
+
+class CategoryCache:
+    """Category ids by name, loaded once; missing categories are created in bulk"""
+
+    def __init__(self):
+        self._ids = None
+
+    def ids(self, names):
+        """Ids of the categories `names` (duplicate names resolve to the oldest category)"""
+        if self._ids is None:
+            self._ids = {}
+            for category_id, name in Category.objects.order_by('id').values_list('id', 'name'):
+                self._ids.setdefault(name, category_id)
+        missing = [name for name in dict.fromkeys(names) if name not in self._ids]
+        if missing:
+            created = Category.objects.bulk_create(
+                [Category(name=name, description=f'Category: {name}') for name in missing]
+            )
+            self._ids.update((category.name, category.id) for category in created)
+            bump_data_version(Category)
+        return list(dict.fromkeys(self._ids[name] for name in names))
+
+    def forget(self):
+        """Drop the cache (categories created by a rolled back transaction)"""
+        self._ids = None
+
+
+class ChunkResult:
+    """Outcome of InfluencerImporter.import_chunk"""
+
+    def __init__(self):
+        self.created = 0
+        self.updated = 0
+        self.errors = []
+        self.rows_written = 0
+
+    def merge(self, other):
+        self.created += other.created
+        self.updated += other.updated
+        self.errors += other.errors
+        self.rows_written += other.rows_written
+
+
+class InfluencerImporter:
+    """
+    Writes chunks of influencer accounts (the format of influencer_accounts.json).
+
+    Existing emails are errors unless `update_existing`: the user is then kept
+    as is and its profile fields and nested collections are replaced by the
+    ones present in the file. Passwords are hashed by `executor` when given
+    (see password_hasher).
+    """
+
+    def __init__(self, update_existing=False, executor=None):
+        self.update_existing = update_existing
+        self.executor = executor
+        self.categories = CategoryCache()
+
+    def import_chunk(self, rows):
+        result = ChunkResult()
+        rows, deferred = self._split_duplicates(rows, result)
+        self._write_rows(self._prepare(rows, result), result)
+        # Later occurrences of an email see the account written above
+        for row in deferred:
+            self._write_rows(self._prepare([row], result), result)
+        return result
+
+    def _split_duplicates(self, rows, result):
+        unique, deferred, seen = [], [], set()
+        for row in rows:
+            email = row.get('email')
+            if not email:
+                result.errors.append(RowError(None, 'The Email field must be set'))
+                continue
+            row['email'] = User.objects.normalize_email(email)
+            (deferred if row['email'] in seen else unique).append(row)
+            seen.add(row['email'])
+        return unique, deferred
+
+    def _prepare(self, rows, result):
+        """Attach the existing user (if any) and the hashed password of new users"""
+        existing = User.objects.in_bulk([row['email'] for row in rows], field_name='email')
+        kept = []
+        for row in rows:
+            row['_user'] = existing.get(row['email'])
+            if row['_user'] is not None and not self.update_existing:
+                result.errors.append(RowError(
+                    row['email'],
+                    f'User with email {row["email"]} already exists. Use --update to update existing users.',
+                ))
+            else:
+                kept.append(row)
+        new_rows = [row for row in kept if row['_user'] is None and '_password' not in row]
+        hashed = hash_passwords([row.get('password', DEFAULT_PASSWORD) for row in new_rows], self.executor)
+        for row, password in zip(new_rows, hashed):
+            row['_password'] = password
+        return kept
+
+    def _write_rows(self, rows, result):
+        if not rows:
+            return
+        try:
+            with transaction.atomic():
+                result.merge(self._write(rows))
+            return
+        except Exception as e:
+            self.categories.forget()
+            if len(rows) == 1:
+                result.errors.append(RowError(rows[0]['email'], str(e)))
+                return
+        # Replay row by row to isolate the failing ones
+        for row in self._prepare(rows, result):
+            self._write_rows([row], result)
+
+    def _write(self, rows):
+        result = ChunkResult()
+        new_users = []
+        for row in rows:
+            if row['_user'] is None:
+                new_users.append(User(
+                    email=row['email'],
+                    password=row['_password'],
+                    name=row.get('name'),
+                    phone_number=row.get('phone_number'),
+                    role=row.get('role', 'INFLUENCER'),
+                    email_verified=row.get('email_verified', False),
+                    is_verify_by_admin=row.get('is_verify_by_admin', False),
+                ))
+        created_users = iter(User.objects.bulk_create(new_users))
+        for row in rows:
+            if row['_user'] is None:
+                row['_user'] = next(created_users)
+        result.created, result.updated = len(new_users), len(rows) - len(new_users)
+        result.rows_written += len(new_users)
+
+        profiles = [row for row in rows if 'influencer_profile' in row]
+        influencers = self._write_profiles(profiles, result)
+        self._write_categories(profiles, influencers, result)
+        self._write_collections(profiles, influencers, result)
+
+        influencer_ids = [influencer.pk for influencer in influencers.values()]
+        InfluencerMetrics.refresh(influencer_ids)
+        refresh_search_documents(influencer_ids)
+        for model in (User, Influencer, InfluencerMetrics):
+            bump_data_version(model)
+        return result
+
+    def _write_profiles(self, rows, result):
+        """{user id: Influencer} of the profiles of `rows` (created or updated)"""
+        user_ids = [row['_user'].pk for row in rows]
+        influencers = {
+            influencer.user_id: influencer
+            for influencer in Influencer.objects.filter(user_id__in=user_ids)
+        }
+        to_create, to_update = [], []
+        now = timezone.now()
+        for row in rows:
+            values = {
+                field: row['influencer_profile'].get(field, default() if callable(default) else default)
+                for field, default in PROFILE_FIELDS.items()
+            }
+            influencer = influencers.get(row['_user'].pk)
+            if influencer is None:
+                influencer = Influencer(user=row['_user'], **values)
+                influencers[row['_user'].pk] = influencer
+                to_create.append(influencer)
+                row['_created'] = True
+            else:
+                for field, value in values.items():
+                    setattr(influencer, field, value)
+                influencer.updated_at = now
+                to_update.append(influencer)
+                row['_created'] = False
+        Influencer.objects.bulk_create(to_create)
+        Influencer.objects.bulk_update(to_update, [*PROFILE_FIELDS, 'updated_at'])
+        result.rows_written += len(to_create) + len(to_update)
+        return influencers
+
+    def _write_categories(self, rows, influencers, result):
+        Through = Influencer.selected_categories.through
+        rows = [row for row in rows if 'selected_categories' in row['influencer_profile']]
+        replaced = [influencers[row['_user'].pk].pk for row in rows if not row['_created']]
+        if replaced:
+            Through.objects.filter(influencer_id__in=replaced).delete()
+        links = [
+            Through(influencer_id=influencers[row['_user'].pk].pk, category_id=category_id)
+            for row in rows
+            for category_id in self.categories.ids(row['influencer_profile']['selected_categories'])
+        ]
+        Through.objects.bulk_create(links)
+        result.rows_written += len(links)
+
+    def _write_collections(self, rows, influencers, result):
+        for key, model, build in (
+            ('reseaux_sociaux', ReseauSocial, _reseau_social),
+            ('previous_works', InfluencerWork, _influencer_work),
+            ('offres_collaboration', OffreCollaboration, _offre_collaboration),
+        ):
+            rows_with_key = [row for row in rows if key in row['influencer_profile']]
+            replaced = [influencers[row['_user'].pk].pk for row in rows_with_key if not row['_created']]
+            if replaced:
+                model.objects.filter(influencer_id__in=replaced).delete()
+            objects = [
+                build(influencers[row['_user'].pk], data)
+                for row in rows_with_key
+                for data in row['influencer_profile'][key]
+            ]
+            model.objects.bulk_create(objects)
+            result.rows_written += len(objects)
+
+
+def _reseau_social(influencer, data):
+    return ReseauSocial(
+        influencer=influencer,
+        plateforme=data.get('plateforme'),
+        url_profil=data.get('url_profil'),
+        nombre_abonnes=data.get('nombre_abonnes', 0),
+        taux_engagement=data.get('taux_engagement', 0.0),
+        moyenne_vues=data.get('moyenne_vues', 0),
+        moyenne_likes=data.get('moyenne_likes', 0),
+        moyenne_commentaires=data.get('moyenne_commentaires', 0),
+        frequence_publication=data.get('frequence_publication', 'hebdomadaire'),
+    )
+
+
+def _influencer_work(influencer, data):
+    return InfluencerWork(
+        influencer=influencer,
+        brand_name=data.get('brand_name'),
+        campaign=data.get('campaign'),
+        period=data.get('period'),
+        results=data.get('results'),
+        publication_link=data.get('publication_link'),
+    )
+
+
+def _offre_collaboration(influencer, data):
+    return OffreCollaboration(
+        influencer=influencer,
+        type_collaboration=data.get('type_collaboration'),
+        tarif_minimum=Decimal(str(data.get('tarif_minimum', 0))),
+        tarif_maximum=Decimal(str(data.get('tarif_maximum', 0))),
+        conditions=data.get('conditions'),
+    )
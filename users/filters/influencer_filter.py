@@ -1,6 +1,7 @@
 from django_filters import FilterSet, OrderingFilter, CharFilter, NumberFilter, DateTimeFilter
-from django.db.models import Sum, Avg
+from django.db.models import F
 from ..influencer_models import Influencer
+from ..search import get_search_backend
 
 
 class InfluencerFilter(FilterSet):
@@ -16,6 +17,9 @@ class InfluencerFilter(FilterSet):
     # Enum filters - use iexact for case-insensitive matching
     disponibilite_collaboration = CharFilter(field_name='disponibilite_collaboration', lookup_expr='iexact')
     
+    # Full-text search, results ordered by relevance unless `ordering` is given
+    search = CharFilter(method='filter_search')
+    
     # Number filters for statistics
     min_followers = NumberFilter(method='filter_min_followers')
     max_followers = NumberFilter(method='filter_max_followers')
@@ -44,41 +48,32 @@ class InfluencerFilter(FilterSet):
     )
     
     def filter_queryset(self, queryset):
-        """Override to add annotations for ordering"""
+        """Override to add annotations for ordering and follower/engagement thresholds"""
+        # Denormalised InfluencerMetrics row (indexed) instead of aggregating reseaux_sociaux
         queryset = queryset.annotate(
-            total_followers=Sum('reseaux_sociaux__nombre_abonnes'),
-            avg_engagement=Avg('reseaux_sociaux__taux_engagement')
+            total_followers=F('metrics__total_followers'),
+            avg_engagement=F('metrics__avg_engagement')
         )
         return super().filter_queryset(queryset)
     
+    # Threshold filters compare the indexed metrics columns
+    
     def filter_min_followers(self, queryset, name, value):
         """Filter influencers by minimum total followers"""
-        filtered_ids = []
-        for influencer in queryset:
-            if influencer.followers_totaux >= value:
-                filtered_ids.append(influencer.id)
-        return queryset.filter(id__in=filtered_ids)
+        return queryset.filter(total_followers__gte=value)
     
     def filter_max_followers(self, queryset, name, value):
         """Filter influencers by maximum total followers"""
-        filtered_ids = []
-        for influencer in queryset:
-            if influencer.followers_totaux <= value:
-                filtered_ids.append(influencer.id)
-        return queryset.filter(id__in=filtered_ids)
+        return queryset.filter(total_followers__lte=value)
     
     def filter_min_engagement(self, queryset, name, value):
         """Filter influencers by minimum engagement rate"""
-        filtered_ids = []
-        for influencer in queryset:
-            if influencer.engagement_moyen_global >= value:
-                filtered_ids.append(influencer.id)
-        return queryset.filter(id__in=filtered_ids)
+        return queryset.filter(avg_engagement__gte=value)
     
     def filter_max_engagement(self, queryset, name, value):
         """Filter influencers by maximum engagement rate"""
-        filtered_ids = []
-        for influencer in queryset:
-            if influencer.engagement_moyen_global <= value:
-                filtered_ids.append(influencer.id)
-        return queryset.filter(id__in=filtered_ids)
+        return queryset.filter(avg_engagement__lte=value)
+    
+    def filter_search(self, queryset, name, value):
+        """Full-text search on pseudo, biography, user name and interests"""
+        return get_search_backend().search(queryset, value).order_by('-search_rank', '-created_at')
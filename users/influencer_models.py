@@ -2,6 +2,9 @@ from django.db import models
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from .search.fields import FullTextField
 from category.models import Category
 
 User = get_user_model()
@@ -173,6 +176,151 @@ class ReseauSocial(models.Model):
         return f"{self.influencer.user.name} - {self.plateforme}"
 
 
+class InfluencerMetrics(models.Model):
+    """
+    Denormalised per-influencer metrics (one row per influencer).
+
+    Mirrors followers_totaux / engagement_moyen_global so that sorting and
+    range filters hit an index instead of aggregating reseaux_sociaux at query
+    time. Kept current by the ReseauSocial signals (users/signals.py); bulk
+    paths that bypass signals must call InfluencerMetrics.refresh(ids).
+    """
+
+    influencer = models.OneToOneField(
+        Influencer,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='metrics'
+    )
+
+    total_followers = models.BigIntegerField(default=0)
+    avg_engagement = models.FloatField(default=0.0)
+    platform_count = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'influencer_metrics'
+        verbose_name = 'Influencer Metrics'
+        verbose_name_plural = 'Influencer Metrics'
+        indexes = [
+            models.Index(fields=['total_followers'], name='influencer_metrics_followers'),
+            models.Index(fields=['avg_engagement'], name='influencer_metrics_engagement'),
+        ]
+
+    def __str__(self):
+        return f"Metrics for influencer {self.influencer_id}: {self.total_followers} followers"
+
+    @classmethod
+    def refresh(cls, influencer_ids, batch_size=500):
+        """
+        Recompute the metrics of the given influencers from reseaux_sociaux.
+
+        One grouped query and one upsert per batch; ids of deleted influencers
+        are ignored. Returns the number of rows written.
+        """
+        from django.db.models import Avg, Count, Sum
+        from django.db.models.functions import Coalesce
+        from django.utils import timezone
+
+        influencer_ids = list(dict.fromkeys(influencer_ids))
+        written = 0
+        for start in range(0, len(influencer_ids), batch_size):
+            batch = influencer_ids[start:start + batch_size]
+            now = timezone.now()
+            rows = (
+                Influencer.objects.filter(id__in=batch)
+                .annotate(
+                    metric_followers=Coalesce(Sum('reseaux_sociaux__nombre_abonnes'), 0),
+                    metric_engagement=Coalesce(Avg('reseaux_sociaux__taux_engagement'), 0.0, output_field=models.FloatField()),
+                    metric_platforms=Count('reseaux_sociaux'),
+                )
+                .values_list('id', 'metric_followers', 'metric_engagement', 'metric_platforms')
+            )
+            metrics = [
+                cls(
+                    influencer_id=influencer_id,
+                    total_followers=followers,
+                    avg_engagement=engagement,
+                    platform_count=platforms,
+                    updated_at=now,
+                )
+                for influencer_id, followers, engagement, platforms in rows
+            ]
+            cls.objects.bulk_create(
+                metrics,
+                update_conflicts=True,
+                unique_fields=['influencer'],
+                update_fields=['total_followers', 'avg_engagement', 'platform_count', 'updated_at'],
+            )
+            written += len(metrics)
+        return written
+
+    @classmethod
+    def refresh_all(cls, batch_size=500):
+        """Rebuild the metrics of every influencer"""
+        ids = Influencer.objects.order_by('id').values_list('id', flat=True)
+        return cls.refresh(list(ids), batch_size=batch_size)
+
+
+class InfluencerSearchDocument(models.Model):
+    """
+    Searchable text of an influencer (pseudo, biography, user name, interests).
+
+    On PostgreSQL `vector` holds the tsvector of `document` (GIN index); on
+    SQLite the text is mirrored in the FTS5 table
+    influencer_search_fts. Maintained by users/signals.py and
+    users.search.refresh_search_documents().
+    """
+
+    influencer = models.OneToOneField(
+        Influencer,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='search_document'
+    )
+
+    document = models.TextField(blank=True, default='')
+    vector = SearchVectorField(null=True, editable=False)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'influencer_search_documents'
+        verbose_name = 'Influencer Search Document'
+        verbose_name_plural = 'Influencer Search Documents'
+        indexes = [
+            GinIndex(fields=['vector'], name='influencer_search_vector_gin'),
+        ]
+
+    def __str__(self):
+        return f"Search document for influencer {self.influencer_id}"
+
+
+class InfluencerSearchFTS(models.Model):
+    """
+    SQLite FTS5 virtual table influencer_search_fts (rowid = influencer id).
+
+    Created by migration 0010 on SQLite only and written with raw SQL by
+    users.search; declared unmanaged so searches can join it and rank with bm25.
+    """
+
+    influencer = models.OneToOneField(
+        Influencer,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        db_column='rowid',
+        db_constraint=False,
+        related_name='search_fts'
+    )
+
+    document = FullTextField()
+
+    class Meta:
+        managed = False
+        db_table = 'influencer_search_fts'
+
+
 class InfluencerWork(models.Model):
     """Previous work/collaboration for influencer"""
     
@@ -7,6 +7,9 @@ from .influencer_models import (
     PortfolioMedia, OffreCollaboration, StatistiquesGlobales
 )
 from .utils import normalize_role
+from common.dataloaders import PrimingConnectionMixin, get_dataloaders
+from common.query_optimizer import OptimizedNodeMixin, resolver_hints
+from common.pagination_utils import CountedConnectionMixin
 from category.types import CategoryNode
 
 
@@ -195,22 +198,14 @@ class StatistiquesGlobalesType(graphene.ObjectType):
     croissance_mensuelle = graphene.Float()
 
 
-class InfluencerConnection(relay.Connection):
+class InfluencerConnection(CountedConnectionMixin, PrimingConnectionMixin, relay.Connection):
     """Connection for Influencer with totalCount and offset pagination support"""
     
-    total_count = graphene.Int()
-    
     class Meta:
         abstract = True
-    
-    def resolve_total_count(root, info, **kwargs):
-        """Resolve total count from stored length or iterable"""
-        return root.length if hasattr(root, 'length') else (
-            root.iterable.count() if hasattr(root, 'iterable') and hasattr(root.iterable, 'count') else len(root.edges)
-        )
 
 
-class InfluencerNode(DjangoObjectType):
+class InfluencerNode(OptimizedNodeMixin, DjangoObjectType):
     """GraphQL Node for Influencer model"""
     disponibilite_collaboration = graphene.Field(DisponibiliteEnum)
     selected_categories = graphene.List(CategoryNode)
@@ -238,39 +233,62 @@ class InfluencerNode(DjangoObjectType):
         interfaces = (graphene.relay.Node,)
         connection_class = InfluencerConnection
     
+    @resolver_hints(model_field='user')
+    def resolve_user(self, info):
+        return get_dataloaders(info).load(self, 'user')
+    
+    @resolver_hints(model_field='disponibilite_collaboration')
     def resolve_disponibilite_collaboration(self, info):
         """Normalize disponibilite_collaboration value to handle corrupted data"""
         clean_value = normalize_enum_value(self.disponibilite_collaboration)
         return clean_value
     
+    @resolver_hints(model_field='selected_categories')
     def resolve_selected_categories(self, info):
-        return self.selected_categories.all()
+        return get_dataloaders(info).load(self, 'selected_categories')
     
+    @resolver_hints(prefetch_related='reseaux_sociaux')
     def resolve_reseaux_sociaux(self, info):
-        return self.reseaux_sociaux.all()
+        return get_dataloaders(info).load(self, 'reseaux_sociaux')
     
+    @resolver_hints(model_field='previous_works')
     def resolve_previous_works(self, info):
-        return self.previous_works.all()
+        return get_dataloaders(info).load(self, 'previous_works')
     
+    @resolver_hints(prefetch_related='images')
     def resolve_images(self, info):
-        return self.images.all()
+        return get_dataloaders(info).load(self, 'images')
     
+    @resolver_hints(model_field='instagram_reels')
     def resolve_instagram_reels(self, info):
-        return self.instagram_reels.all()
+        return get_dataloaders(info).load(self, 'instagram_reels')
     
+    @resolver_hints(model_field='instagram_posts')
     def resolve_instagram_posts(self, info):
-        return self.instagram_posts.all()
+        return get_dataloaders(info).load(self, 'instagram_posts')
     
+    @resolver_hints(model_field='portfolio_media')
     def resolve_portfolio_media(self, info):
-        return self.portfolio_media.all()
+        return get_dataloaders(info).load(self, 'portfolio_media')
     
+    @resolver_hints(model_field='offres_collaboration')
     def resolve_offres_collaboration(self, info):
-        return self.offres_collaboration.all()
+        return get_dataloaders(info).load(self, 'offres_collaboration')
     
+    @resolver_hints(prefetch_related='reseaux_sociaux')
     def resolve_statistiques_globales(self, info):
         """Return current global statistics"""
+        # Batched reseaux_sociaux: the properties below then read the prefetched rows
+        get_dataloaders(info).load(self, 'reseaux_sociaux')
         return {
             'followers_totaux': self.followers_totaux,
             'engagement_moyen_global': self.engagement_moyen_global,
             'croissance_mensuelle': self.calculate_croissance_mensuelle()
         }
+
+
+class InfluencerSearchConnection(InfluencerConnection):
+    """Keyset-paginated connection returned by searchInfluencers"""
+    
+    class Meta:
+        node = InfluencerNode
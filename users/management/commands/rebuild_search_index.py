@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+from users.search import get_search_backend, rebuild_search_index, refresh_search_documents
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the influencer full-text search documents and index (after bulk imports or raw SQL loads)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--ids',
+            type=int,
+            nargs='+',
+            help='Only rebuild these influencer ids (default: all influencers)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Influencers indexed per batch (default: 500)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if options['ids']:
+            written = refresh_search_documents(options['ids'], batch_size=batch_size)
+        else:
+            written = rebuild_search_index(batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ Indexed {written} influencer(s) with the "{get_search_backend().name}" search backend'
+        ))
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from users.influencer_models import InfluencerMetrics
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the denormalised InfluencerMetrics rows from reseaux_sociaux (after bulk imports or raw SQL loads)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--ids',
+            type=int,
+            nargs='+',
+            help='Only refresh these influencer ids (default: all influencers)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Influencers aggregated per query (default: 500)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if options['ids']:
+            written = InfluencerMetrics.refresh(options['ids'], batch_size=batch_size)
+        else:
+            written = InfluencerMetrics.refresh_all(batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(f'✓ Refreshed metrics for {written} influencer(s)'))
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Avg, Count, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_influencer_metrics(apps, schema_editor):
+    Influencer = apps.get_model('users', 'Influencer')
+    InfluencerMetrics = apps.get_model('users', 'InfluencerMetrics')
+    rows = Influencer.objects.annotate(
+        metric_followers=Coalesce(Sum('reseaux_sociaux__nombre_abonnes'), 0),
+        metric_engagement=Coalesce(Avg('reseaux_sociaux__taux_engagement'), 0.0, output_field=models.FloatField()),
+        metric_platforms=Count('reseaux_sociaux'),
+    ).values_list('id', 'metric_followers', 'metric_engagement', 'metric_platforms')
+    InfluencerMetrics.objects.bulk_create(
+        [
+            InfluencerMetrics(
+                influencer_id=influencer_id,
+                total_followers=followers,
+                avg_engagement=engagement,
+                platform_count=platforms,
+            )
+            for influencer_id, followers, engagement, platforms in rows.iterator(chunk_size=2000)
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0008_passwordresettoken'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InfluencerMetrics',
+            fields=[
+                ('influencer', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='metrics', serialize=False, to='users.influencer')),
+                ('total_followers', models.BigIntegerField(default=0)),
+                ('avg_engagement', models.FloatField(default=0.0)),
+                ('platform_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Influencer Metrics',
+                'verbose_name_plural': 'Influencer Metrics',
+                'db_table': 'influencer_metrics',
+                'indexes': [models.Index(fields=['total_followers'], name='influencer_metrics_followers'), models.Index(fields=['avg_engagement'], name='influencer_metrics_engagement')],
+            },
+        ),
+        migrations.RunPython(backfill_influencer_metrics, migrations.RunPython.noop),
+    ]
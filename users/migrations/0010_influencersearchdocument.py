@@ -0,0 +1,84 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:12
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.db import migrations, models
+
+FTS_TABLE = 'influencer_search_fts'
+
+
+def document_text(pseudo, biography, name, centres_interet):
+    """Frozen copy of users.search.documents.document_text as of this migration"""
+    interests = centres_interet if isinstance(centres_interet, list) else [centres_interet or '']
+    parts = [pseudo, biography, name, *[str(interest) for interest in interests]]
+    return ' '.join(str(part) for part in parts if part)
+
+
+def create_search_index(apps, schema_editor):
+    """FTS5 virtual table on SQLite; then backfill the documents"""
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+            f"USING fts5(document, tokenize='unicode61 remove_diacritics 2')"
+        )
+
+    Influencer = apps.get_model('users', 'Influencer')
+    InfluencerSearchDocument = apps.get_model('users', 'InfluencerSearchDocument')
+    rows = Influencer.objects.values_list('id', 'pseudo', 'biography', 'user__name', 'centres_interet')
+    documents = {
+        influencer_id: document_text(pseudo, biography, name, interests)
+        for influencer_id, pseudo, biography, name, interests in rows.iterator(chunk_size=2000)
+    }
+    InfluencerSearchDocument.objects.bulk_create(
+        [InfluencerSearchDocument(influencer_id=pk, document=document) for pk, document in documents.items()],
+        batch_size=1000,
+    )
+    if vendor == 'postgresql':
+        schema_editor.execute("UPDATE influencer_search_documents SET vector = to_tsvector('simple', document)")
+    elif vendor == 'sqlite':
+        with schema_editor.connection.cursor() as cursor:
+            cursor.executemany(f'INSERT INTO {FTS_TABLE} (rowid, document) VALUES (%s, %s)', list(documents.items()))
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0009_influencermetrics'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InfluencerSearchDocument',
+            fields=[
+                ('influencer', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to='users.influencer')),
+                ('document', models.TextField(blank=True, default='')),
+                ('vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Influencer Search Document',
+                'verbose_name_plural': 'Influencer Search Documents',
+                'db_table': 'influencer_search_documents',
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['vector'], name='influencer_search_vector_gin')],
+            },
+        ),
+        migrations.CreateModel(
+            name='InfluencerSearchFTS',
+            fields=[
+                ('influencer', models.OneToOneField(db_column='rowid', db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_fts', serialize=False, to='users.influencer')),
+                ('document', models.TextField()),
+            ],
+            options={
+                'db_table': 'influencer_search_fts',
+                'managed': False,
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
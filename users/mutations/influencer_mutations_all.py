@@ -2,12 +2,16 @@
 Consolidated Influencer Mutations
 All influencer-related operations including profile completion and updates
 """
+import logging
+
 import graphene
 from graphql import GraphQLError
 from graphql_relay import from_global_id
 from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.contrib.contenttypes.models import ContentType
+from django.utils import timezone
 from datetime import datetime
 
 from ..influencer_models import (
@@ -21,10 +25,13 @@ from ..influencer_node import (
     DisponibiliteEnum, PlateformeEnum,
     FrequencePublicationEnum, TypeCollaborationEnum
 )
+from ..signals import schedule_metrics_refresh
 from ..utils import normalize_role, check_user_role
 from category.models import Category
+from common.instrumentation import track_queries
 
 User = get_user_model()
+logger = logging.getLogger(__name__)
 
 
 # Input types for nested objects
@@ -121,6 +128,240 @@ class InstagramDataInput(graphene.InputObjectType):
     is_private = graphene.Boolean()
 
 
+# Nested collections of CompleteInfluencerProfile: argument -> (related name, builder)
+
+def _enum_value(value):
+    """Plain value of an enum argument (graphene passes the enum member)"""
+    return getattr(value, 'value', value)
+
+
+def _parse_taken_at(value):
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return timezone.now()
+
+
+def _truncate_post_name(post_name):
+    # Truncate post_name to 500 characters to avoid database error
+    return post_name[:497] + '...' if len(post_name) > 500 else post_name
+
+
+def _build_reseaux_sociaux(influencer, items):
+    return [
+        ReseauSocial(
+            influencer=influencer,
+            plateforme=_enum_value(rs_data['plateforme']),
+            url_profil=rs_data['url_profil'],
+            nombre_abonnes=rs_data.get('nombre_abonnes') or 0,
+            taux_engagement=rs_data.get('taux_engagement') or 0.0,
+            moyenne_vues=rs_data.get('moyenne_vues') or 0,
+            moyenne_likes=rs_data.get('moyenne_likes') or 0,
+            moyenne_commentaires=rs_data.get('moyenne_commentaires') or 0,
+            frequence_publication=_enum_value(rs_data.get('frequence_publication')) or 'hebdomadaire'
+        )
+        for rs_data in items
+    ]
+
+
+def _build_previous_works(influencer, items):
+    return [
+        InfluencerWork(
+            influencer=influencer,
+            brand_name=collab_data['nom_marque'],
+            campaign=collab_data['campagne'],
+            period=collab_data['periode'],
+            results=collab_data.get('resultats', ''),
+            publication_link=collab_data.get('lien_publication', '')
+        )
+        for collab_data in items
+    ]
+
+
+def _build_images(influencer, items):
+    content_type = ContentType.objects.get_for_model(Influencer)
+    images = [
+        Image(
+            content_type=content_type,
+            object_id=influencer.id,
+            url=image_data['url'],
+            is_default=bool(image_data.get('is_default', False)),
+            is_public=image_data.get('is_public', True)
+        )
+        for image_data in items
+    ]
+    # Image.save() keeps a single default image: the last one marked wins
+    defaults = [image for image in images if image.is_default]
+    for image in defaults[:-1]:
+        image.is_default = False
+    return images
+
+
+def _build_instagram_reels(influencer, items):
+    # One row per Instagram id (the last occurrence wins)
+    reels = {
+        reel_data['id']: InstagramReel(
+            influencer=influencer,
+            instagram_id=reel_data['id'],
+            code=reel_data['code'],
+            video_url=reel_data['video_url'],
+            thumbnail_url=reel_data['thumbnail_url'],
+            post_name=_truncate_post_name(reel_data['post_name']),
+            duration=reel_data['duration'],
+            taken_at=_parse_taken_at(reel_data['taken_at']),
+            likes=reel_data['likes'],
+            comments=reel_data['comments'],
+            views=reel_data['views'],
+            username=reel_data['username'],
+            hashtags=reel_data.get('hashtags') or []
+        )
+        for reel_data in items
+    }
+    return list(reels.values())
+
+
+def _build_instagram_posts(influencer, items):
+    posts = {
+        post_data['id']: InstagramPost(
+            influencer=influencer,
+            instagram_id=post_data['id'],
+            code=post_data['code'],
+            media_type=post_data['media_type'],
+            image_url=post_data['image_url'],
+            thumbnail_url=post_data['thumbnail_url'],
+            post_name=_truncate_post_name(post_data['post_name']),
+            taken_at=_parse_taken_at(post_data['taken_at']),
+            likes=post_data['likes'],
+            comments=post_data['comments'],
+            username=post_data['username'],
+            carousel_media=[
+                {
+                    'id': media['id'],
+                    'image_url': media['image_url'],
+                    'thumbnail_url': media['thumbnail_url'],
+                    'is_video': media['is_video']
+                }
+                for media in post_data.get('carousel_media') or []
+            ],
+            hashtags=post_data.get('hashtags') or []
+        )
+        for post_data in items
+    }
+    return list(posts.values())
+
+
+def _parse_date_creation(value):
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date() if value else timezone.now().date()
+    except ValueError:
+        return timezone.now().date()
+
+
+def _build_portfolio_media(influencer, items):
+    return [
+        PortfolioMedia(
+            influencer=influencer,
+            image_url=media_data['image_url'],
+            titre=media_data['title'],
+            description=media_data.get('description', ''),
+            date_creation=_parse_date_creation(media_data.get('date_creation'))
+        )
+        for media_data in items
+    ]
+
+
+def _build_offres_collaboration(influencer, items):
+    return [
+        OffreCollaboration(
+            influencer=influencer,
+            type_collaboration=_enum_value(offre_data['type_collaboration']),
+            tarif_minimum=offre_data['tarif_minimum'],
+            tarif_maximum=offre_data['tarif_maximum'],
+            conditions=offre_data.get('conditions', '')
+        )
+        for offre_data in items
+    ]
+
+
+NESTED_COLLECTIONS = {
+    'reseaux_sociaux': ('reseaux_sociaux', _build_reseaux_sociaux),
+    'collaborations': ('previous_works', _build_previous_works),
+    'images': ('images', _build_images),
+    'selected_reels': ('instagram_reels', _build_instagram_reels),
+    'selected_posts': ('instagram_posts', _build_instagram_posts),
+    'portfolio_media': ('portfolio_media', _build_portfolio_media),
+    'offres_collaboration': ('offres_collaboration', _build_offres_collaboration),
+}
+
+# Upserted on their Instagram id instead of deleted and re-inserted
+UPSERT_COLLECTIONS = {'instagram_reels', 'instagram_posts'}
+
+
+def _validate(argument, objects):
+    """Run the model field validation of every object (no query: relations and uniqueness excluded)"""
+    for index, obj in enumerate(objects):
+        try:
+            obj.full_clean(exclude=['influencer', 'content_type'], validate_unique=False, validate_constraints=False)
+        except ValidationError as error:
+            details = '; '.join(f'{field}: {" ".join(messages)}' for field, messages in error.message_dict.items())
+            raise GraphQLError(f'Invalid {argument}[{index}]: {details}')
+
+
+def _build_collections(influencer, kwargs):
+    """{related name: validated unsaved objects} for the collections present in the arguments"""
+    collections = {}
+    for argument, (related_name, build) in NESTED_COLLECTIONS.items():
+        if argument in kwargs:
+            objects = build(influencer, kwargs[argument] or [])
+            _validate(argument, objects)
+            collections[related_name] = objects
+    
+    platforms = [network.plateforme for network in collections.get('reseaux_sociaux', [])]
+    if len(platforms) != len(set(platforms)):
+        raise GraphQLError('Each platform can only be listed once in reseauxSociaux')
+    return collections
+
+
+def _upsert_instagram_media(influencer, related_name, objects):
+    """Keep the rows still selected (upsert on instagram_id), delete the others"""
+    model = getattr(influencer, related_name).model
+    instagram_ids = [obj.instagram_id for obj in objects]
+    taken = (
+        model.objects.filter(instagram_id__in=instagram_ids)
+        .exclude(influencer=influencer)
+        .values_list('instagram_id', flat=True)
+        .first()
+    )
+    if taken is not None:
+        raise GraphQLError(f'Instagram media {taken} already belongs to another influencer')
+    getattr(influencer, related_name).exclude(instagram_id__in=instagram_ids).delete()
+    if objects:
+        model.objects.bulk_create(
+            objects,
+            update_conflicts=True,
+            unique_fields=['instagram_id'],
+            update_fields=[
+                field.name for field in model._meta.concrete_fields
+                if field.name not in ('id', 'influencer', 'instagram_id', 'created_at')
+            ],
+        )
+
+
+def _write_collections(influencer, collections):
+    """Replace each collection with one bulk_create (upsert for reels and posts)"""
+    for related_name, objects in collections.items():
+        if related_name in UPSERT_COLLECTIONS:
+            _upsert_instagram_media(influencer, related_name, objects)
+            continue
+        manager = getattr(influencer, related_name)
+        manager.all().delete()
+        if objects:
+            manager.model.objects.bulk_create(objects)
+    if 'reseaux_sociaux' in collections:
+        # bulk_create bypasses the ReseauSocial signals
+        schedule_metrics_refresh(influencer.pk)
+
+
 class CompleteInfluencerProfile(graphene.Mutation):
     """Complete influencer profile with all information"""
     
@@ -159,8 +400,18 @@ class CompleteInfluencerProfile(graphene.Mutation):
         # Images
         images = graphene.List(ImageInput)
     
-    @transaction.atomic
     def mutate(self, info, **kwargs):
+        with track_queries() as stats:
+            result = CompleteInfluencerProfile.complete_profile(info, **kwargs)
+        logger.info(
+            '✓ completeInfluencerProfile (influencer %s): %d queries in %.1f ms',
+            result.influencer.pk, stats.queries, stats.duration_ms
+        )
+        return result
+    
+    @staticmethod
+    @transaction.atomic
+    def complete_profile(info, **kwargs):
         user = info.context.user
         
         if not user.is_authenticated:
@@ -237,157 +488,9 @@ class CompleteInfluencerProfile(graphene.Mutation):
         categories = Category.objects.filter(id__in=decoded_category_ids)
         influencer.selected_categories.set(categories)
         
-        # Handle reseaux sociaux
-        if 'reseaux_sociaux' in kwargs:
-            influencer.reseaux_sociaux.all().delete()
-            for rs_data in kwargs['reseaux_sociaux']:
-                nombre_abonnes = int(rs_data['nombre_abonnes']) if rs_data.get('nombre_abonnes') else 0
-                taux_engagement = float(rs_data['taux_engagement']) if rs_data.get('taux_engagement') else 0.0
-                moyenne_vues = int(rs_data.get('moyenne_vues') or 0) if rs_data.get('moyenne_vues') else 0
-                moyenne_likes = int(rs_data.get('moyenne_likes') or 0) if rs_data.get('moyenne_likes') else 0
-                moyenne_commentaires = int(rs_data.get('moyenne_commentaires') or 0) if rs_data.get('moyenne_commentaires') else 0
-                
-                ReseauSocial.objects.create(
-                    influencer=influencer,
-                    plateforme=rs_data['plateforme'],
-                    url_profil=rs_data['url_profil'],
-                    nombre_abonnes=nombre_abonnes,
-                    taux_engagement=taux_engagement,
-                    moyenne_vues=moyenne_vues,
-                    moyenne_likes=moyenne_likes,
-                    moyenne_commentaires=moyenne_commentaires,
-                    frequence_publication=rs_data.get('frequence_publication', 'hebdomadaire')
-                )
-        
-        # Handle collaborations
-        if 'collaborations' in kwargs:
-            influencer.previous_works.all().delete()
-            for collab_data in kwargs['collaborations']:
-                InfluencerWork.objects.create(
-                    influencer=influencer,
-                    brand_name=collab_data['nom_marque'],
-                    campaign=collab_data['campagne'],
-                    period=collab_data['periode'],
-                    results=collab_data.get('resultats', ''),
-                    publication_link=collab_data.get('lien_publication', '')
-                )
-        
-        # Handle images
-        if 'images' in kwargs:
-            content_type = ContentType.objects.get_for_model(Influencer)
-            influencer.images.all().delete()
-            for image_data in kwargs['images']:
-                Image.objects.create(
-                    content_type=content_type,
-                    object_id=influencer.id,
-                    url=image_data['url'],
-                    is_default=image_data.get('is_default', False),
-                    is_public=image_data.get('is_public', True)
-                )
-        
-        # Handle Instagram reels
-        if 'selected_reels' in kwargs:
-            influencer.instagram_reels.all().delete()
-            for reel_data in kwargs['selected_reels']:
-                try:
-                    taken_at = datetime.fromisoformat(reel_data['taken_at'].replace('Z', '+00:00'))
-                except (ValueError, AttributeError):
-                    taken_at = datetime.now()
-                
-                # Truncate post_name to 500 characters to avoid database error
-                post_name = reel_data['post_name']
-                if len(post_name) > 500:
-                    post_name = post_name[:497] + '...'
-                
-                InstagramReel.objects.create(
-                    influencer=influencer,
-                    instagram_id=reel_data['id'],
-                    code=reel_data['code'],
-                    video_url=reel_data['video_url'],
-                    thumbnail_url=reel_data['thumbnail_url'],
-                    post_name=post_name,
-                    duration=reel_data['duration'],
-                    taken_at=taken_at,
-                    likes=reel_data['likes'],
-                    comments=reel_data['comments'],
-                    views=reel_data['views'],
-                    username=reel_data['username'],
-                    hashtags=reel_data.get('hashtags', [])
-                )
-        
-        # Handle Instagram posts
-        if 'selected_posts' in kwargs:
-            influencer.instagram_posts.all().delete()
-            for post_data in kwargs['selected_posts']:
-                try:
-                    taken_at = datetime.fromisoformat(post_data['taken_at'].replace('Z', '+00:00'))
-                except (ValueError, AttributeError):
-                    taken_at = datetime.now()
-                
-                carousel_media = []
-                if post_data.get('carousel_media'):
-                    carousel_media = [
-                        {
-                            'id': media['id'],
-                            'image_url': media['image_url'],
-                            'thumbnail_url': media['thumbnail_url'],
-                            'is_video': media['is_video']
-                        }
-                        for media in post_data['carousel_media']
-                    ]
-                
-                # Truncate post_name to 500 characters to avoid database error
-                post_name = post_data['post_name']
-                if len(post_name) > 500:
-                    post_name = post_name[:497] + '...'
-                
-                InstagramPost.objects.create(
-                    influencer=influencer,
-                    instagram_id=post_data['id'],
-                    code=post_data['code'],
-                    media_type=post_data['media_type'],
-                    image_url=post_data['image_url'],
-                    thumbnail_url=post_data['thumbnail_url'],
-                    post_name=post_name,
-                    taken_at=taken_at,
-                    likes=post_data['likes'],
-                    comments=post_data['comments'],
-                    username=post_data['username'],
-                    carousel_media=carousel_media,
-                    hashtags=post_data.get('hashtags', [])
-                )
-        
-        # Handle portfolio media
-        if 'portfolio_media' in kwargs:
-            influencer.portfolio_media.all().delete()
-            for media_data in kwargs['portfolio_media']:
-                try:
-                    if media_data.get('date_creation'):
-                        date_creation = datetime.strptime(media_data['date_creation'], '%Y-%m-%d').date()
-                    else:
-                        date_creation = datetime.now().date()
-                except ValueError:
-                    date_creation = datetime.now().date()
-                
-                PortfolioMedia.objects.create(
-                    influencer=influencer,
-                    image_url=media_data['image_url'],
-                    titre=media_data['title'],
-                    description=media_data.get('description', ''),
-                    date_creation=date_creation
-                )
-        
-        # Handle offres collaboration
-        if 'offres_collaboration' in kwargs:
-            influencer.offres_collaboration.all().delete()
-            for offre_data in kwargs['offres_collaboration']:
-                OffreCollaboration.objects.create(
-                    influencer=influencer,
-                    type_collaboration=offre_data['type_collaboration'],
-                    tarif_minimum=float(offre_data['tarif_minimum']),
-                    tarif_maximum=float(offre_data['tarif_maximum']),
-                    conditions=offre_data.get('conditions', '')
-                )
+        # Nested collections: built and validated in memory, then one bulk write each
+        collections = _build_collections(influencer, kwargs)
+        _write_collections(influencer, collections)
         
         # Mark profile as completed
         user.is_completed_profile = True
@@ -2,6 +2,7 @@ import graphene
 from graphene import ObjectType
 from users.company_models import Company, Address
 from users.types.company_node import CompanyNode, AddressNode
+from common.query_optimizer import optimize_queryset
 
 
 class CompanyQueries(ObjectType):
@@ -56,20 +57,20 @@ class CompanyQueries(ObjectType):
     def resolve_company(self, info, id):
         """Get a specific company by ID"""
         try:
-            return Company.objects.select_related('user', 'address').get(id=id)
+            return optimize_queryset(Company.objects.all(), info).get(id=id)
         except Company.DoesNotExist:
             return None
     
     def resolve_company_by_user(self, info, user_id):
         """Get a company profile by user ID"""
         try:
-            return Company.objects.select_related('user', 'address').get(user_id=user_id)
+            return optimize_queryset(Company.objects.all(), info).get(user_id=user_id)
         except Company.DoesNotExist:
             return None
     
     def resolve_companies(self, info, first=10, skip=0, **filters):
         """List companies with optional filters"""
-        queryset = Company.objects.select_related('user', 'address').all()
+        queryset = optimize_queryset(Company.objects.all(), info)
         
         # Apply filters
         if filters.get('domain_activity'):
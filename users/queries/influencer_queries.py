@@ -2,12 +2,32 @@ import graphene
 from graphql import GraphQLError
 from graphql_relay import from_global_id
 from django.contrib.auth import get_user_model
-from graphene_django.filter import DjangoFilterConnectionField
+from common.query_optimizer import OptimizedConnectionField
 
 from ..influencer_models import Influencer
-from ..influencer_node import InfluencerNode
+from ..influencer_node import InfluencerNode, InfluencerSearchConnection
 from ..filters import InfluencerFilter
+from ..search import SEARCH_INDEX_MODELS, get_search_backend, search_index_updated
 from ..utils import check_user_role, normalize_role
+from common.pagination_utils import CachedCount, EstimatedCount, bump_data_version, keyset_connection
+from common.query_optimizer import optimize_queryset
+
+# Page size bounds for searchInfluencers
+SEARCH_PAGE_SIZE = 20
+SEARCH_MAX_PAGE_SIZE = 100
+
+# totalCount of influencer lists (filters also read the metrics row, the user's name and the search index)
+INFLUENCER_COUNT = CachedCount(
+    depends_on=('users.Influencer', 'users.InfluencerMetrics', 'users.User', *SEARCH_INDEX_MODELS)
+)
+
+
+def _invalidate_search_counts(sender, **kwargs):
+    for model in SEARCH_INDEX_MODELS:
+        bump_data_version(model)
+
+
+search_index_updated.connect(_invalidate_search_counts, dispatch_uid='influencer-count-search-index')
 
 User = get_user_model()
 
@@ -28,15 +48,17 @@ class InfluencerQueries(graphene.ObjectType):
     influencer = graphene.relay.Node.Field(InfluencerNode)
     
     # List all influencers with filtering, pagination, and totalCount
-    all_influencers = DjangoFilterConnectionField(
+    all_influencers = OptimizedConnectionField(
         InfluencerNode,
         filterset_class=InfluencerFilter,
+        keyset=True,
+        count_strategy=EstimatedCount(fallback=INFLUENCER_COUNT),
         description="Get all influencers with pagination, filtering, and totalCount in edges"
     )
     
-    # Search influencers
-    search_influencers = graphene.List(
-        InfluencerNode,
+    # Search influencers (keyset pagination: first/after, sorted by relevance then total followers)
+    search_influencers = graphene.relay.ConnectionField(
+        InfluencerSearchConnection,
         query=graphene.String(required=True),
         localisation=graphene.String(),
         min_followers=graphene.Int(),
@@ -91,17 +113,8 @@ class InfluencerQueries(graphene.ObjectType):
             if not check_user_role(user, 'INFLUENCER'):
                 raise GraphQLError('User is not an influencer')
             
-            # Fetch influencer with all related data prefetched
-            return Influencer.objects.prefetch_related(
-                'images',
-                'instagram_posts',
-                'instagram_reels',
-                'reseaux_sociaux',
-                'offres_collaboration',
-                'previous_works',
-                'portfolio_media',
-                'selected_categories'
-            ).select_related('user').get(user=user)
+            # Fetch influencer with the related data requested by the selection set
+            return optimize_queryset(Influencer.objects.all(), info).get(user=user)
         except User.DoesNotExist:
             raise GraphQLError('User not found')
         except Influencer.DoesNotExist:
@@ -109,38 +122,45 @@ class InfluencerQueries(graphene.ObjectType):
     
     def resolve_search_influencers(self, info, query, localisation=None, 
                                   min_followers=None, max_followers=None,
-                                  min_engagement=None, category_ids=None):
-        """Search influencers with advanced filters"""
-        from django.db.models import Q
+                                  min_engagement=None, category_ids=None,
+                                  first=None, after=None, **kwargs):
+        """Search influencers with advanced filters, sorted by relevance then total followers (keyset pagination)"""
+        from django.db.models.functions import Coalesce
         
-        # Search in multiple fields
-        queryset = Influencer.objects.filter(
-            Q(pseudo__icontains=query) |
-            Q(biography__icontains=query) |
-            Q(user__name__icontains=query) |
-            Q(centres_interet__icontains=query)
-        )
+        if kwargs.get('last') is not None or kwargs.get('before') is not None:
+            raise GraphQLError('searchInfluencers only supports forward pagination (first/after)')
+        first = SEARCH_PAGE_SIZE if first is None else max(0, min(first, SEARCH_MAX_PAGE_SIZE))
+        
+        # Full-text search (tsvector on PostgreSQL, FTS5 on SQLite), annotates search_rank
+        queryset = get_search_backend().search(Influencer.objects.all(), query)
         
         # Apply additional filters
         if localisation:
             queryset = queryset.filter(localisation__icontains=localisation)
         
         if category_ids:
-            queryset = queryset.filter(selected_categories__id__in=category_ids).distinct()
+            # Subquery instead of a join + DISTINCT, so the keyset ordering stays simple
+            queryset = queryset.filter(id__in=Influencer.selected_categories.through.objects.filter(
+                category_id__in=category_ids
+            ).values('influencer_id'))
         
-        # Filter by followers and engagement (requires calculation)
-        results = []
-        for influencer in queryset:
-            followers = influencer.followers_totaux
-            engagement = influencer.engagement_moyen_global
-            
-            if min_followers and followers < min_followers:
-                continue
-            if max_followers and followers > max_followers:
-                continue
-            if min_engagement and engagement < min_engagement:
-                continue
-            
-            results.append(influencer)
+        # Followers and engagement from the denormalised InfluencerMetrics row
+        queryset = queryset.annotate(
+            search_followers=Coalesce('metrics__total_followers', 0),
+            search_engagement=Coalesce('metrics__avg_engagement', 0.0)
+        )
+        if min_followers:
+            queryset = queryset.filter(search_followers__gte=min_followers)
+        if max_followers:
+            queryset = queryset.filter(search_followers__lte=max_followers)
+        if min_engagement:
+            queryset = queryset.filter(search_engagement__gte=min_engagement)
         
-        return results
+        return keyset_connection(
+            InfluencerSearchConnection,
+            optimize_queryset(queryset, info),
+            ['-search_rank', '-search_followers', '-id'],
+            first=first,
+            after=after,
+            count_strategy=INFLUENCER_COUNT,
+        )
@@ -1,6 +1,6 @@
 import graphene
 from ..user_node import UserNode
-from graphene_django.filter import DjangoFilterConnectionField
+from common.query_optimizer import OptimizedConnectionField
 from ..filters import UserFilter
 from ..models import User
 
@@ -14,7 +14,7 @@ class UserListQuery(graphene.ObjectType):
     Use ordering parameter with field name (e.g., "name") or prepend with "-" for descending (e.g., "-created_at")
     """
 
-    all_users = DjangoFilterConnectionField(
+    all_users = OptimizedConnectionField(
         UserNode,
         filterset_class=UserFilter
     )
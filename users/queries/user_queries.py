@@ -1,19 +1,21 @@
 import graphene
-from graphene_django.filter import DjangoFilterConnectionField
-from ..user_node import UserNode, UserConnection
+from common.query_optimizer import OptimizedConnectionField
+from ..user_node import UserNode
 from ..models import User
 from ..filters import UserFilter
-from common.pagination_utils import OffsetConnectionField
+from common.pagination_utils import CachedCount
 
 
 class UserQueries(graphene.ObjectType):
     """GraphQL queries for User"""
     user = graphene.relay.Node.Field(UserNode)
     
-    # Use DjangoFilterConnectionField with UserFilter for advanced filtering
-    all_users = DjangoFilterConnectionField(
+    # Use OptimizedConnectionField with UserFilter for advanced filtering
+    all_users = OptimizedConnectionField(
         UserNode,
-        filterset_class=UserFilter
+        filterset_class=UserFilter,
+        keyset=True,
+        count_strategy=CachedCount(depends_on=('users.User',))
     )
     
     me = graphene.Field(UserNode)
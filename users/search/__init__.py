@@ -0,0 +1,21 @@
+from .backends import SEARCH_BACKENDS, get_search_backend, query_terms
+from .documents import (
+    SEARCH_INDEX_MODELS,
+    document_text,
+    rebuild_search_index,
+    refresh_search_documents,
+    remove_search_documents,
+    search_index_updated,
+)
+
+__all__ = [
+    'SEARCH_BACKENDS',
+    'get_search_backend',
+    'query_terms',
+    'SEARCH_INDEX_MODELS',
+    'document_text',
+    'rebuild_search_index',
+    'refresh_search_documents',
+    'remove_search_documents',
+    'search_index_updated',
+]
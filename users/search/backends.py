@@ -0,0 +1,160 @@
+"""
+Full-text search backends for influencer discovery.
+
+Every backend filters an Influencer queryset on a user query and annotates
+`search_rank` (higher is more relevant):
+
+    backend = get_search_backend()
+    queryset = backend.search(Influencer.objects.all(), 'mode voyage')
+
+    - PostgresSearchBackend: tsvector column + GIN index, ts_rank
+    - SQLiteFTSSearchBackend: FTS5 virtual table, bm25
+    - IContainsSearchBackend: previous LIKE '%q%' scan (other databases, rank 0)
+
+Queries are split into words; a profile matches when it contains every word
+as a prefix ('voy' matches 'voyage'). A query without any word ('', '  ',
+'!?') leaves the queryset unfiltered, with a rank of 0, on every backend.
+"""
+
+import re
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import FloatField, Q, Value
+
+from .fields import BM25Rank
+
+SEARCH_CONFIG = 'simple'
+FTS_TABLE = 'influencer_search_fts'
+
+_WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def query_terms(query):
+    """Lower-cased words of a user query (only \\w characters, safe to splice into FTS syntax)"""
+    return _WORD_RE.findall((query or '').lower())
+
+
+class SearchBackend:
+    """Common interface of the search backends"""
+
+    name = None
+
+    def search(self, queryset, query):
+        """Filter `queryset` on `query` and annotate `search_rank`"""
+        raise NotImplementedError
+
+    def unfiltered(self, queryset):
+        """Result of a query without any word: the queryset unchanged, rank 0"""
+        return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+    def index(self, documents):
+        """Store the search text of influencers ({influencer_id: document})"""
+
+    def remove(self, influencer_ids):
+        """Drop deleted influencers from the index"""
+
+
+class IContainsSearchBackend(SearchBackend):
+    """Substring scan on the source fields (no index)"""
+
+    name = 'icontains'
+
+    def search(self, queryset, query):
+        terms = query_terms(query)
+        if not terms:
+            return self.unfiltered(queryset)
+        condition = Q()
+        for term in terms:
+            condition &= (
+                Q(pseudo__icontains=term) |
+                Q(biography__icontains=term) |
+                Q(user__name__icontains=term) |
+                Q(centres_interet__icontains=term)
+            )
+        return queryset.filter(condition).annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+class PostgresSearchBackend(SearchBackend):
+    """tsvector (InfluencerSearchDocument.vector, GIN index) and ts_rank"""
+
+    name = 'postgres'
+
+    def _search_query(self, query):
+        from django.contrib.postgres.search import SearchQuery
+        terms = query_terms(query)
+        if not terms:
+            return None
+        return SearchQuery(' & '.join(f'{term}:*' for term in terms), config=SEARCH_CONFIG, search_type='raw')
+
+    def search(self, queryset, query):
+        from django.contrib.postgres.search import SearchRank
+        from django.db.models import F
+        search_query = self._search_query(query)
+        if search_query is None:
+            return self.unfiltered(queryset)
+        return queryset.filter(search_document__vector=search_query).annotate(
+            search_rank=SearchRank(F('search_document__vector'), search_query)
+        )
+
+    def index(self, documents):
+        from django.contrib.postgres.search import SearchVector
+        from ..influencer_models import InfluencerSearchDocument
+        InfluencerSearchDocument.objects.filter(influencer_id__in=list(documents)).update(
+            vector=SearchVector('document', config=SEARCH_CONFIG)
+        )
+
+
+class SQLiteFTSSearchBackend(SearchBackend):
+    """FTS5 virtual table (rowid = influencer id) ranked by bm25"""
+
+    name = 'sqlite_fts'
+
+    def _match(self, query):
+        terms = query_terms(query)
+        return ' '.join(f'"{term}"*' for term in terms) if terms else None
+
+    def search(self, queryset, query):
+        match = self._match(query)
+        if match is None:
+            return self.unfiltered(queryset)
+        # Join on the FTS table (MATCH drives the plan); bm25() is lower for better matches
+        return queryset.filter(search_fts__document__match=match).annotate(
+            search_rank=BM25Rank('search_fts__document')
+        )
+
+    def index(self, documents):
+        with connection.cursor() as cursor:
+            ids = [(influencer_id,) for influencer_id in documents]
+            cursor.executemany(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', ids)
+            cursor.executemany(
+                f'INSERT INTO {FTS_TABLE} (rowid, document) VALUES (%s, %s)',
+                list(documents.items())
+            )
+
+    def remove(self, influencer_ids):
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f'DELETE FROM {FTS_TABLE} WHERE rowid = %s',
+                [(influencer_id,) for influencer_id in influencer_ids]
+            )
+
+
+SEARCH_BACKENDS = {
+    backend.name: backend
+    for backend in (PostgresSearchBackend, SQLiteFTSSearchBackend, IContainsSearchBackend)
+}
+
+
+def get_search_backend(name=None):
+    """
+    Backend named by the INFLUENCER_SEARCH_BACKEND setting; 'auto' picks the
+    full-text backend matching the database vendor.
+    """
+    name = name or getattr(settings, 'INFLUENCER_SEARCH_BACKEND', 'auto')
+    if name == 'auto':
+        name = {'postgresql': 'postgres', 'sqlite': 'sqlite_fts'}.get(connection.vendor, 'icontains')
+    try:
+        return SEARCH_BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown search backend '{name}'. Available: {sorted(SEARCH_BACKENDS)}")
@@ -0,0 +1,74 @@
+"""
+Build and store the searchable text of influencers.
+"""
+
+from django.dispatch import Signal
+from django.utils import timezone
+
+from .backends import get_search_backend
+
+# Models read by a full-text search: cached search counts depend on them (see INFLUENCER_COUNT)
+SEARCH_INDEX_MODELS = ('users.InfluencerSearchDocument', 'users.InfluencerSearchFTS')
+
+# Sent after the index is written (bulk upserts and raw SQL send no model signals),
+# with `influencer_ids`; caches of search results listen to it
+search_index_updated = Signal()
+
+
+def document_text(pseudo, biography, name, centres_interet):
+    """Text indexed for an influencer (migration 0010 keeps a frozen copy)"""
+    interests = centres_interet if isinstance(centres_interet, list) else [centres_interet or '']
+    parts = [pseudo, biography, name, *[str(interest) for interest in interests]]
+    return ' '.join(str(part) for part in parts if part)
+
+
+def refresh_search_documents(influencer_ids, batch_size=500):
+    """
+    Rebuild the search documents of the given influencers and update the
+    search backend. Ids of deleted influencers are removed from the index.
+    Returns the number of documents written.
+    """
+    from ..influencer_models import Influencer, InfluencerSearchDocument
+
+    backend = get_search_backend()
+    influencer_ids = list(dict.fromkeys(influencer_ids))
+    written = 0
+    for start in range(0, len(influencer_ids), batch_size):
+        batch = influencer_ids[start:start + batch_size]
+        rows = Influencer.objects.filter(id__in=batch).values_list(
+            'id', 'pseudo', 'biography', 'user__name', 'centres_interet'
+        )
+        documents = {
+            influencer_id: document_text(pseudo, biography, name, interests)
+            for influencer_id, pseudo, biography, name, interests in rows
+        }
+        now = timezone.now()
+        InfluencerSearchDocument.objects.bulk_create(
+            [
+                InfluencerSearchDocument(influencer_id=influencer_id, document=document, updated_at=now)
+                for influencer_id, document in documents.items()
+            ],
+            update_conflicts=True,
+            unique_fields=['influencer'],
+            update_fields=['document', 'updated_at'],
+        )
+        backend.index(documents)
+        backend.remove([influencer_id for influencer_id in batch if influencer_id not in documents])
+        written += len(documents)
+    if influencer_ids:
+        search_index_updated.send(sender=type(backend), influencer_ids=influencer_ids)
+    return written
+
+
+def remove_search_documents(influencer_ids):
+    """Drop deleted influencers from the search backend"""
+    backend = get_search_backend()
+    backend.remove(influencer_ids)
+    search_index_updated.send(sender=type(backend), influencer_ids=list(influencer_ids))
+
+
+def rebuild_search_index(batch_size=500):
+    """Rebuild the documents of every influencer"""
+    from ..influencer_models import Influencer
+    ids = Influencer.objects.order_by('id').values_list('id', flat=True)
+    return refresh_search_documents(list(ids), batch_size=batch_size)
@@ -0,0 +1,52 @@
+"""
+Model field for the SQLite FTS5 document column, with a `match` lookup,
+and the bm25 rank of the matched rows:
+
+    Influencer.objects.filter(search_fts__document__match='"voyage"*').annotate(
+        search_rank=BM25Rank('search_fts__document')
+    )
+    # -> ... WHERE "influencer_search_fts"."document" MATCH '"voyage"*'
+"""
+
+from django.db import models
+from django.db.models import F, FloatField, Func, Lookup
+
+
+class FullTextField(models.TextField):
+    """Text column of a full-text virtual table"""
+
+    def deconstruct(self):
+        # Migrations only see a TextField: the lookup is not part of the schema,
+        # and moving or renaming this class must not break historical migrations
+        name, path, args, kwargs = super().deconstruct()
+        return name, 'django.db.models.TextField', args, kwargs
+
+
+@FullTextField.register_lookup
+class Match(Lookup):
+    lookup_name = 'match'
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} MATCH {rhs}', lhs_params + rhs_params
+
+
+class BM25Rank(Func):
+    """
+    -bm25() of the FTS5 table holding the column `expression` (higher is better).
+
+    bm25 takes the table's hidden column, named after the table and qualified
+    with the alias the query gave to the join, not a column of the table.
+    """
+
+    output_field = FloatField()
+
+    def __init__(self, expression, **extra):
+        super().__init__(F(expression) if isinstance(expression, str) else expression, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        column = self.get_source_expressions()[0]
+        table = column.target.model._meta.db_table
+        alias = compiler.quote_name_unless_alias(column.alias)
+        return f'-bm25({alias}.{connection.ops.quote_name(table)})', []
@@ -0,0 +1,94 @@
+"""
+Signals keeping the denormalised influencer tables in sync:
+
+    - InfluencerMetrics with ReseauSocial
+    - InfluencerSearchDocument (and the full-text index) with Influencer / User
+
+Refreshes are deferred to transaction commit and deduplicated: a mutation
+that rewrites all the social networks of an influencer triggers a single
+recomputation, and a cascade delete of the influencer does not re-insert
+its rows.
+
+The ids to refresh are kept in a per-thread pending set, flushed by a
+transaction.on_commit callback. Every write registers the (idempotent)
+flush: the first one to run refreshes and clears the whole set, the others
+find it empty. A callback of a rolled-back block is dropped by Django but
+its ids stay pending until the next commit; refreshing them is harmless,
+since the denormalised rows are recomputed from the committed tables.
+"""
+
+import threading
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .influencer_models import Influencer, InfluencerMetrics, ReseauSocial
+from .search import refresh_search_documents
+
+User = get_user_model()
+
+# {refresh function: influencer ids} waiting for the current thread's commit
+_pending = threading.local()
+
+
+def _flush():
+    refreshes = getattr(_pending, 'refreshes', None)
+    _pending.refreshes = {}
+    for refresh, ids in (refreshes or {}).items():
+        refresh(sorted(ids))
+
+
+def _schedule(refresh, influencer_id):
+    if not transaction.get_connection().in_atomic_block:
+        # Autocommit: the write is already committed
+        refresh([influencer_id])
+        return
+    if not hasattr(_pending, 'refreshes'):
+        _pending.refreshes = {}
+    _pending.refreshes.setdefault(refresh, set()).add(influencer_id)
+    # Registered on every write: the callback of a rolled-back savepoint is dropped
+    transaction.on_commit(_flush, robust=True)
+
+
+def schedule_metrics_refresh(influencer_id):
+    """Recompute the metrics of an influencer once the current transaction commits"""
+    _schedule(InfluencerMetrics.refresh, influencer_id)
+
+
+def schedule_search_refresh(influencer_id):
+    """Rebuild the search document of an influencer once the current transaction commits"""
+    _schedule(refresh_search_documents, influencer_id)
+
+
+@receiver(post_save, sender=Influencer)
+def update_influencer_denormalised_rows(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        schedule_metrics_refresh(instance.pk)
+    schedule_search_refresh(instance.pk)
+
+
+@receiver(post_delete, sender=Influencer)
+def remove_influencer_from_search(sender, instance, **kwargs):
+    # refresh_search_documents removes the ids of deleted influencers (and keeps a rolled-back delete)
+    schedule_search_refresh(instance.pk)
+
+
+@receiver(post_save, sender=User)
+def update_user_search_document(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    # The user name is part of the search document (skip e.g. last_login updates)
+    if raw or created or (update_fields is not None and 'name' not in update_fields):
+        return
+    influencer_id = Influencer.objects.filter(user_id=instance.pk).values_list('id', flat=True).first()
+    if influencer_id is not None:
+        schedule_search_refresh(influencer_id)
+
+
+@receiver(post_save, sender=ReseauSocial)
+@receiver(post_delete, sender=ReseauSocial)
+def update_influencer_metrics(sender, instance, raw=False, **kwargs):
+    if not raw:
+        schedule_metrics_refresh(instance.influencer_id)
@@ -1,3 +1,622 @@
-from django.test import TestCase
+from django.db import connection, transaction
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 
-# Create your tests here.
+from .filters import InfluencerFilter
+from .company_models import Address, Company
+from category.models import Category
+from .influencer_models import Influencer, InfluencerMetrics, InstagramPost, InstagramReel, ReseauSocial
+from .models import User
+from .search import SEARCH_BACKENDS, get_search_backend, refresh_search_documents
+
+
+def create_influencer(index, networks):
+    """Influencer with one ReseauSocial per (followers, engagement) pair (bulk path)"""
+    user = User.objects.create_user(email=f'influencer{index}@example.com', name=f'Influencer {index}')
+    influencer = Influencer.objects.create(user=user, pseudo=f'influencer_{index}')
+    ReseauSocial.objects.bulk_create([
+        ReseauSocial(
+            influencer=influencer,
+            plateforme=plateforme,
+            url_profil=f'https://example.com/{plateforme.lower()}/influencer_{index}',
+            nombre_abonnes=followers,
+            taux_engagement=engagement,
+        )
+        for (followers, engagement), (plateforme, _) in zip(networks, ReseauSocial.PLATEFORME_CHOICES)
+    ])
+    # bulk_create bypasses the ReseauSocial signals; TestCase never commits the on_commit refreshes
+    InfluencerMetrics.refresh([influencer.id])
+    refresh_search_documents([influencer.id])
+    return influencer
+
+
+class InfluencerMetricsTests(TestCase):
+    """InfluencerMetrics follows ReseauSocial saves and deletes"""
+
+    def assertMetrics(self, influencer, followers, engagement, platforms):
+        metrics = InfluencerMetrics.objects.get(influencer=influencer)
+        self.assertEqual(
+            (metrics.total_followers, metrics.avg_engagement, metrics.platform_count),
+            (followers, engagement, platforms)
+        )
+        self.assertEqual(metrics.total_followers, influencer.followers_totaux)
+        self.assertAlmostEqual(metrics.avg_engagement, influencer.engagement_moyen_global)
+
+    def test_signals_keep_metrics_current(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            influencer = create_influencer(0, [])
+        self.assertMetrics(influencer, 0, 0.0, 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            instagram = ReseauSocial.objects.create(
+                influencer=influencer, plateforme='Instagram', url_profil='https://example.com/a',
+                nombre_abonnes=1000, taux_engagement=2.0
+            )
+            ReseauSocial.objects.create(
+                influencer=influencer, plateforme='TikTok', url_profil='https://example.com/b',
+                nombre_abonnes=3000, taux_engagement=4.0
+            )
+        self.assertMetrics(influencer, 4000, 3.0, 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            instagram.nombre_abonnes = 5000
+            instagram.save()
+        self.assertMetrics(influencer, 8000, 3.0, 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            instagram.delete()
+        self.assertMetrics(influencer, 3000, 4.0, 1)
+
+    def test_influencer_delete_removes_metrics(self):
+        influencer = create_influencer(0, [(1000, 2.0), (2000, 3.0)])
+        with self.captureOnCommitCallbacks(execute=True):
+            influencer.user.delete()
+        self.assertFalse(InfluencerMetrics.objects.exists())
+
+
+class InfluencerFilterThresholdTests(TestCase):
+    """min/max followers and engagement filters run as SQL aggregates"""
+
+    def filtered_ids(self, data):
+        filterset = InfluencerFilter(data, queryset=Influencer.objects.all())
+        return set(filterset.qs.values_list('id', flat=True))
+
+    def test_thresholds_match_python_properties(self):
+        influencers = [
+            create_influencer(0, [(1000, 2.0), (4000, 4.0)]),
+            create_influencer(1, [(20000, 1.0)]),
+            create_influencer(2, []),
+        ]
+        cases = [
+            {'min_followers': 5000},
+            {'max_followers': 5000},
+            {'min_engagement': 2.5},
+            {'max_engagement': 1.5},
+            {'min_followers': 0, 'max_engagement': 0},
+        ]
+        for data in cases:
+            expected = {
+                influencer.id for influencer in influencers
+                if influencer.followers_totaux >= data.get('min_followers', float('-inf'))
+                and influencer.followers_totaux <= data.get('max_followers', float('inf'))
+                and influencer.engagement_moyen_global >= data.get('min_engagement', float('-inf'))
+                and influencer.engagement_moyen_global <= data.get('max_engagement', float('inf'))
+            }
+            with self.subTest(data=data):
+                self.assertEqual(self.filtered_ids(data), expected)
+
+    def test_query_count_is_constant(self):
+        data = {'min_followers': 500, 'max_followers': 50000, 'min_engagement': 0.5, 'max_engagement': 10}
+        counts = []
+        for batch in range(2):
+            for index in range(batch * 20, batch * 20 + 5 + batch * 15):
+                create_influencer(index, [(1000 * (index + 1), 1.0 + index % 5)])
+            with CaptureQueriesContext(connection) as queries:
+                self.filtered_ids(data)
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
+        self.assertEqual(counts[0], 1)
+
+
+SEARCH_QUERY = """
+query Search($query: String!, $first: Int, $after: String, $minFollowers: Int) {
+  searchInfluencers(query: $query, first: $first, after: $after, minFollowers: $minFollowers) {
+    totalCount
+    pageInfo { hasNextPage endCursor }
+    edges { node { pseudo } }
+  }
+}
+"""
+
+
+class SearchInfluencersTests(TestCase):
+    """searchInfluencers runs in SQL with keyset pagination"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for index in range(7):
+            create_influencer(index, [(1000 * (index % 4), 1.0)])
+        # Does not match the search text
+        other = create_influencer(99, [(50000, 1.0)])
+        Influencer.objects.filter(pk=other.pk).update(pseudo='other')
+        User.objects.filter(pk=other.user_id).update(name='Someone else')
+        refresh_search_documents([other.id])
+
+    def search(self, **variables):
+        from brandfluence.schema import schema
+        context = RequestFactory().post('/graphql/')
+        result = schema.execute(SEARCH_QUERY, variable_values={'query': 'influencer', **variables}, context_value=context)
+        self.assertIsNone(result.errors)
+        return result.data['searchInfluencers']
+
+    def test_pages_follow_sort_key_without_overlap(self):
+        pages, after = [], None
+        while True:
+            page = self.search(first=3, after=after)
+            self.assertEqual(page['totalCount'], 7)
+            pages.append([edge['node']['pseudo'] for edge in page['edges']])
+            if not page['pageInfo']['hasNextPage']:
+                break
+            after = page['pageInfo']['endCursor']
+
+        expected = list(
+            get_search_backend().search(Influencer.objects.all(), 'influencer')
+            .order_by('-search_rank', '-metrics__total_followers', '-id')
+            .values_list('pseudo', flat=True)
+        )
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual(sum(pages, []), expected)
+
+    def test_numeric_filters_and_query_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            page = self.search(first=10, minFollowers=2000)
+        self.assertEqual(page['totalCount'], 3)
+        # COUNT + page
+        self.assertEqual(len(queries), 2)
+
+    def test_search_index_writes_invalidate_cached_count(self):
+        from .queries.influencer_queries import INFLUENCER_COUNT
+        queryset = get_search_backend().search(Influencer.objects.all(), 'influencer')
+        key = INFLUENCER_COUNT.cache_key(queryset)
+        # Upserts and raw FTS writes send no signals: refresh_search_documents bumps the versions
+        refresh_search_documents([Influencer.objects.get(pseudo='other').id])
+        self.assertNotEqual(INFLUENCER_COUNT.cache_key(queryset), key)
+
+
+class FullTextSearchTests(TestCase):
+    """The search index follows Influencer and User changes"""
+
+    def search(self, query):
+        return list(get_search_backend().search(Influencer.objects.all(), query).values_list('pseudo', flat=True))
+
+    def test_index_follows_signals(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            user = User.objects.create_user(email='ana@example.com', name='Ana Martin')
+            influencer = Influencer.objects.create(
+                user=user, pseudo='ana_travels', biography='Photographe de voyage', centres_interet=['Mode', 'Cuisine']
+            )
+        self.assertEqual(self.search('voyage'), ['ana_travels'])
+        self.assertEqual(self.search('photo cuis'), ['ana_travels'])
+        self.assertEqual(self.search('martin'), ['ana_travels'])
+        self.assertEqual(self.search('sport'), [])
+        filterset = InfluencerFilter({'search': 'voyage'}, queryset=Influencer.objects.all())
+        self.assertEqual([influencer.pseudo for influencer in filterset.qs], ['ana_travels'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user.name = 'Ana Dupont'
+            user.save()
+        self.assertEqual(self.search('martin'), [])
+        self.assertEqual(self.search('dupont'), ['ana_travels'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            influencer.delete()
+        self.assertEqual(self.search('voyage'), [])
+
+    def test_rolled_back_writes_leave_the_denormalised_rows_intact(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            influencer = create_influencer(0, [(1000, 2.0)])
+        influencer_id = influencer.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    influencer.delete()
+                    raise RuntimeError('rollback')
+            except RuntimeError:
+                pass
+            # A later write registers its own flush, which also recomputes the rolled-back ids
+            create_influencer(1, [])
+        self.assertEqual(self.search('influencer_0'), ['influencer_0'])
+        self.assertEqual(self.search('influencer_1'), ['influencer_1'])
+        self.assertEqual(InfluencerMetrics.objects.get(influencer_id=influencer_id).total_followers, 1000)
+
+    def test_ranking_prefers_more_matches(self):
+        create_influencer(0, [])
+        Influencer.objects.filter(pseudo='influencer_0').update(biography='mode mode mode')
+        create_influencer(1, [])
+        Influencer.objects.filter(pseudo='influencer_1').update(biography='mode et voyage')
+        refresh_search_documents(Influencer.objects.values_list('id', flat=True))
+        results = get_search_backend().search(Influencer.objects.all(), 'mode').order_by('-search_rank')
+        self.assertEqual([influencer.pseudo for influencer in results], ['influencer_0', 'influencer_1'])
+
+    def test_rank_uses_the_alias_of_the_fts_join(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            create_influencer(0, [])
+        # The FTS table is joined twice: the search's own join gets an alias
+        queryset = Influencer.objects.filter(user__influencer_profile__search_fts__document__match='"influencer"*')
+        results = get_search_backend().search(queryset, 'influencer_0')
+        self.assertEqual([influencer.pseudo for influencer in results], ['influencer_0'])
+        self.assertGreater(results[0].search_rank, 0)
+
+    def test_query_without_words_leaves_the_queryset_unfiltered(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for index in range(2):
+                create_influencer(index, [])
+        expected = set(Influencer.objects.values_list('pseudo', flat=True))
+        # Answered before any SQL, so the PostgreSQL backend runs here too
+        for name in SEARCH_BACKENDS:
+            for query in ('', '   ', '!?'):
+                with self.subTest(backend=name, query=query):
+                    results = get_search_backend(name).search(Influencer.objects.all(), query)
+                    self.assertEqual({influencer.pseudo for influencer in results}, expected)
+                    self.assertEqual({influencer.search_rank for influencer in results}, {0.0})
+
+
+ALL_INFLUENCERS_QUERY = """
+query AllInfluencers($first: Int) {
+  allInfluencers(first: $first) {
+    edges {
+      node {
+        pseudo
+        user { email }
+        selectedCategories { name }
+        reseauxSociaux { plateforme }
+        previousWorks { brandName }
+        images { url }
+        instagramReels { code }
+        instagramPosts { code }
+        portfolioMedia { titre }
+        offresCollaboration { conditions }
+        statistiquesGlobales { followersTotaux engagementMoyenGlobal }
+      }
+    }
+  }
+}
+"""
+
+
+class InfluencerDataLoaderTests(TestCase):
+    """Nested relations of a page of influencers are batched per relation"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for index in range(6):
+            create_influencer(index, [(1000, 1.0), (2000, 2.0)])
+
+    def count_queries(self, first):
+        from brandfluence.schema import schema
+        context = RequestFactory().post('/graphql/')
+        with CaptureQueriesContext(connection) as queries:
+            result = schema.execute(ALL_INFLUENCERS_QUERY, variable_values={'first': first}, context_value=context)
+        self.assertIsNone(result.errors)
+        self.assertEqual(len(result.data['allInfluencers']['edges']), first)
+        return len(queries)
+
+    def test_query_count_does_not_depend_on_page_size(self):
+        self.assertEqual(self.count_queries(2), self.count_queries(6))
+
+
+INFLUENCER_PAGE_QUERY = """
+query InfluencerPage($first: Int, $after: String, $ordering: String) {
+  allInfluencers(first: $first, after: $after, ordering: $ordering) {
+    pageInfo { hasNextPage endCursor }
+    edges { node { pseudo } }
+  }
+}
+"""
+
+
+@override_settings(GRAPHQL_KEYSET_PAGINATION=True)
+class InfluencerKeysetPaginationTests(TestCase):
+    """allInfluencers pages with keyset cursors on the annotated metrics"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for index, followers in enumerate([500, 3000, 500, 1200, 3000, 800, 500]):
+            create_influencer(index, [(followers, 1.0)])
+        # No metrics row: total_followers is NULL through the outer join
+        InfluencerMetrics.objects.filter(influencer__pseudo='influencer_3').delete()
+
+    def walk(self, ordering):
+        from brandfluence.schema import schema
+        pseudos, after = [], None
+        while True:
+            result = schema.execute(
+                INFLUENCER_PAGE_QUERY,
+                variable_values={'first': 2, 'after': after, 'ordering': ordering},
+                context_value=RequestFactory().post('/graphql/'),
+            )
+            self.assertIsNone(result.errors)
+            page = result.data['allInfluencers']
+            pseudos += [edge['node']['pseudo'] for edge in page['edges']]
+            if not page['pageInfo']['hasNextPage']:
+                return pseudos
+            after = page['pageInfo']['endCursor']
+
+    def test_walk_follows_the_ordering(self):
+        influencers = Influencer.objects.order_by('pk')
+        by_pseudo = {influencer.pseudo: influencer.pk for influencer in influencers}
+        followers = {'influencer_0': 500, 'influencer_1': 3000, 'influencer_2': 500, 'influencer_4': 3000,
+                     'influencer_5': 800, 'influencer_6': 500}
+        descending = sorted(followers, key=lambda pseudo: (-followers[pseudo], -by_pseudo[pseudo])) + ['influencer_3']
+        self.assertEqual(self.walk('-followers_totaux'), descending)
+        ascending = sorted(followers, key=lambda pseudo: (followers[pseudo], by_pseudo[pseudo])) + ['influencer_3']
+        self.assertEqual(self.walk('followers_totaux'), ascending)
+
+
+ALL_USERS_QUERY = """
+query AllUsers($first: Int) {
+  allUsers(first: $first) {
+    edges {
+      node {
+        email
+        role
+        influencerProfile { pseudo selectedCategories { name } }
+      }
+    }
+  }
+}
+"""
+
+COMPANIES_QUERY = """
+query Companies($first: Int) {
+  companies(first: $first) {
+    companyName
+    user { email }
+    address { city }
+  }
+}
+"""
+
+
+@override_settings(GRAPHQL_KEYSET_PAGINATION=True)
+class QueryOptimizerTests(TestCase):
+    """Querysets follow the GraphQL selection set (common/query_optimizer.py)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(email='admin@example.com', name='Admin', is_staff=True)
+        for index in range(4):
+            user = User.objects.create_user(email=f'company{index}@example.com', name=f'Company {index}', role='COMPANY')
+            address = Address.objects.create(address=f'{index} rue de la Paix', city='Tunis', country='Tunisia')
+            Company.objects.create(user=user, company_name=f'Company {index}', address=address)
+        for index in range(6):
+            influencer = create_influencer(index, [(1000, 1.0)])
+            User.objects.filter(pk=influencer.user_id).update(role='INFLUENCER')
+
+    def execute(self, query, **variables):
+        from brandfluence.schema import schema
+        context = RequestFactory().post('/graphql/')
+        context.user = self.admin
+        with CaptureQueriesContext(connection) as queries:
+            result = schema.execute(query, variable_values=variables, context_value=context)
+        self.assertIsNone(result.errors)
+        return result.data, queries
+
+    def test_nested_profiles_are_batched(self):
+        for first in (2, 6):
+            data, queries = self.execute(ALL_USERS_QUERY, first=first)
+            self.assertEqual(len(data['allUsers']['edges']), first)
+            # Users (newest first: the influencers) + influencer profiles + categories, no COUNT
+            self.assertEqual(len(queries), 3)
+
+    def test_only_selected_columns_are_loaded(self):
+        _, queries = self.execute('{ allUsers(first: 3) { edges { node { email } } } }')
+        page_sql = queries[0]['sql']
+        self.assertIn('"email"', page_sql)
+        self.assertNotIn('"phone_number"', page_sql)
+        self.assertNotIn('"password"', page_sql)
+
+    def test_companies_join_selected_relations(self):
+        data, queries = self.execute(COMPANIES_QUERY, first=10)
+        self.assertEqual(len(data['companies']), 4)
+        self.assertEqual(data['companies'][0]['address'], {'city': 'Tunis'})
+        self.assertEqual(len(queries), 1)
+
+
+COMPLETE_PROFILE_MUTATION = """
+mutation Complete(
+  $categories: [ID]!, $networks: [ReseauSocialInput]!, $reels: [InstagramReelInput], $posts: [InstagramPostInput],
+  $works: [InfluencerWorkInput], $images: [ImageInput], $portfolio: [PortfolioMediaInput], $offres: [OffreCollaborationInput]
+) {
+  completeInfluencerProfile(
+    instagramUsername: "creator", pseudo: "creator", biography: "Bio", localisation: "Tunis",
+    selectedCategories: $categories, langues: ["fr"], typeContenu: ["reels"],
+    reseauxSociaux: $networks, selectedReels: $reels, selectedPosts: $posts, collaborations: $works,
+    images: $images, portfolioMedia: $portfolio, offresCollaboration: $offres
+  ) { success }
+}
+"""
+
+
+def instagram_media(kind, count, start=0):
+    media = []
+    for index in range(start, start + count):
+        item = {
+            'id': f'{kind}-{index}', 'code': f'C{index}', 'thumbnailUrl': f'https://cdn.example.com/{kind}/{index}.jpg',
+            'postName': f'{kind} {index}', 'takenAt': '2025-01-01T10:00:00Z', 'likes': index, 'comments': 1,
+            'username': 'creator', 'hashtags': ['mode'],
+        }
+        if kind == 'reel':
+            item.update(videoUrl=f'https://cdn.example.com/reel/{index}.mp4', duration=30, views=100)
+        else:
+            item.update(mediaType='image', imageUrl=f'https://cdn.example.com/post/{index}.jpg')
+        media.append(item)
+    return media
+
+
+class CompleteInfluencerProfileTests(TestCase):
+    """completeInfluencerProfile writes each nested collection with one bulk query"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='creator@example.com', name='Creator', role='INFLUENCER')
+        cls.categories = [Category.objects.create(name=f'Category {index}') for index in range(2)]
+
+    def complete(self, reels=30, posts=30, start=0, **overrides):
+        from brandfluence.schema import schema
+        variables = {
+            'categories': [str(category.pk) for category in self.categories],
+            'networks': [
+                {'plateforme': 'INSTAGRAM', 'urlProfil': 'https://instagram.com/creator', 'nombreAbonnes': '12000', 'tauxEngagement': '3.5'},
+                {'plateforme': 'TIKTOK', 'urlProfil': 'https://tiktok.com/@creator', 'nombreAbonnes': '8000', 'tauxEngagement': '5'},
+            ],
+            'reels': instagram_media('reel', reels, start),
+            'posts': instagram_media('post', posts, start),
+            'works': [{'nomMarque': 'Brand', 'campagne': 'Launch', 'periode': '2024'}],
+            'images': [{'url': 'https://cdn.example.com/a.jpg', 'isDefault': True}, {'url': 'https://cdn.example.com/b.jpg', 'isDefault': True}],
+            'portfolio': [{'imageUrl': 'https://cdn.example.com/p.jpg', 'title': 'Shooting', 'dateCreation': '2024-05-01'}],
+            'offres': [{'typeCollaboration': 'REEL', 'tarifMinimum': '100', 'tarifMaximum': '300'}],
+            **overrides,
+        }
+        context = RequestFactory().post('/graphql/')
+        context.user = self.user
+        with CaptureQueriesContext(connection) as queries:
+            result = schema.execute(COMPLETE_PROFILE_MUTATION, variable_values=variables, context_value=context)
+        return result, queries
+
+    def test_collections_are_bulk_written(self):
+        with self.assertLogs('users.mutations.influencer_mutations_all', 'INFO') as logs:
+            result, queries = self.complete()
+        self.assertIsNone(result.errors)
+        self.assertIn('queries in', logs.output[0])
+
+        influencer = Influencer.objects.get(user=self.user)
+        self.assertEqual(influencer.instagram_reels.count(), 30)
+        self.assertEqual(influencer.instagram_posts.count(), 30)
+        self.assertEqual(
+            sorted(influencer.reseaux_sociaux.values_list('plateforme', 'nombre_abonnes')),
+            [('Instagram', 12000), ('TikTok', 8000)]
+        )
+        self.assertEqual(list(influencer.images.values_list('url', 'is_default')), [
+            ('https://cdn.example.com/b.jpg', True), ('https://cdn.example.com/a.jpg', False),
+        ])
+        self.assertEqual(influencer.offres_collaboration.get().type_collaboration, 'reel')
+
+        # One INSERT per collection, whatever the number of reels and posts
+        inserts = [query['sql'] for query in queries if query['sql'].startswith('INSERT INTO "instagram_')]
+        self.assertEqual(len(inserts), 2)
+        self.assertLess(len(queries), 35)
+
+    def test_reels_and_posts_are_upserted_on_instagram_id(self):
+        self.complete(reels=5, posts=0)
+        kept = dict(InstagramReel.objects.values_list('instagram_id', 'pk'))
+        result, _ = self.complete(reels=5, posts=0, start=3)
+        self.assertIsNone(result.errors)
+        reels = dict(InstagramReel.objects.values_list('instagram_id', 'pk'))
+        self.assertEqual(sorted(reels), [f'reel-{index}' for index in range(3, 8)])
+        self.assertEqual(reels['reel-3'], kept['reel-3'])
+
+    def test_invalid_nested_object_writes_nothing(self):
+        networks = [{'plateforme': 'INSTAGRAM', 'urlProfil': 'not a url', 'nombreAbonnes': '12', 'tauxEngagement': '1'}]
+        result, _ = self.complete(networks=networks)
+        self.assertIn('reseaux_sociaux[0]', result.errors[0].message)
+        self.assertFalse(Influencer.objects.exists())
+        self.assertFalse(InstagramReel.objects.exists())
+
+    def test_media_of_another_influencer_is_rejected(self):
+        other = Influencer.objects.create(user=User.objects.create_user(email='other@example.com', name='Other'))
+        InstagramPost.objects.create(
+            influencer=other, instagram_id='post-0', code='C0', media_type='image', image_url='https://cdn.example.com/x.jpg',
+            thumbnail_url='https://cdn.example.com/x.jpg', post_name='Post', taken_at='2025-01-01T10:00:00Z', username='other'
+        )
+        result, _ = self.complete(reels=0, posts=2)
+        self.assertIn('post-0', result.errors[0].message)
+        self.assertEqual(InstagramPost.objects.get(instagram_id='post-0').influencer, other)
+
+
+class ImportInfluencersTests(TestCase):
+    """import_influencers streams the file and bulk-writes each chunk"""
+
+    def account(self, index, **profile):
+        return {
+            'email': f'imported{index}@example.com',
+            'password': 'Secret123!',
+            'name': f'Imported {index}',
+            'influencer_profile': {
+                'pseudo': f'imported_{index}',
+                'selected_categories': ['Mode', 'Voyage'],
+                'reseaux_sociaux': [
+                    {'plateforme': 'Instagram', 'url_profil': f'https://instagram.com/i{index}', 'nombre_abonnes': 1000},
+                ],
+                'offres_collaboration': [
+                    {'type_collaboration': 'post', 'tarif_minimum': 10.5, 'tarif_maximum': 20},
+                ],
+                **profile,
+            },
+        }
+
+    def run_import(self, accounts, *args):
+        import json
+        import tempfile
+        from io import StringIO
+        from django.core.management import call_command
+        with tempfile.NamedTemporaryFile('w', suffix='.json', encoding='utf-8') as f:
+            json.dump(accounts, f)
+            f.flush()
+            out = StringIO()
+            call_command('import_influencers', '--file', f.name, *args, stdout=out)
+        return out.getvalue()
+
+    def test_streaming_reader_matches_json_load(self):
+        import io
+        import json
+        from .bulk_import import iter_json_array
+        accounts = [self.account(index) for index in range(3)] + [12345, 'text', [], {}]
+        text = json.dumps(accounts, indent=2)
+        self.assertEqual(list(iter_json_array(io.StringIO(text), buffer_size=7)), accounts)
+        self.assertEqual(list(iter_json_array(io.StringIO(' [ ] '))), [])
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_json_array(io.StringIO('[{"a": 1} {"b": 2}]'), buffer_size=4))
+
+    def test_import_creates_accounts_in_bulk(self):
+        Category.objects.create(name='Mode')
+        with CaptureQueriesContext(connection) as queries:
+            output = self.run_import([self.account(index) for index in range(20)], '--chunk-size', '10')
+        self.assertIn('Created: 20 influencer(s)', output)
+        self.assertIn('rows/s', output)
+        # Bounded per chunk, not per influencer
+        self.assertLess(len(queries), 60)
+        self.assertEqual(Category.objects.filter(name__in=['Mode', 'Voyage']).count(), 2)
+        influencer = Influencer.objects.get(user__email='imported3@example.com')
+        self.assertTrue(influencer.user.check_password('Secret123!'))
+        self.assertEqual(sorted(influencer.selected_categories.values_list('name', flat=True)), ['Mode', 'Voyage'])
+        self.assertEqual(InfluencerMetrics.objects.get(influencer=influencer).total_followers, 1000)
+        self.assertEqual(list(get_search_backend().search(Influencer.objects.all(), 'imported_3')), [influencer])
+
+    def test_failing_rows_do_not_abort_the_chunk(self):
+        duplicate_network = {'plateforme': 'Instagram', 'url_profil': 'https://instagram.com/dup'}
+        accounts = [
+            self.account(0),
+            self.account(1, reseaux_sociaux=[duplicate_network, duplicate_network]),
+            {'name': 'No email'},
+            self.account(2),
+        ]
+        output = self.run_import(accounts)
+        self.assertIn('Created: 2 influencer(s)', output)
+        self.assertIn('Errors: 2', output)
+        self.assertEqual(
+            sorted(User.objects.values_list('email', flat=True)),
+            ['imported0@example.com', 'imported2@example.com'],
+        )
+
+    def test_update_replaces_profile_and_collections(self):
+        self.run_import([self.account(0)])
+        output = self.run_import([self.account(0)])
+        self.assertIn('Errors: 1', output)
+        output = self.run_import([self.account(0, pseudo='renamed', reseaux_sociaux=[])], '--update')
+        self.assertIn('Updated: 1 influencer(s)', output)
+        influencer = Influencer.objects.get()
+        self.assertEqual(influencer.pseudo, 'renamed')
+        self.assertFalse(influencer.reseaux_sociaux.exists())
+        self.assertEqual(influencer.offres_collaboration.count(), 1)
+        self.assertEqual(InfluencerMetrics.objects.get(influencer=influencer).total_followers, 0)
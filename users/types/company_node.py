@@ -2,6 +2,7 @@ import graphene
 from graphene_django import DjangoObjectType
 from users.company_models import Company, Address
 from users.influencer_models import Image
+from common.query_optimizer import OptimizedNodeMixin, resolver_hints
 
 
 class AddressNode(DjangoObjectType):
@@ -35,7 +36,7 @@ class CompanyImageNode(DjangoObjectType):
         )
 
 
-class CompanyNode(DjangoObjectType):
+class CompanyNode(OptimizedNodeMixin, DjangoObjectType):
     """GraphQL type for Company"""
     
     images = graphene.List(CompanyImageNode)
@@ -62,10 +63,12 @@ class CompanyNode(DjangoObjectType):
             'updated_at',
         )
     
+    @resolver_hints(prefetch_related='images')
     def resolve_images(self, info):
         """Resolve images for the company"""
         return self.images.all()
     
+    @resolver_hints(model_field='address')
     def resolve_address(self, info):
         """Resolve address for the company"""
         return self.address
@@ -1,7 +1,9 @@
 import graphene
 from graphene_django import DjangoObjectType
 from .models import User, UserRole
+from common.dataloaders import get_dataloaders
 from common.pagination_utils import PaginatedConnection
+from common.query_optimizer import OptimizedNodeMixin, resolver_hints
 
 
 class UserRoleEnum(graphene.Enum):
@@ -18,7 +20,7 @@ class UserConnection(PaginatedConnection):
         abstract = True
 
 
-class UserNode(DjangoObjectType):
+class UserNode(OptimizedNodeMixin, DjangoObjectType):
     """GraphQL Node for User model"""
     role = graphene.Field(UserRoleEnum)
     influencer_profile = graphene.Field('users.influencer_node.InfluencerNode')
@@ -45,6 +47,7 @@ class UserNode(DjangoObjectType):
         interfaces = (graphene.relay.Node,)
         connection_class = UserConnection
     
+    @resolver_hints(model_field='role')
     def resolve_role(self, info):
         """Convert Django role to GraphQL enum"""
         if self.role:
@@ -55,12 +58,13 @@ class UserNode(DjangoObjectType):
             return self.role
         return None
     
+    @resolver_hints(prefetch_related='influencer_profile', only=('role',))
     def resolve_influencer_profile(self, info):
         """Get influencer profile if user is an influencer"""
         from .utils import check_user_role
         if check_user_role(self, 'INFLUENCER'):
             try:
-                return self.influencer_profile
+                return get_dataloaders(info).load(self, 'influencer_profile')
             except:
                 return None
         return None
@@ -52,7 +52,6 @@ def main():
     print(f"\n🔍 Checking for required files:")
     required_files = [
         'influenceurs_recommendation_ready.csv',
-        'influenceurs_clean.csv',
     ]
     
     found_required = False